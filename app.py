@@ -3,28 +3,80 @@ Movie Mood Recommender App
 Main Flask application with refactored modular structure
 """
 
-from flask import Flask, render_template, request
-from services.movie_service import MovieService
+import json
+from flask import (Flask, Response, make_response, redirect, render_template, request, jsonify, send_file,
+                   stream_with_context, url_for)
+from services.movie_service import MovieService, AsyncMovieService
+from services.io_loop import run_on_io_loop, iterate_sync
+from services.http_session import close_async_client
+from services.base_service import cancel_pending_fetches
+from services.deadline import Deadline
+from services.metrics import registry, time_stage
+from services.page_cache import page_cache
+from services.cache_warmer import page_traffic, start_cache_warmer
+from services.poster_cache import poster_cache, make_poster_id, variant_url
+from commands import register_commands
+from logging_setup import configure_logging
+from profiling import profiling_requested, RequestProfiler
 from config import Config
 
 
 def create_app():
     """Create and configure Flask application"""
+    configure_logging()
     app = Flask(__name__)
     app.config['SECRET_KEY'] = Config.SECRET_KEY
     app.config['DEBUG'] = Config.DEBUG
     
-    # Initialize services
+    # Initialize services; the page route is async, batch and CLI stay synchronous
     movie_service = MovieService()
+    async_movie_service = AsyncMovieService()
+    
+    if Config.CACHE_WARMER_ENABLED:
+        # A separate service instance, so only the warmer's upstream calls are rate limited
+        start_cache_warmer(AsyncMovieService())
     
     @app.route("/", methods=["GET", "POST"])
-    def home():
+    async def home():
         """Main route for movie search"""
+        if not profiling_requested(request):
+            return await render_home(run_on_io_loop)
+        
+        async def run_here(coro):
+            return await coro
+        
+        # The profiled request runs on the view's own event loop, so the profile
+        # holds its work only and not that of other requests on the I/O loop
+        try:
+            with RequestProfiler("home") as profiler:
+                # Skip the page cache so the profile shows the real work
+                response = await render_home(run_here, use_page_cache=False)
+        finally:
+            # Fetches past the budget are still running on this loop; stop them before their client goes
+            await cancel_pending_fetches()
+            await close_async_client()
+        profiler.annotate(response)
+        return response
+    
+    async def render_home(run, use_page_cache: bool = True):
+        """
+        Search and render the main page
+        
+        Args:
+            run (callable): Awaits a service coroutine on the event loop that should run it
+            use_page_cache (bool): Serve and store complete result pages in the page cache
+        
+        Returns:
+            flask.Response: Rendered page
+        """
+        # Every upstream call gets only what is left of the page's budget
+        deadline = Deadline(Config.REQUEST_BUDGET_MS / 1000) if Config.REQUEST_BUDGET_MS > 0 else None
         movies = None
         error = None
         current_page = 1
         total_pages = 1
         search_params = {}
+        page_key = None
         
         # Handle pagination for GET requests
         if request.method == "GET" and request.args.get("page"):
@@ -45,10 +97,14 @@ def create_app():
                 if not movie_name:
                     error = "Please enter a movie name."
                 else:
-                    if not movie_service.omdb_service.is_available():
+                    if not async_movie_service.omdb_service.is_available():
                         error = "OMDB_API_KEY is missing. Please configure your .env."
                     else:
-                        movies = movie_service.search_by_name(movie_name)
+                        page_key = page_cache.make_key("name", movie_name)
+                        cached = page_cache.get(page_key) if use_page_cache else None
+                        if cached is not None:
+                            return cached_page_response(cached)
+                        movies = await run(async_movie_service.search_by_name(movie_name, deadline))
                         search_params = {"choice": "name", "movie_name": movie_name}
             
             elif choice == "mood":
@@ -56,21 +112,197 @@ def create_app():
                 if not description:
                     error = "Please describe your mood."
                 else:
-                    search_params = {"choice": "mood", "description": description}
-                    
                     # Check if any service is available
-                    services = movie_service.get_available_services()
+                    services = async_movie_service.get_available_services()
                     if not services["omdb"] and not services["tmdb"]:
                         error = "TMDB_API_KEY or OMDB_API_KEY is missing. Please configure your .env."
                     else:
-                        movies, total_pages = movie_service.search_by_mood(description, current_page)
-        
-        return render_template("index.html", 
-                             movies=movies, 
-                             error=error, 
-                             current_page=current_page,
-                             total_pages=total_pages,
-                             search_params=search_params)
+                        mood = await run(async_movie_service.detect_mood(description))
+                        page_traffic.record(mood, current_page)
+                        # Pagination links carry the mood word, so every description of a mood shares pages
+                        search_params = {"choice": "mood", "description": mood}
+                        page_key = page_cache.make_key("mood", mood, current_page)
+                        cached = page_cache.get(page_key) if use_page_cache else None
+                        if cached is not None:
+                            return cached_page_response(cached)
+                        movies, total_pages = await run(
+                            async_movie_service.search_by_mood(description, current_page, deadline, mood))
+        
+        partial = any(movie.get("missing") for movie in movies or [])
+        for movie in movies or []:
+            add_poster_sources(movie)
+        with time_stage("render"):
+            html = render_template("index.html", 
+                                 movies=movies, 
+                                 error=error, 
+                                 current_page=current_page,
+                                 total_pages=total_pages,
+                                 search_params=search_params,
+                                 partial=partial,
+                                 stream_url=url_for("stream_results") if Config.STREAM_RESULTS else None,
+                                 trailer_url=url_for("trailer") if Config.LAZY_TRAILERS else None)
+        
+        # Only complete pages are cached; empty pages and cards missing fields may just be an upstream hiccup
+        if use_page_cache and page_key and movies and not partial:
+            return cached_page_response(page_cache.set(page_key, html))
+        return make_response(html)
+    
+    def add_poster_sources(movie: dict) -> dict:
+        """
+        Point a movie card at the poster proxy
+        
+        Args:
+            movie (dict): Movie data with a TMDb or OMDb Poster URL
+        
+        Returns:
+            dict: The movie, with poster_src and poster_srcset when the poster can be proxied
+        """
+        poster_id = make_poster_id(movie.get("Poster")) if Config.POSTER_PROXY_ENABLED else None
+        if poster_id:
+            movie["poster_src"] = url_for("poster", poster_id=poster_id, w=poster_cache.pick_width(342))
+            movie["poster_srcset"] = ", ".join(f"{url_for('poster', poster_id=poster_id, w=width)} {width}w"
+                                               for width in poster_cache.widths)
+        return movie
+    
+    def cached_page_response(entry: dict):
+        """
+        Build a response for a page cache entry
+        
+        Conditional GETs whose ETag or Last-Modified still match get a 304.
+        
+        Args:
+            entry (dict): Entry from the page cache
+        
+        Returns:
+            flask.Response: Page or 304 response
+        """
+        response = make_response(entry["html"])
+        response.set_etag(entry["etag"])
+        response.last_modified = entry["last_modified"]
+        response.cache_control.public = True
+        response.cache_control.max_age = Config.PAGE_CACHE_MAX_AGE
+        return response.make_conditional(request)
+    
+    @app.route("/api/stream")
+    def stream_results():
+        """Streaming route: NDJSON events for movie cards as they become ready"""
+        choice = request.args.get("choice")
+        error = None
+        events = None
+        
+        if choice == "name":
+            movie_name = request.args.get("movie_name", "").strip()
+            if not movie_name:
+                error = "Please enter a movie name."
+            elif not async_movie_service.omdb_service.is_available():
+                error = "OMDB_API_KEY is missing. Please configure your .env."
+            else:
+                events = async_movie_service.stream_by_name(movie_name)
+        
+        elif choice == "mood":
+            description = request.args.get("description", "").strip()
+            services = async_movie_service.get_available_services()
+            try:
+                page = max(1, min(int(request.args.get("page", 1)), Config.MAX_PAGES))
+            except ValueError:
+                page = 1
+            if not description:
+                error = "Please describe your mood."
+            elif not services["omdb"] and not services["tmdb"]:
+                error = "TMDB_API_KEY or OMDB_API_KEY is missing. Please configure your .env."
+            else:
+                events = async_movie_service.stream_by_mood(description, page)
+        
+        else:
+            error = "Unknown search type."
+        
+        if error:
+            return Response(json.dumps({"type": "error", "message": error}) + "\n",
+                            status=400, mimetype="application/x-ndjson")
+        
+        def generate():
+            for event in iterate_sync(events):
+                if "movie" in event:
+                    add_poster_sources(event["movie"])
+                yield json.dumps(event) + "\n"
+        
+        # Disable proxy buffering so each line reaches the browser immediately
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson",
+                        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    
+    @app.route("/trailer")
+    async def trailer():
+        """Lazy trailer route: resolve one movie's trailer when the user asks for it"""
+        tmdb_id = request.args.get("tmdb_id", "").strip()
+        imdb_id = request.args.get("imdbID", "").strip()
+        title = request.args.get("title", "").strip()
+        year = request.args.get("year", "").strip()
+        
+        if not (tmdb_id or imdb_id or title):
+            return jsonify({"error": "Pass tmdb_id, imdbID or title."}), 400
+        
+        trailer_url, failed = await run_on_io_loop(
+            async_movie_service.resolve_trailer(tmdb_id, imdb_id, title, year))
+        response = jsonify({"trailer": trailer_url})
+        if failed:
+            # "No trailer" here only means an upstream failed; the next click should ask again
+            response.headers["Cache-Control"] = "no-store"
+        else:
+            # Trailers rarely change, so browsers and proxies may reuse the answer
+            response.headers["Cache-Control"] = f"public, max-age={Config.TRAILER_CACHE_MAX_AGE}"
+        return response
+    
+    @app.route("/poster/<poster_id>")
+    def poster(poster_id):
+        """Poster proxy: one card-sized poster variant from the disk cache"""
+        try:
+            width = poster_cache.pick_width(int(request.args.get("w", 342)))
+        except ValueError:
+            width = poster_cache.pick_width(342)
+        
+        cdn_url = variant_url(poster_id, width)
+        if cdn_url is None:
+            return Response("Unknown poster", status=404, mimetype="text/plain")
+        
+        path = poster_cache.get(poster_id, width)
+        if path is None:
+            # Let the browser try the CDN itself rather than show a broken image
+            return redirect(cdn_url)
+        
+        # A poster ID and width always name the same image
+        response = send_file(path, max_age=Config.POSTER_MAX_AGE, conditional=True)
+        response.cache_control.immutable = True
+        return response
+    
+    @app.route("/api/recommendations/batch", methods=["POST"])
+    def recommendations_batch():
+        """Batch route: recommend movies for many mood descriptions"""
+        payload = request.get_json(silent=True) or {}
+        descriptions = payload.get("descriptions")
+        
+        if not isinstance(descriptions, list) or not all(isinstance(item, str) for item in descriptions):
+            return jsonify({"error": "'descriptions' must be a list of strings."}), 400
+        if len(descriptions) > Config.MAX_BATCH_SIZE:
+            return jsonify({"error": f"At most {Config.MAX_BATCH_SIZE} descriptions per batch."}), 400
+        
+        try:
+            page = max(1, min(int(payload.get("page", 1)), Config.MAX_PAGES))
+        except (TypeError, ValueError):
+            return jsonify({"error": "'page' must be a number."}), 400
+        
+        services = movie_service.get_available_services()
+        if not services["omdb"] and not services["tmdb"]:
+            return jsonify({"error": "TMDB_API_KEY or OMDB_API_KEY is missing. Please configure your .env."}), 503
+        
+        results = movie_service.search_by_mood_batch(descriptions, page)
+        return jsonify({"page": page, "results": results})
+    
+    @app.route("/metrics")
+    def metrics():
+        """Metrics route: upstream, stage and cache statistics in Prometheus text format"""
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4")
+    
+    register_commands(app, movie_service)
     
     return app
 
@@ -0,0 +1,4 @@
+"""
+Benchmarks package
+Offline performance checks for the Movie Mood App
+"""
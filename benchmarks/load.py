@@ -0,0 +1,272 @@
+"""
+End-to-End Load Benchmark
+Drives the Flask app against local stub upstreams and reports latency percentiles
+
+Run from the project root:
+    python -m benchmarks.load --requests 200 --concurrency 10
+    python -m benchmarks.load --latency-ms 80 --youtube-latency-ms 400 --error-rate 0.02
+    python -m benchmarks.load --compare benchmarks/results/baseline.json
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import requests
+from .stub_upstreams import StubProfile, start_stubs, stub_environment
+
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+MOVIE_NAMES = ["matrix", "inception", "alien", "heat", "up", "jaws", "fargo", "rocky", "psycho", "vertigo"]
+
+MOOD_DESCRIPTIONS = [
+    "I feel happy today",
+    "a bit sad and lonely",
+    "want something scary tonight",
+    "feeling adventurous",
+    "so bored at home",
+    "in a romantic mood",
+    "curious about the world",
+    "nostalgic for the old days",
+    "it was an ordinary afternoon",
+]
+
+
+def build_request(flow: str, rng: random.Random) -> tuple:
+    """
+    Build one request for a flow
+    
+    Args:
+        flow (str): "name", "mood" or "paginated"
+        rng (random.Random): Random source
+    
+    Returns:
+        tuple: (method, path, form data or None)
+    """
+    if flow == "name":
+        return "POST", "/", {"choice": "name", "movie_name": rng.choice(MOVIE_NAMES)}
+    if flow == "mood":
+        return "POST", "/", {"choice": "mood", "description": rng.choice(MOOD_DESCRIPTIONS)}
+    if flow == "paginated":
+        page = rng.randint(2, 10)
+        description = rng.choice(MOOD_DESCRIPTIONS)
+        return "GET", f"/?page={page}&choice=mood&description={requests.utils.quote(description)}", None
+    raise ValueError(f"Unknown flow: {flow!r}")
+
+
+def percentile(samples: list, percent: float) -> float:
+    """
+    Get a percentile of sorted samples
+    
+    Args:
+        samples (list): Sorted samples
+        percent (float): Percentile between 0 and 100
+    
+    Returns:
+        float: Percentile value or None without samples
+    """
+    if not samples:
+        return None
+    index = min(len(samples) - 1, int(len(samples) * percent / 100))
+    return samples[index]
+
+
+def run_flow(base_url: str, flow: str, total: int, concurrency: int, seed: int) -> dict:
+    """
+    Send requests for one flow and measure them
+    
+    Args:
+        base_url (str): App URL
+        flow (str): Flow name
+        total (int): Number of requests
+        concurrency (int): Requests in flight at once
+        seed (int): Random seed
+    
+    Returns:
+        dict: Request, error and throughput counts with latency percentiles in ms
+    """
+    rng = random.Random(seed)
+    planned = [build_request(flow, rng) for _ in range(total)]
+    local = threading.local()
+    
+    def send(planned_request):
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        method, path, data = planned_request
+        start = time.perf_counter()
+        try:
+            response = session.request(method, base_url + path, data=data, timeout=30)
+            ok = response.status_code == 200
+        except requests.RequestException:
+            ok = False
+        return time.perf_counter() - start, ok
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(send, planned))
+    elapsed = time.perf_counter() - started
+    
+    latencies = sorted(latency * 1000 for latency, _ in outcomes)
+    return {
+        "requests": total,
+        "errors": sum(1 for _, ok in outcomes if not ok),
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else None,
+        "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else None,
+        "p50_ms": round(percentile(latencies, 50), 2) if latencies else None,
+        "p95_ms": round(percentile(latencies, 95), 2) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99), 2) if latencies else None,
+    }
+
+
+def start_app(environment: dict):
+    """
+    Start the app in-process on a threaded WSGI server
+    
+    The environment is applied before the app is imported, because Config
+    reads its settings at import time.
+    
+    Args:
+        environment (dict): Environment variables for the app
+    
+    Returns:
+        tuple: (server, base URL)
+    """
+    os.environ.update(environment)
+    from werkzeug.serving import WSGIRequestHandler, make_server
+    from app import create_app
+    
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+    
+    server = make_server("127.0.0.1", 0, create_app(), threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, name="bench-app", daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def git_revision() -> str:
+    """
+    Get the current commit for the report
+    
+    Returns:
+        str: Short commit hash or None outside a git checkout
+    """
+    try:
+        output = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: dict, baseline: dict = None):
+    """
+    Print a results table, with changes against a baseline run if given
+    
+    Args:
+        report (dict): Benchmark report
+        baseline (dict): Earlier report to compare with
+    """
+    print(f"{'flow':<10} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+    for flow, result in report["flows"].items():
+        print(f"{flow:<10} {result['throughput_rps']:>9} {result['p50_ms']:>9} {result['p95_ms']:>9} "
+              f"{result['p99_ms']:>9} {result['errors']:>7}")
+        previous = (baseline or {}).get("flows", {}).get(flow)
+        if previous:
+            change = lambda key: f"{(result[key] - previous[key]) / previous[key] * 100:+.1f}%" if previous[key] else "n/a"
+            print(f"{'  vs base':<10} {change('throughput_rps'):>9} {change('p50_ms'):>9} "
+                  f"{change('p95_ms'):>9} {change('p99_ms'):>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the app against local stub upstreams")
+    parser.add_argument("--flows", default="name,mood,paginated", help="Comma-separated flows to run")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per flow")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per flow sent first")
+    parser.add_argument("--concurrency", type=int, default=10, help="Requests in flight at once")
+    parser.add_argument("--latency-ms", type=float, default=50, help="Mean stub latency")
+    parser.add_argument("--jitter-ms", type=float, default=10, help="Uniform +/- jitter on stub latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub responses that are 503s")
+    for upstream in ("tmdb", "omdb", "youtube"):
+        parser.add_argument(f"--{upstream}-latency-ms", type=float, help=f"Override latency for {upstream}")
+        parser.add_argument(f"--{upstream}-error-rate", type=float, help=f"Override error rate for {upstream}")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the response cache and trailer index")
+    parser.add_argument("--cache-backend", choices=("memory", "sqlite"), default="memory",
+                        help="Response cache backend (sqlite is the shared multi-worker cache)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed")
+    parser.add_argument("--output", help="Where to save the JSON report (default: benchmarks/results/)")
+    parser.add_argument("--compare", help="Earlier JSON report to compare with")
+    args = parser.parse_args()
+    
+    profiles = {}
+    for upstream in ("tmdb", "omdb", "youtube"):
+        latency = getattr(args, f"{upstream}_latency_ms")
+        error_rate = getattr(args, f"{upstream}_error_rate")
+        profiles[upstream] = StubProfile(
+            latency_ms=args.latency_ms if latency is None else latency,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate if error_rate is None else error_rate,
+        )
+    stubs = start_stubs(profiles, args.seed)
+    
+    # Runtime data goes to a scratch directory so runs never share a trailer index
+    instance_dir = tempfile.mkdtemp(prefix="moodora-bench-")
+    # Injected errors would otherwise log a warning line per failed request
+    # The cache warmer is off so every run starts from the same cold cache
+    environment = dict(stub_environment(stubs), INSTANCE_DIR=instance_dir, LOG_LEVEL="ERROR",
+                       CACHE_BACKEND=args.cache_backend, CACHE_WARMER_ENABLED="False",
+                       TRAILER_INDEX_PATH=os.path.join(instance_dir, "trailers.db"),
+                       SHARED_CACHE_PATH=os.path.join(instance_dir, "response_cache.db"))
+    if args.no_cache:
+        environment.update(CACHE_ENABLED="False", TRAILER_INDEX_ENABLED="False", MOVIE_INDEX_ENABLED="False")
+    server, base_url = start_app(environment)
+    
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "settings": {
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "no_cache": args.no_cache,
+            "cache_backend": args.cache_backend,
+            "seed": args.seed,
+            "upstreams": {name: profile.to_dict() for name, profile in profiles.items()},
+        },
+        "flows": {},
+    }
+    try:
+        for offset, flow in enumerate(args.flows.split(",")):
+            flow = flow.strip()
+            if args.warmup:
+                run_flow(base_url, flow, args.warmup, args.concurrency, args.seed + 1000 + offset)
+            report["flows"][flow] = run_flow(base_url, flow, args.requests, args.concurrency, args.seed + offset)
+        report["upstream_requests"] = {name: stub.requests for name, stub in stubs.items()}
+    finally:
+        server.shutdown()
+        for stub in stubs.values():
+            stub.stop()
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as source:
+            baseline = json.load(source)
+    print_report(report, baseline)
+    
+    output = args.output or os.path.join(RESULTS_DIR, f"load-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as target:
+        json.dump(report, target, indent=2)
+    print(f"Saved report to {output}")
+
+
+if __name__ == "__main__":
+    main()
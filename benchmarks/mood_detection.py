@@ -0,0 +1,79 @@
+"""
+Mood Detection Microbenchmark
+Compares MoodDetector with the legacy keyword chain on long descriptions
+
+Run from the project root:
+    python -m benchmarks.mood_detection
+"""
+
+import random
+import timeit
+from textblob import TextBlob
+from config import Config
+from mood_detector import MoodDetector
+
+
+FILLER_WORDS = (
+    "the a of and to in is it you that was for on are with as they be at one have this from "
+    "or had by but what some we can out other were all there when your use each which do how "
+    "their if will up about many then them these so would make like into time has look more "
+    "go see no way could people than first been call who its now find long down day did get"
+).split()
+
+
+def legacy_detect_mood(text: str) -> str:
+    """Previous implementation: sentiment first, then one substring scan per keyword"""
+    polarity = TextBlob(text).sentiment.polarity
+    text_lower = text.lower().strip()
+    for mood, keywords in Config.MOOD_KEYWORDS:
+        if any(word in text_lower for word in keywords):
+            return mood
+    if polarity > 0.5:
+        return "happy"
+    elif polarity < -0.3:
+        return "sad"
+    return "thoughtful"
+
+
+def build_descriptions(count: int, words: int, seed: int = 7) -> list:
+    """
+    Build long synthetic descriptions, some with a mood keyword near the end
+    
+    Args:
+        count (int): Number of descriptions
+        words (int): Words per description
+        seed (int): Random seed
+    
+    Returns:
+        list: Descriptions
+    """
+    rng = random.Random(seed)
+    keywords = [keyword for _, group in Config.MOOD_KEYWORDS for keyword in group]
+    descriptions = []
+    for index in range(count):
+        text = [rng.choice(FILLER_WORDS) for _ in range(words)]
+        if index % 4:
+            text.insert(rng.randrange(words // 2, words), rng.choice(keywords))
+        descriptions.append(" ".join(text))
+    return descriptions
+
+
+def main():
+    detector = MoodDetector()
+    descriptions = build_descriptions(count=200, words=300)
+    
+    mismatches = [text for text in descriptions if detector.detect_mood(text) != legacy_detect_mood(text)]
+    print(f"Equivalence: {len(descriptions) - len(mismatches)}/{len(descriptions)} descriptions match")
+    
+    runs = 3
+    legacy = min(timeit.repeat(lambda: [legacy_detect_mood(text) for text in descriptions], number=1, repeat=runs))
+    current = min(timeit.repeat(lambda: [detector.detect_mood(text) for text in descriptions], number=1, repeat=runs))
+    
+    per_call = lambda total: total / len(descriptions) * 1e6
+    print(f"Legacy chain:     {per_call(legacy):10.1f} us/description")
+    print(f"Compiled matcher: {per_call(current):10.1f} us/description")
+    print(f"Speedup:          {legacy / current:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
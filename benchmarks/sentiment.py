@@ -0,0 +1,110 @@
+"""
+Sentiment Backend Benchmark
+Compares the lexicon and TextBlob backends on a labelled corpus
+
+Run from the project root:
+    python -m benchmarks.sentiment
+"""
+
+import json
+import subprocess
+import sys
+import timeit
+
+
+# (text, expected mood) using MoodDetector's thresholds on TextBlob's polarity:
+# polarity > 0.5 -> happy, polarity < -0.3 -> sad, otherwise thoughtful.
+# Labels follow the thresholds, not intuition: "Absolutely fantastic news!"
+# scores exactly 0.5 and "It is not good" scores -0.35.
+LABELLED_CORPUS = [
+    ("What a wonderful evening!", "happy"),
+    ("This is the best day ever", "happy"),
+    ("I feel great", "happy"),
+    ("Everything is perfect right now", "happy"),
+    ("I had an amazing, beautiful time", "happy"),
+    ("Absolutely fantastic news!", "thoughtful"),
+    ("Such a lovely surprise", "thoughtful"),
+    ("I feel awful", "sad"),
+    ("Today was terrible", "sad"),
+    ("The worst week of my life", "sad"),
+    ("Everything feels hopeless and bleak", "sad"),
+    ("I hate how this turned out", "sad"),
+    ("What a horrible, disgusting mess", "sad"),
+    ("I feel so bad about it", "sad"),
+    ("Just an ordinary afternoon", "thoughtful"),
+    ("Not bad at all", "thoughtful"),
+    ("It is not good", "sad"),
+    ("I am at home on the couch", "thoughtful"),
+    ("The weather is fine I guess", "thoughtful"),
+    ("Work was long and the commute was okay", "thoughtful"),
+    ("Not a great day, not a terrible one either", "thoughtful"),
+    ("I don't know what to watch tonight", "thoughtful"),
+    ("Pretty good but a bit slow", "thoughtful"),
+    ("It was really not good!", "sad"),
+    # Emoticons carry polarity in TextBlob but are not in the lexicon
+    ("Feeling down :(", "sad"),
+    ("I love it <3", "happy"),
+    ("I'm feeling blue :'(", "sad"),
+]
+
+# Measured in a fresh interpreter so import cost and memory are not shared
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from sentiment import get_sentiment_analyzer
+analyzer = get_sentiment_analyzer(sys.argv[1])
+analyzer.polarity("warm up")
+elapsed = time.perf_counter() - start
+# VmHWM resets on exec, unlike ru_maxrss which inherits the parent's peak
+with open("/proc/self/status") as status:
+    peak_kb = next(int(line.split()[1]) for line in status if line.startswith("VmHWM"))
+print(json.dumps({"load_ms": elapsed * 1000, "max_rss_kb": peak_kb}))
+"""
+
+
+def classify(polarity: float) -> str:
+    """Map polarity onto MoodDetector's fallback moods"""
+    if polarity > 0.5:
+        return "happy"
+    elif polarity < -0.3:
+        return "sad"
+    return "thoughtful"
+
+
+def probe_backend(backend: str) -> dict:
+    """
+    Measure load time and peak RSS of a backend in a fresh interpreter
+    
+    Args:
+        backend (str): Backend name
+    
+    Returns:
+        dict: load_ms and max_rss_kb
+    """
+    output = subprocess.run([sys.executable, "-c", PROBE, backend],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main():
+    from sentiment import get_sentiment_analyzer
+    
+    texts = [text for text, _ in LABELLED_CORPUS]
+    reference = get_sentiment_analyzer("textblob")
+    reference_moods = [classify(reference.polarity(text)) for text in texts]
+    
+    for backend in ("lexicon", "textblob"):
+        analyzer = get_sentiment_analyzer(backend)
+        moods = [classify(analyzer.polarity(text)) for text in texts]
+        correct = sum(mood == label for mood, (_, label) in zip(moods, LABELLED_CORPUS))
+        agreement = sum(mood == expected for mood, expected in zip(moods, reference_moods))
+        seconds = min(timeit.repeat(lambda: [analyzer.polarity(text) for text in texts], number=20, repeat=3))
+        probe = probe_backend(backend)
+        
+        print(f"{backend:9s} accuracy {correct}/{len(texts)}  agrees with TextBlob {agreement}/{len(texts)}  "
+              f"{seconds / (20 * len(texts)) * 1e6:8.1f} us/text  "
+              f"load {probe['load_ms']:7.1f} ms  peak RSS {probe['max_rss_kb'] / 1024:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Stub Upstreams
+Local stand-ins for the TMDb, OMDb and YouTube APIs with configurable latency and errors
+
+Each stub is a threaded HTTP server on a free local port serving small,
+deterministic JSON responses shaped like the real APIs.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class StubProfile:
+    """Latency and failure behaviour of one stub upstream"""
+    
+    def __init__(self, latency_ms: float = 50, jitter_ms: float = 10, error_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+    
+    def delay(self, rng: random.Random) -> float:
+        """
+        Draw a response delay
+        
+        Args:
+            rng (random.Random): Random source
+        
+        Returns:
+            float: Delay in seconds
+        """
+        jitter = rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(0.0, self.latency_ms + jitter) / 1000
+    
+    def to_dict(self) -> dict:
+        """
+        Describe the profile for benchmark reports
+        
+        Returns:
+            dict: Latency, jitter and error rate
+        """
+        return {"latency_ms": self.latency_ms, "jitter_ms": self.jitter_ms, "error_rate": self.error_rate}
+
+
+def tmdb_response(path: str, query: dict) -> dict:
+    """
+    Build a TMDb-shaped response
+    
+    Args:
+        path (str): Request path
+        query (dict): Query parameters
+    
+    Returns:
+        dict: Response body or None for unknown paths
+    """
+    if path.endswith("/discover/movie"):
+        page = int(query.get("page", 1))
+        genre = int(query.get("with_genres", 0))
+        results = [{
+            "id": genre * 100000 + page * 100 + index,
+            "title": f"Stub Movie {genre}-{page}-{index}",
+            "overview": "A stub movie used for benchmarks.",
+            "release_date": "2001-01-01",
+            "poster_path": "/stub.jpg",
+        } for index in range(20)]
+        return {"page": page, "results": results, "total_pages": 500, "total_results": 10000}
+    
+    match = re.search(r"/movie/(\d+)$", path)
+    if match:
+        movie_id = int(match.group(1))
+        # Every third movie has no trailer on TMDb, so YouTube search gets exercised
+        videos = [] if movie_id % 3 == 0 else [
+            {"site": "YouTube", "type": "Trailer", "official": True, "key": f"stub{movie_id}"}]
+        return {
+            "id": movie_id,
+            "title": f"Stub Movie {movie_id}",
+            "overview": "A stub movie used for benchmarks.",
+            "release_date": "2001-01-01",
+            "poster_path": "/stub.jpg",
+            "imdb_id": f"tt{movie_id:07d}",
+            "videos": {"results": videos},
+            "external_ids": {"imdb_id": f"tt{movie_id:07d}"},
+        }
+    return None
+
+
+def omdb_response(path: str, query: dict) -> dict:
+    """
+    Build an OMDb-shaped response
+    
+    Args:
+        path (str): Request path
+        query (dict): Query parameters
+    
+    Returns:
+        dict: Response body or None for unknown requests
+    """
+    if "s" in query:
+        seed = sum(map(ord, query["s"]))
+        return {"Response": "True", "totalResults": "10", "Search": [{
+            "Title": f"{query['s'].title()} {index}",
+            "Year": "1999",
+            "imdbID": f"tt{seed:04d}{index:03d}",
+            "Type": "movie",
+            "Poster": "N/A",
+        } for index in range(10)]}
+    if "i" in query:
+        return {"Response": "True", "Title": f"Stub {query['i']}", "Year": "1999", "imdbID": query["i"],
+                "Plot": "A stub movie used for benchmarks.", "Poster": "N/A"}
+    return None
+
+
+def youtube_response(path: str, query: dict) -> dict:
+    """
+    Build a YouTube search response
+    
+    Args:
+        path (str): Request path
+        query (dict): Query parameters
+    
+    Returns:
+        dict: Response body or None for unknown paths
+    """
+    if not path.endswith("/search"):
+        return None
+    video_id = f"yt{zlib.crc32(query.get('q', '').encode('utf-8')):09d}"
+    return {"items": [{"id": {"kind": "youtube#video", "videoId": video_id}}]}
+
+
+class StubUpstream:
+    """One stub API server running in a background thread"""
+    
+    def __init__(self, name: str, responder, profile: StubProfile, seed: int = 0):
+        self.name = name
+        self.responder = responder
+        self.profile = profile
+        self.requests = 0
+        self.errors = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        """
+        Get the base URL of the running server
+        
+        Returns:
+            str: URL such as http://127.0.0.1:54321
+        """
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """Start serving in a daemon thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"stub-{self.name}", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the server"""
+        self._server.shutdown()
+        self._server.server_close()
+    
+    def _make_handler(self):
+        stub = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+                with stub._lock:
+                    stub.requests += 1
+                    delay = stub.profile.delay(stub._rng)
+                    failed = stub._rng.random() < stub.profile.error_rate
+                    if failed:
+                        stub.errors += 1
+                time.sleep(delay)
+                
+                body = None if failed else stub.responder(parsed.path, query)
+                if failed:
+                    self._send(503, {"status_message": "Stub upstream error"})
+                elif body is None:
+                    self._send(404, {"status_message": "Not found"})
+                else:
+                    self._send(200, body)
+            
+            def _send(self, status: int, body: dict):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        return Handler
+
+
+def start_stubs(profiles: dict, seed: int = 0) -> dict:
+    """
+    Start stub servers for all upstreams
+    
+    Args:
+        profiles (dict): Upstream name ("tmdb", "omdb", "youtube") -> StubProfile
+        seed (int): Random seed for latency and error draws
+    
+    Returns:
+        dict: Upstream name -> running StubUpstream
+    """
+    responders = {"tmdb": tmdb_response, "omdb": omdb_response, "youtube": youtube_response}
+    stubs = {}
+    for name, responder in responders.items():
+        stub = StubUpstream(name, responder, profiles[name], seed)
+        stub.start()
+        stubs[name] = stub
+    return stubs
+
+
+def stub_environment(stubs: dict) -> dict:
+    """
+    Build the environment variables that point the app at the stubs
+    
+    Args:
+        stubs (dict): Upstream name -> StubUpstream
+    
+    Returns:
+        dict: Environment variables
+    """
+    return {
+        "TMDB_BASE_URL": f"{stubs['tmdb'].url}/3",
+        "OMDB_BASE_URL": f"{stubs['omdb'].url}/",
+        "YOUTUBE_BASE_URL": f"{stubs['youtube'].url}/youtube/v3/search",
+        "TMDB_API_KEY": "stub",
+        "OMDB_API_KEY": "stub",
+        "YOUTUBE_API_KEY": "stub",
+    }
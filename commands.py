@@ -0,0 +1,53 @@
+"""
+CLI Commands
+Maintenance commands registered on the Flask application
+"""
+
+import click
+from services.catalog import build_catalog
+from config import Config
+
+
+def register_commands(app, movie_service):
+    """
+    Register maintenance commands on the Flask CLI
+    
+    Args:
+        app (Flask): Flask application
+        movie_service (MovieService): Shared movie service
+    """
+    
+    @app.cli.command("export-trailers")
+    @click.argument("path")
+    def export_trailers(path):
+        """Export the trailer index as JSON lines"""
+        trailer_index = movie_service.youtube_service.trailer_index
+        if trailer_index is None:
+            raise click.ClickException("Trailer index is disabled. Set TRAILER_INDEX_ENABLED=True.")
+        count = trailer_index.export_entries(path)
+        click.echo(f"Exported {count} trailer entries to {path}")
+    
+    @app.cli.command("import-trailers")
+    @click.argument("path")
+    def import_trailers(path):
+        """Import JSON lines into the trailer index"""
+        trailer_index = movie_service.youtube_service.trailer_index
+        if trailer_index is None:
+            raise click.ClickException("Trailer index is disabled. Set TRAILER_INDEX_ENABLED=True.")
+        count = trailer_index.import_entries(path)
+        click.echo(f"Imported {count} trailer entries into {Config.TRAILER_INDEX_PATH}")
+    
+    @app.cli.command("build-catalog")
+    @click.argument("path", required=False)
+    @click.option("--per-genre", type=int, default=Config.CATALOG_MOVIES_PER_GENRE, show_default=True,
+                  help="Most popular movies kept per genre")
+    @click.option("--youtube-trailers", is_flag=True,
+                  help="Search YouTube for movies TMDb lists no trailer for (uses YouTube quota)")
+    def build_catalog_command(path, per_genre, youtube_trailers):
+        """Build the catalog snapshot used for mood searches"""
+        if not movie_service.tmdb_service.is_available():
+            raise click.ClickException("TMDB_API_KEY is missing; the catalog is built from TMDb.")
+        path = path or Config.CATALOG_PATH
+        counts = build_catalog(movie_service, path, per_genre, youtube_trailers,
+                               progress=lambda genre_id, count: click.echo(f"Genre {genre_id}: {count} movies"))
+        click.echo(f"Wrote {sum(counts.values())} movies in {len(counts)} genres to {path}")
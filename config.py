@@ -9,6 +9,8 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 class Config:
     """Application configuration class"""
     
@@ -17,16 +19,142 @@ class Config:
     # YouTube key loaded only from environment (no hardcoded fallback)
     YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
     TMDB_API_KEY = os.getenv("TMDB_API_KEY")
+    
+    # Upstream endpoints; overridable to point at local stubs (see benchmarks/)
+    TMDB_BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
+    OMDB_BASE_URL = os.getenv("OMDB_BASE_URL", "https://www.omdbapi.com/")
+    YOUTUBE_BASE_URL = os.getenv("YOUTUBE_BASE_URL", "https://www.googleapis.com/youtube/v3/search")
 
     
     # App Settings
     DEBUG = os.getenv("DEBUG", "True").lower() == "true"
     SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
     
+    # Logging Settings: "json" for one structured object per line, "text" for humans
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+    LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+    
     # API Settings
     REQUEST_TIMEOUT = 5
     MAX_MOVIES_PER_PAGE = 5
     MAX_PAGES = 10
+    MAX_BATCH_SIZE = int(os.getenv("MAX_BATCH_SIZE", "1000"))
+    # TMDb discover returns fixed 20-result pages and stops at page 500
+    TMDB_PAGE_SIZE = 20
+    TMDB_MAX_PAGES = 500
+    
+    # HTTP Connection Pool Settings
+    HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    HTTP_KEEP_ALIVE = os.getenv("HTTP_KEEP_ALIVE", "True").lower() == "true"
+    HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "2"))
+    HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.3"))
+    
+    # End-to-end latency budget for a results page in milliseconds (0 disables)
+    REQUEST_BUDGET_MS = int(os.getenv("REQUEST_BUDGET_MS", "800"))
+    
+    # Stream result cards to the page as they become ready
+    STREAM_RESULTS = os.getenv("STREAM_RESULTS", "True").lower() == "true"
+    
+    # Resolve YouTube trailers only when a user asks for one (/trailer)
+    LAZY_TRAILERS = os.getenv("LAZY_TRAILERS", "True").lower() == "true"
+    TRAILER_CACHE_MAX_AGE = int(os.getenv("TRAILER_CACHE_MAX_AGE", "86400"))
+    
+    # Async HTTP Settings
+    HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv("HTTP_ASYNC_MAX_CONNECTIONS", "200"))
+    ASYNC_UPSTREAM_CONCURRENCY = int(os.getenv("ASYNC_UPSTREAM_CONCURRENCY", "50"))
+    
+    # Circuit Breaker Settings
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "30"))
+    CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1"))
+    
+    # Adaptive Timeouts: a multiple of the observed latency percentile, capped at REQUEST_TIMEOUT
+    ADAPTIVE_TIMEOUTS = os.getenv("ADAPTIVE_TIMEOUTS", "True").lower() == "true"
+    TIMEOUT_PERCENTILE = float(os.getenv("TIMEOUT_PERCENTILE", "99"))
+    TIMEOUT_MULTIPLIER = float(os.getenv("TIMEOUT_MULTIPLIER", "2"))
+    TIMEOUT_MIN = float(os.getenv("TIMEOUT_MIN", "0.5"))
+    LATENCY_WINDOW = int(os.getenv("LATENCY_WINDOW", "200"))
+    LATENCY_MIN_SAMPLES = int(os.getenv("LATENCY_MIN_SAMPLES", "20"))
+    
+    # Response Cache Settings
+    CACHE_ENABLED = os.getenv("CACHE_ENABLED", "True").lower() == "true"
+    CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+    # "memory" keeps responses per worker process; "sqlite" shares one file between all workers on a host
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_DEFAULT_TTL = 300
+    # Seconds to keep "not found" responses so missing titles are not looked up again
+    CACHE_NEGATIVE_TTL = int(os.getenv("CACHE_NEGATIVE_TTL", "3600"))
+    # Seconds past its TTL a response is still served while it is refreshed in the background (0 disables)
+    CACHE_STALE_TTL = int(os.getenv("CACHE_STALE_TTL", "3600"))
+    # Per-endpoint TTLs in seconds
+    CACHE_TTLS = {
+        "tmdb_discover": 600,
+        "tmdb_details": 86400,
+        "omdb_search": 3600,
+        "omdb_details": 86400,
+        "youtube_search": 86400,
+    }
+    
+    # Rendered Page Cache: result pages keyed by search type, movie name or detected mood, and page
+    PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED", "True").lower() == "true"
+    PAGE_CACHE_TTL = int(os.getenv("PAGE_CACHE_TTL", "300"))
+    PAGE_CACHE_MAX_BYTES = int(os.getenv("PAGE_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+    # Cache-Control max-age for cached pages; browsers and CDNs revalidate with the ETag afterwards
+    PAGE_CACHE_MAX_AGE = int(os.getenv("PAGE_CACHE_MAX_AGE", "60"))
+    
+    # Cache Warmer: fetches every mood genre page at startup, then refreshes the most requested pages
+    CACHE_WARMER_ENABLED = os.getenv("CACHE_WARMER_ENABLED", "True").lower() == "true"
+    # Pages per genre warmed at startup
+    CACHE_WARM_PAGES = int(os.getenv("CACHE_WARM_PAGES", "3"))
+    # Upstream requests per second the warmer may send (0 for no limit)
+    CACHE_WARM_RATE = float(os.getenv("CACHE_WARM_RATE", "5"))
+    CACHE_REFRESH_INTERVAL = int(os.getenv("CACHE_REFRESH_INTERVAL", "300"))
+    CACHE_REFRESH_TOP_PAGES = int(os.getenv("CACHE_REFRESH_TOP_PAGES", "20"))
+    
+    # Runtime data (indexes, caches) lives outside the source tree
+    INSTANCE_DIR = os.getenv("INSTANCE_DIR", os.path.join(BASE_DIR, "instance"))
+    
+    # Trailer Index Settings
+    TRAILER_INDEX_ENABLED = os.getenv("TRAILER_INDEX_ENABLED", "True").lower() == "true"
+    TRAILER_INDEX_PATH = os.getenv("TRAILER_INDEX_PATH", os.path.join(INSTANCE_DIR, "trailers.db"))
+    # Seconds before a "no trailer found" entry is looked up again
+    TRAILER_INDEX_NEGATIVE_TTL = int(os.getenv("TRAILER_INDEX_NEGATIVE_TTL", str(7 * 24 * 3600)))
+    
+    # Movie Index: TMDb and OMDb records merged by IMDb and TMDb ID, checked before details calls
+    MOVIE_INDEX_ENABLED = os.getenv("MOVIE_INDEX_ENABLED", "True").lower() == "true"
+    MOVIE_INDEX_PATH = os.getenv("MOVIE_INDEX_PATH", os.path.join(INSTANCE_DIR, "movies.db"))
+    # Seconds a field stays fresh after a provider last sent it
+    MOVIE_INDEX_TTL = int(os.getenv("MOVIE_INDEX_TTL", str(7 * 24 * 3600)))
+    
+    # Catalog Snapshot: prebuilt mood pages (flask build-catalog) served before any live TMDb call
+    CATALOG_ENABLED = os.getenv("CATALOG_ENABLED", "True").lower() == "true"
+    CATALOG_PATH = os.getenv("CATALOG_PATH", os.path.join(INSTANCE_DIR, "catalog.bin"))
+    CATALOG_MOVIES_PER_GENRE = int(os.getenv("CATALOG_MOVIES_PER_GENRE", "100"))
+    
+    # Poster Proxy: /poster/<id> serves card-sized TMDb and OMDb posters from a disk cache
+    POSTER_PROXY_ENABLED = os.getenv("POSTER_PROXY_ENABLED", "True").lower() == "true"
+    POSTER_CACHE_DIR = os.getenv("POSTER_CACHE_DIR", os.path.join(INSTANCE_DIR, "posters"))
+    # Widths offered in srcset; each must be a TMDb poster size (92, 154, 185, 342, 500, 780)
+    POSTER_WIDTHS = [int(width) for width in os.getenv("POSTER_WIDTHS", "154,342,500").split(",")]
+    # Variants never change, so browsers may keep them for a year
+    POSTER_MAX_AGE = int(os.getenv("POSTER_MAX_AGE", str(365 * 24 * 3600)))
+    
+    # Shared response cache file used when CACHE_BACKEND is "sqlite"
+    SHARED_CACHE_PATH = os.getenv("SHARED_CACHE_PATH", os.path.join(INSTANCE_DIR, "response_cache.db"))
+    
+    # On-demand Profiling: a request carrying the X-Moodora-Profile header or ?profile=
+    # query parameter (equal to PROFILE_TOKEN, if set) runs under cProfile
+    PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "False").lower() == "true"
+    PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+    PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(INSTANCE_DIR, "profiles"))
+    
+    # Concurrency Settings
+    ENRICHMENT_WORKERS = int(os.getenv("ENRICHMENT_WORKERS", "10"))
+    UPSTREAM_CONCURRENCY = {
+        "tmdb": int(os.getenv("TMDB_CONCURRENCY", "8")),
+        "omdb": int(os.getenv("OMDB_CONCURRENCY", "4")),
+        "youtube": int(os.getenv("YOUTUBE_CONCURRENCY", "4")),
+    }
     
     # TMDb Genre IDs mapping
     TMDB_GENRE_IDS = {
@@ -135,3 +263,42 @@ class Config:
         "social": "comedy", "party": "comedy", "festive": "comedy", "friendly": "comedy",
         "warm": "romance", "intimate": "romance"
     }
+    
+    # Sentiment backend for the mood fallback: "textblob" or the faster built-in "lexicon"
+    SENTIMENT_BACKEND = os.getenv("SENTIMENT_BACKEND", "textblob")
+    SENTIMENT_LEXICON_PATH = os.path.join(BASE_DIR, "data", "sentiment_lexicon.tsv")
+    
+    # Mood keywords in precedence order: the first mood with a keyword
+    # contained anywhere in the description wins
+    MOOD_KEYWORDS = [
+        # Positive moods
+        ("happy", ["happy", "joy", "cheerful", "playful", "celebratory", "amused", "entertained"]),
+        ("excited", ["excited", "energetic", "thrilled", "adrenaline", "pumped", "intense"]),
+        ("adventurous", ["adventurous", "adventure", "explore", "journey"]),
+        ("inspired", ["inspired", "motivated", "hopeful", "optimistic"]),
+        ("romantic", ["romantic", "love", "romance", "warm", "intimate"]),
+        ("nostalgic", ["nostalgic", "nostalgia", "memories", "remember"]),
+
+        # Negative moods
+        ("sad", ["sad", "depressed", "melancholy", "lonely", "pessimistic"]),
+        ("angry", ["angry", "furious", "mad", "frustrated", "stressed"]),
+        ("scared", ["scared", "fear", "horror", "terrified", "anxious", "afraid"]),
+        
+        # Neutral/Complex moods
+        ("curious", ["curious", "wonder", "question", "learn", "discover"]),
+        ("thoughtful", ["thoughtful", "contemplative", "reflective", "creative", "focused"]),
+        ("mysterious", ["mysterious", "mystery", "suspenseful", "suspense"]),
+        ("calm", ["calm", "peaceful", "meditative", "zen", "relaxed"]),
+        
+        # Entertainment moods
+        ("bored", ["bored", "lazy", "silly", "witty", "sarcastic"]),
+        
+        # Thrill-seeking moods
+        ("thrilled", ["dramatic", "tense", "thrilling"]),
+        
+        # Fantasy/Escape moods
+        ("dreamy", ["dreamy", "magical", "whimsical", "escapist", "imaginative", "fantasy"]),
+        
+        # Social moods
+        ("social", ["social", "party", "festive", "friendly", "gathering"]),
+    ]
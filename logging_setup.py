@@ -0,0 +1,67 @@
+"""
+Structured Logging
+JSON log lines written from a background thread so request threads never block on I/O
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+from config import Config
+
+
+# Attributes every LogRecord has; anything else came from extra={...}
+RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "taskName"}
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object, including fields passed via extra"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created)) + f".{int(record.msecs):03d}Z",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging():
+    """
+    Route app logs through a queue to a JSON (or plain text) stdout handler
+    
+    Loggers only enqueue records; a listener thread formats and writes them.
+    Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    handler = logging.StreamHandler(sys.stdout)
+    if Config.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    
+    # Unbounded so logging never blocks a request; records are small
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    for name in ("services", "app", "mood_detector", "commands"):
+        logger = logging.getLogger(name)
+        logger.setLevel(Config.LOG_LEVEL)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger.propagate = False
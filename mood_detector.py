@@ -3,16 +3,82 @@ Mood Detection Module
 Handles sentiment analysis and mood classification
 """
 
-from textblob import TextBlob
+import re
+from sentiment import get_sentiment_analyzer
 from config import Config
 
 
+class KeywordMatcher:
+    """Single-pass matcher for the mood keyword table"""
+    
+    # Bound on remembered tokens so arbitrary input cannot grow memory forever
+    MAX_CACHED_TOKENS = 100000
+    
+    def __init__(self, mood_keywords: list):
+        """
+        Compile the keyword table
+        
+        Args:
+            mood_keywords (list): (mood, keywords) pairs in precedence order
+        """
+        self.moods = [mood for mood, _ in mood_keywords]
+        self.no_match = len(self.moods)
+        self.keyword_ranks = {}
+        for rank, (_, keywords) in enumerate(mood_keywords):
+            for keyword in keywords:
+                if not re.fullmatch(r"[a-z]+", keyword):
+                    raise ValueError(f"Mood keyword must be a lowercase word: {keyword!r}")
+                self.keyword_ranks.setdefault(keyword, rank)
+        
+        # Zero-width lookahead finds overlapping keywords in a token in one scan
+        keywords = sorted(self.keyword_ranks, key=lambda word: (self.keyword_ranks[word], -len(word)))
+        self.pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+        self.token_ranks = {}
+    
+    def match(self, text_lower: str) -> str:
+        """
+        Find the highest-precedence mood whose keyword occurs in the text
+        
+        Keywords are letters only, so any occurrence lies inside a single
+        whitespace-separated token. Each distinct token is ranked once and
+        remembered, which makes a description a single pass over its tokens.
+        
+        Args:
+            text_lower (str): Lowercased description
+        
+        Returns:
+            str: Matched mood or None
+        """
+        token_ranks = self.token_ranks
+        best = self.no_match
+        for token in set(text_lower.split()):
+            rank = token_ranks.get(token)
+            if rank is None:
+                rank = self._rank_token(token)
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return self.moods[best] if best < self.no_match else None
+    
+    def _rank_token(self, token: str) -> int:
+        """Rank a token by its highest-precedence keyword"""
+        rank = min((self.keyword_ranks[match.group(1)] for match in self.pattern.finditer(token)),
+                   default=self.no_match)
+        if len(self.token_ranks) >= self.MAX_CACHED_TOKENS:
+            self.token_ranks.clear()
+        self.token_ranks[token] = rank
+        return rank
+
+
 class MoodDetector:
     """Class for detecting and classifying user moods"""
     
     def __init__(self):
         self.tmdb_genre_ids = Config.TMDB_GENRE_IDS
         self.mood_genres = Config.MOOD_GENRES
+        self.keyword_matcher = KeywordMatcher(Config.MOOD_KEYWORDS)
+        self.sentiment_analyzer = get_sentiment_analyzer(Config.SENTIMENT_BACKEND)
     
     def detect_mood(self, text: str) -> str:
         """
@@ -27,58 +93,15 @@ class MoodDetector:
         if not text or not text.strip():
             return "thoughtful"
         
-        polarity = TextBlob(text).sentiment.polarity
         text_lower = text.lower().strip()
         
-        # Check for specific mood keywords first (expanded list)
-        
-        # Positive moods
-        if any(word in text_lower for word in ["happy", "joy", "cheerful", "playful", "celebratory", "amused", "entertained"]):
-            return "happy"
-        if any(word in text_lower for word in ["excited", "energetic", "thrilled", "adrenaline", "pumped", "intense"]):
-            return "excited"
-        if any(word in text_lower for word in ["adventurous", "adventure", "explore", "journey"]):
-            return "adventurous"
-        if any(word in text_lower for word in ["inspired", "motivated", "hopeful", "optimistic"]):
-            return "inspired"
-        if any(word in text_lower for word in ["romantic", "love", "romance", "warm", "intimate"]):
-            return "romantic"
-        if any(word in text_lower for word in ["nostalgic", "nostalgia", "memories", "remember"]):
-            return "nostalgic"
-        
-        # Negative moods
-        if any(word in text_lower for word in ["sad", "depressed", "melancholy", "lonely", "pessimistic"]):
-            return "sad"
-        if any(word in text_lower for word in ["angry", "furious", "mad", "frustrated", "stressed"]):
-            return "angry"
-        if any(word in text_lower for word in ["scared", "fear", "horror", "terrified", "anxious", "afraid"]):
-            return "scared"
-        
-        # Neutral/Complex moods
-        if any(word in text_lower for word in ["curious", "wonder", "question", "learn", "discover"]):
-            return "curious"
-        if any(word in text_lower for word in ["thoughtful", "contemplative", "reflective", "creative", "focused"]):
-            return "thoughtful"
-        if any(word in text_lower for word in ["mysterious", "mystery", "suspenseful", "suspense"]):
-            return "mysterious"
-        if any(word in text_lower for word in ["calm", "peaceful", "meditative", "zen", "relaxed"]):
-            return "calm"
-        
-        # Entertainment moods
-        if any(word in text_lower for word in ["bored", "lazy", "silly", "witty", "sarcastic"]):
-            return "bored"
-        
-        # Thrill-seeking moods
-        if any(word in text_lower for word in ["dramatic", "tense", "thrilling"]):
-            return "thrilled"
+        # Check for specific mood keywords first
+        mood = self.keyword_matcher.match(text_lower)
+        if mood:
+            return mood
         
-        # Fantasy/Escape moods
-        if any(word in text_lower for word in ["dreamy", "magical", "whimsical", "escapist", "imaginative", "fantasy"]):
-            return "dreamy"
-        
-        # Social moods
-        if any(word in text_lower for word in ["social", "party", "festive", "friendly", "gathering"]):
-            return "social"
+        # Sentiment is only needed when no keyword matched
+        polarity = self.sentiment_analyzer.polarity(text)
         
         # Fallback to sentiment analysis
         if polarity > 0.5:
@@ -88,6 +111,27 @@ class MoodDetector:
         else:
             return "thoughtful"  # Better default than romantic
     
+    def detect_moods(self, texts: list) -> list:
+        """
+        Detect moods for many descriptions, analysing each distinct text once
+        
+        Args:
+            texts (list): User mood descriptions
+        
+        Returns:
+            list: Detected mood per text, or None for empty texts
+        """
+        detected = {}
+        moods = []
+        for text in texts:
+            if not text or not text.strip():
+                moods.append(None)
+                continue
+            if text not in detected:
+                detected[text] = self.detect_mood(text)
+            moods.append(detected[text])
+        return moods
+    
     def get_genre_id(self, mood: str) -> int:
         """
         Get TMDb genre ID for a given mood
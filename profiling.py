@@ -0,0 +1,103 @@
+"""
+Request Profiling
+Runs a single request under cProfile on demand and reports where its time went
+"""
+
+import cProfile
+import hmac
+import os
+import pstats
+import time
+from datetime import datetime
+from services.metrics import collect_stages
+from config import Config
+
+
+PROFILE_HEADER = "X-Moodora-Profile"
+PROFILE_PARAM = "profile"
+
+
+def profiling_requested(request) -> bool:
+    """
+    Check if a request asks to be profiled
+    
+    Args:
+        request (flask.Request): Incoming request
+    
+    Returns:
+        bool: True if profiling is enabled and the trigger (and token, if configured) is present
+    """
+    if not Config.PROFILING_ENABLED:
+        return False
+    trigger = request.headers.get(PROFILE_HEADER) or request.args.get(PROFILE_PARAM)
+    if not trigger:
+        return False
+    if Config.PROFILE_TOKEN:
+        return hmac.compare_digest(trigger, Config.PROFILE_TOKEN)
+    return True
+
+
+class RequestProfiler:
+    """Profiles the code run inside a with block and collects its stage timings"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        # CPU time of this thread: awaits show up as stage wall times, not as time in select()
+        self.profile = cProfile.Profile(time.thread_time)
+        self.stages = {}
+        self.wall_time = 0.0
+        self.path = None
+        self._collector = None
+        self._start = None
+    
+    def __enter__(self):
+        self._collector = collect_stages()
+        self.stages = self._collector.__enter__()
+        self._start = time.perf_counter()
+        self.profile.enable()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+        self.wall_time = time.perf_counter() - self._start
+        self._collector.__exit__(*exc_info)
+        self.path = self.save()
+        return False
+    
+    def save(self) -> str:
+        """
+        Write the profile as a pstats dump
+        
+        Open it with `python -m pstats <file>` or snakeviz.
+        
+        Returns:
+            str: Path of the dump
+        """
+        os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+        filename = f"{self.name}-{datetime.now():%Y%m%d-%H%M%S-%f}.prof"
+        path = os.path.join(Config.PROFILE_DIR, filename)
+        self.profile.dump_stats(path)
+        return path
+    
+    def cpu_time(self) -> float:
+        """
+        Get the CPU time spent in the profiled thread
+        
+        Returns:
+            float: Seconds
+        """
+        return pstats.Stats(self.profile).total_tt
+    
+    def annotate(self, response):
+        """
+        Add the timing breakdown and dump location to a response
+        
+        Server-Timing shows up in the browser's network panel; durations are in ms.
+        
+        Args:
+            response (flask.Response): Response of the profiled request
+        """
+        timings = [("total", self.wall_time), ("cpu", self.cpu_time())]
+        timings.extend(sorted(self.stages.items(), key=lambda item: -item[1]))
+        response.headers["Server-Timing"] = ", ".join(f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings)
+        response.headers["X-Moodora-Profile-File"] = os.path.basename(self.path)
@@ -0,0 +1,158 @@
+"""
+Sentiment Analysis Module
+Selectable polarity backends for mood detection fallback
+"""
+
+from config import Config
+
+
+class LexiconSentimentAnalyzer:
+    """Fast polarity scorer backed by a precomputed word lexicon"""
+    
+    NEGATIONS = ("no", "not", "n't", "never")
+    CONTRACTIONS = ("n't", "'s", "'m", "'d", "'ll", "'re", "'ve")
+    PUNCTUATION = ".,;:!?()[]{}`'\"@#$^&*+-|=~_"
+    
+    def __init__(self, lexicon_path: str = None):
+        # word -> (polarity, intensity, is_modifier)
+        self.lexicon = {}
+        with open(lexicon_path or Config.SENTIMENT_LEXICON_PATH, encoding="utf-8") as source:
+            for line in source:
+                if line.startswith("#") or not line.strip():
+                    continue
+                word, polarity, intensity, modifier = line.rstrip("\n").split("\t")
+                self.lexicon[word] = (float(polarity), float(intensity), modifier == "1")
+    
+    def tokenize(self, text: str) -> list:
+        """
+        Split text into lowercase words and punctuation the way TextBlob does
+        
+        Words are whitespace-separated; only leading and trailing punctuation
+        is split off, and quotes always stand alone.
+        
+        Args:
+            text (str): Input text
+        
+        Returns:
+            list: Tokens
+        """
+        text = text.lower()
+        for contraction in self.CONTRACTIONS:
+            text = text.replace(contraction, " " + contraction)
+        text = text.replace("'", " ' ").replace('"', ' " ')
+        
+        tokens = []
+        for token in text.split():
+            while token and token[0] in self.PUNCTUATION and token[0] != ".":
+                tokens.append(token[0])
+                token = token[1:]
+            tail = []
+            while token and token[-1] in self.PUNCTUATION:
+                if token.endswith("..."):
+                    tail.append("...")
+                    token = token[:-3].rstrip(".")
+                else:
+                    tail.append(token[-1])
+                    token = token[:-1]
+            if token:
+                tokens.append(token)
+            tokens.extend(reversed(tail))
+        return tokens
+    
+    def polarity(self, text: str) -> float:
+        """
+        Score text polarity between -1.0 and 1.0
+        
+        Known words are averaged. An adverb such as "very" scales the next
+        word, a preceding negation flips and halves a score ("not good" is
+        slightly bad) and "!" boosts the previous word, matching TextBlob.
+        
+        Args:
+            text (str): Input text
+        
+        Returns:
+            float: Polarity score
+        """
+        # Each assessment is [polarity, intensity, negated]
+        assessments = []
+        modifier = None
+        negation = None
+        
+        for word in self.tokenize(text):
+            entry = self.lexicon.get(word)
+            if entry is not None:
+                polarity, intensity, is_modifier = entry
+                if modifier is None:
+                    assessments.append([polarity, intensity, False])
+                else:
+                    last = assessments[-1]
+                    last[0] = max(-1.0, min(polarity * last[1], 1.0))
+                    last[1] = intensity
+                if negation is not None:
+                    assessments[-1][1] = 1.0 / assessments[-1][1]
+                    assessments[-1][2] = True
+                modifier = word if is_modifier else None
+                negation = word if word in self.NEGATIONS else None
+                continue
+            
+            # Unknown words keep a negation alive across small words ("not a good")
+            if word in self.NEGATIONS:
+                negation = word
+            elif negation and len(word.strip("'")) > 1:
+                negation = None
+            # "really not good" negates the modified word
+            if negation is not None and modifier is not None and modifier.endswith("ly"):
+                assessments[-1][2] = True
+                negation = None
+            elif modifier and len(word) > 2:
+                modifier = None
+            if word == "!" and assessments:
+                assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+        
+        if not assessments:
+            return 0.0
+        scores = [polarity * -0.5 if negated else polarity for polarity, _, negated in assessments]
+        return sum(scores) / len(scores)
+
+
+class TextBlobSentimentAnalyzer:
+    """Polarity scorer using TextBlob's pattern analyzer"""
+    
+    def __init__(self):
+        # Imported lazily so the lexicon backend never pays TextBlob's import cost
+        from textblob import TextBlob
+        self._textblob = TextBlob
+    
+    def polarity(self, text: str) -> float:
+        """
+        Score text polarity between -1.0 and 1.0
+        
+        Args:
+            text (str): Input text
+        
+        Returns:
+            float: Polarity score
+        """
+        return self._textblob(text).sentiment.polarity
+
+
+SENTIMENT_BACKENDS = {
+    "lexicon": LexiconSentimentAnalyzer,
+    "textblob": TextBlobSentimentAnalyzer,
+}
+
+
+def get_sentiment_analyzer(backend: str = None):
+    """
+    Create the configured sentiment analyzer
+    
+    Args:
+        backend (str): "lexicon" or "textblob"; defaults to Config.SENTIMENT_BACKEND
+    
+    Returns:
+        object: Analyzer with a polarity(text) method
+    """
+    backend = (backend or Config.SENTIMENT_BACKEND).lower()
+    if backend not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend: {backend!r}")
+    return SENTIMENT_BACKENDS[backend]()
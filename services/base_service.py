@@ -2,33 +2,311 @@
 Base service class for API integrations
 """
 
+import asyncio
+import copy
+import logging
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import requests
+from .http_session import get_session, get_async_client, RETRY_STATUS_CODES
+from .response_cache import response_cache, make_cache_key, is_empty_response, is_cacheable_response
+from .single_flight import SingleFlight, AsyncSingleFlight
+from .circuit_breaker import CircuitOpenError, get_breaker
+from .deadline import DeadlineExceeded
+from .io_loop import get_io_loop
+from .metrics import UPSTREAM_LATENCY, UPSTREAM_ERRORS, CACHE_REVALIDATIONS
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+# Per-upstream semaphores shared by every service instance in the process
+_upstream_limits = {}
+_upstream_limits_lock = threading.Lock()
+
+
+def get_upstream_limit(service_name: str) -> threading.BoundedSemaphore:
+    """
+    Get the shared concurrency limiter for an upstream
+    
+    Args:
+        service_name (str): Upstream name (e.g. "tmdb")
+    
+    Returns:
+        threading.BoundedSemaphore: Limiter for in-flight requests
+    """
+    with _upstream_limits_lock:
+        limit = _upstream_limits.get(service_name)
+        if limit is None:
+            max_concurrency = Config.UPSTREAM_CONCURRENCY.get(service_name, Config.ENRICHMENT_WORKERS)
+            limit = threading.BoundedSemaphore(max(1, max_concurrency))
+            _upstream_limits[service_name] = limit
+        return limit
+
+
+# Shared fetches of the synchronous services for callers with a request budget, so each
+# caller waits only its own remaining time; sized to fill every upstream's slots with fetches queued behind them
+_fetch_pool = ThreadPoolExecutor(max_workers=2 * sum(Config.UPSTREAM_CONCURRENCY.values()),
+                                 thread_name_prefix="upstream-fetch")
+
+# Background refreshes of stale cache entries for the synchronous services
+_revalidation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="revalidate")
+
+# Strong references keep fire-and-forget refresh tasks alive until they finish
+_revalidation_tasks = set()
+
+# Shared-cache reads for the async services; a lookup can wait seconds on another process's write lock
+_cache_read_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-read")
+
+# Shared-cache writes for the async services, queued behind the response; SQLite takes one writer at a time
+_cache_write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-write")
+
+
+# Async limiters are bound to an event loop, so they are kept per loop
+_async_upstream_limits = weakref.WeakKeyDictionary()
+
+
+def get_async_upstream_limit(service_name: str) -> asyncio.Semaphore:
+    """
+    Get the concurrency limiter for an upstream on the running event loop
+    
+    Args:
+        service_name (str): Upstream name (e.g. "tmdb")
+    
+    Returns:
+        asyncio.Semaphore: Limiter for in-flight requests
+    """
+    loop = asyncio.get_running_loop()
+    limits = _async_upstream_limits.setdefault(loop, {})
+    limit = limits.get(service_name)
+    if limit is None:
+        limit = asyncio.Semaphore(max(1, Config.ASYNC_UPSTREAM_CONCURRENCY))
+        limits[service_name] = limit
+    return limit
+
+
+def error_reason(error: Exception) -> str:
+    """
+    Classify a failed upstream request for metrics and logs
+    
+    Args:
+        error (Exception): Exception raised by the request
+    
+    Returns:
+        str: Short reason such as "timeout", "circuit_open" or "http_5xx"
+    """
+    if isinstance(error, CircuitOpenError):
+        return "circuit_open"
+    if isinstance(error, DeadlineExceeded):
+        return "deadline"
+    if isinstance(error, (TimeoutError, requests.Timeout, httpx.TimeoutException)):
+        return "timeout"
+    if isinstance(error, (requests.HTTPError, httpx.HTTPStatusError)) and error.response is not None:
+        return f"http_{error.response.status_code // 100}xx"
+    if isinstance(error, (requests.ConnectionError, httpx.TransportError)):
+        return "connection"
+    return "other"
+
+
 class BaseAPIService:
     """Base class for API services with common functionality"""
     
+    service_name = "base"
+    cache = response_cache
+    # Shared by every service so concurrent identical calls coalesce process-wide
+    flights = SingleFlight(_fetch_pool)
+    
     def __init__(self):
         self.timeout = Config.REQUEST_TIMEOUT
+        self.concurrency_limit = get_upstream_limit(self.service_name)
+        self.breaker = get_breaker(self.service_name)
     
-    def safe_request(self, url: str) -> dict:
+    def safe_request(self, url: str, endpoint: str = None, deadline=None) -> dict:
         """
-        Make a safe HTTP request with error handling
+        Make a safe HTTP request with error handling and response caching
         
         Args:
             url (str): URL to request
-            
+            endpoint (str): Endpoint name used to pick the cache TTL
+            deadline (Deadline): Request budget; the call gets only its remaining time
+        
         Returns:
             dict: JSON response or empty dict on error
         """
+        cache_key, ttl, cached, fresh = self._cache_lookup(url, endpoint)
+        if cached is not None:
+            if not fresh:
+                # Serve the stale copy now and refresh it for later callers
+                self._revalidate(url, cache_key, ttl, endpoint)
+            return cached
+        
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            self._check_budget(deadline)
+            # Identical concurrent requests wait on one fetch instead of stampeding upstream; the fetch
+            # is shared, so it runs without any caller's budget and each caller waits only its own time
+            data, shared = self.flights.do(make_cache_key(url),
+                                           lambda: self._fetch(url, cache_key, ttl, endpoint),
+                                           timeout=deadline.remaining() if deadline else None)
         except Exception as e:
-            print(f"Error fetching {url}: {e}")
+            self._log_error(url, endpoint, self._caller_error(e, deadline))
             return {}
+        
+        # Callers mutate results, so waiters get their own copy
+        return copy.deepcopy(data) if shared else data
+    
+    def _fetch(self, url: str, cache_key: str, ttl: float, endpoint: str = None) -> dict:
+        """
+        Fetch a URL from upstream and cache the response
+        
+        The fetch is shared by coalesced callers, so no caller's budget applies:
+        each attempt gets the upstream's adaptive timeout, retries included, and
+        callers with a budget stop waiting when it runs out.
+        
+        Args:
+            url (str): URL to request
+            cache_key (str): Key from _cache_lookup, or None to skip caching
+            ttl (float): Endpoint TTL in seconds
+            endpoint (str): Endpoint name for metrics
+        
+        Returns:
+            dict: Parsed JSON response
+        """
+        # A tripped upstream is skipped at once instead of waiting out its timeout
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"{self.service_name} circuit is open")
+        
+        with self.concurrency_limit:
+            try:
+                start = time.monotonic()
+                response = get_session(url).get(url, timeout=self.breaker.timeout())
+            except Exception:
+                self.breaker.record_failure()
+                raise
+        self._record_health(response.status_code, time.monotonic() - start, endpoint)
+        response.raise_for_status()
+        data = response.json()
+        self._cache_store(cache_key, ttl, data)
+        return data
+    
+    def _check_budget(self, deadline):
+        """
+        Refuse to start a request once the request budget is spent
+        
+        Args:
+            deadline (Deadline): Request budget, if any
+        """
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceeded(f"Request budget spent before calling {self.service_name}")
+    
+    def _caller_error(self, error: Exception, deadline) -> Exception:
+        """
+        Attribute a failed wait to the caller's budget when it ran out
+        
+        Args:
+            error (Exception): Exception raised while waiting for the shared fetch
+            deadline (Deadline): Caller's request budget, if any
+        
+        Returns:
+            Exception: DeadlineExceeded for a wait cut short by the budget, otherwise error
+        """
+        if isinstance(error, TimeoutError) and not isinstance(error, DeadlineExceeded) \
+                and deadline is not None and deadline.expired():
+            return DeadlineExceeded(f"Request budget spent waiting for {self.service_name}")
+        return error
+    
+    def _record_health(self, status_code: int, latency: float, endpoint: str = None):
+        """
+        Feed a response into the upstream's circuit breaker and latency metrics
+        
+        Client errors such as 404 are the caller's problem, not the upstream's.
+        
+        Args:
+            status_code (int): HTTP status of the final response
+            latency (float): Request latency in seconds
+            endpoint (str): Endpoint name for metrics
+        """
+        UPSTREAM_LATENCY.observe(latency, self.service_name, endpoint or "other", str(status_code))
+        if status_code in RETRY_STATUS_CODES or status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success(latency)
+    
+    def _log_error(self, url: str, endpoint: str, error: Exception):
+        """
+        Count and log a request that returned no data
+        
+        Args:
+            url (str): Requested URL; logged without its API key
+            endpoint (str): Endpoint name for metrics
+            error (Exception): Why the request failed
+        """
+        reason = error_reason(error)
+        UPSTREAM_ERRORS.inc(self.service_name, endpoint or "other", reason)
+        logger.warning("Upstream request failed", extra={
+            "service": self.service_name,
+            "endpoint": endpoint,
+            "reason": reason,
+            "url": make_cache_key(url),
+            "error": str(error),
+        })
+    
+    def _cache_lookup(self, url: str, endpoint: str) -> tuple:
+        """
+        Look up a cached response for a request
+        
+        Args:
+            url (str): URL to request
+            endpoint (str): Endpoint name used to pick the cache TTL
+        
+        Returns:
+            tuple: (cache_key, ttl, cached, fresh); cache_key is None when caching is off,
+                and fresh is False for a stale response that should be revalidated
+        """
+        ttl = Config.CACHE_TTLS.get(endpoint, Config.CACHE_DEFAULT_TTL) if Config.CACHE_ENABLED else 0
+        cache_key = make_cache_key(url) if ttl > 0 else None
+        cached, fresh = self.cache.lookup(cache_key) if cache_key else (None, False)
+        return cache_key, ttl, cached, fresh
+    
+    def _revalidate(self, url: str, cache_key: str, ttl: float, endpoint: str):
+        """
+        Refresh a stale cache entry in the background
+        
+        Args:
+            url (str): URL to request
+            cache_key (str): Key of the stale entry
+            ttl (float): Endpoint TTL in seconds
+            endpoint (str): Endpoint name for metrics
+        """
+        CACHE_REVALIDATIONS.inc(self.service_name)
+        
+        def refresh():
+            # An earlier refresh may already have replaced the entry
+            if self.cache.get(cache_key) is not None:
+                return
+            try:
+                self.flights.do(cache_key, lambda: self._fetch(url, cache_key, ttl, endpoint))
+            except Exception as e:
+                self._log_error(url, endpoint, e)
+        
+        _revalidation_pool.submit(refresh)
+    
+    def _cache_store(self, cache_key: str, ttl: float, data: dict):
+        """
+        Store a successful response in the cache
+        
+        Args:
+            cache_key (str): Key from _cache_lookup, or None to skip caching
+            ttl (float): Endpoint TTL in seconds
+            data (dict): Parsed JSON response
+        """
+        if cache_key and isinstance(data, dict) and is_cacheable_response(data):
+            if is_empty_response(data):
+                ttl = min(ttl, Config.CACHE_NEGATIVE_TTL)
+            self.cache.set(cache_key, data, ttl)
     
     def validate_api_key(self, api_key: str, service_name: str) -> bool:
         """
@@ -37,11 +315,203 @@ class BaseAPIService:
         Args:
             api_key (str): API key to validate
             service_name (str): Name of the service for error messages
-            
+        
         Returns:
             bool: True if API key is valid
         """
         if not api_key:
-            print(f"Warning: {service_name} API key is missing")
+            logger.warning("API key is missing", extra={"service": service_name})
             return False
         return True
+
+
+class AsyncBaseAPIService(BaseAPIService):
+    """Asyncio variant of BaseAPIService sharing its cache and helpers"""
+    
+    flights = AsyncSingleFlight()
+    # Optional limiter with an async acquire(); set on background instances such as the cache warmer's
+    rate_limiter = None
+    
+    async def safe_request(self, url: str, endpoint: str = None, deadline=None) -> dict:
+        """
+        Make a safe non-blocking HTTP request with error handling and response caching
+        
+        Args:
+            url (str): URL to request
+            endpoint (str): Endpoint name used to pick the cache TTL
+            deadline (Deadline): Request budget; the call gets only its remaining time
+        
+        Returns:
+            dict: JSON response or empty dict on error
+        """
+        cache_key, ttl, cached, fresh = await self._cache_lookup(url, endpoint)
+        if cached is not None:
+            if not fresh:
+                self._revalidate(url, cache_key, ttl, endpoint)
+            return cached
+        
+        try:
+            self._check_budget(deadline)
+            await self._throttle()
+            data, shared = await self.flights.do(make_cache_key(url),
+                                                 lambda: self._fetch(url, cache_key, ttl, endpoint),
+                                                 timeout=deadline.remaining() if deadline else None)
+        except Exception as e:
+            self._log_error(url, endpoint, self._caller_error(e, deadline))
+            return {}
+        
+        return copy.deepcopy(data) if shared else data
+    
+    async def _fetch(self, url: str, cache_key: str, ttl: float, endpoint: str = None) -> dict:
+        """
+        Fetch a URL from upstream and cache the response
+        
+        Like the synchronous fetch, it runs without any caller's budget.
+        
+        Args:
+            url (str): URL to request
+            cache_key (str): Key from _cache_lookup, or None to skip caching
+            ttl (float): Endpoint TTL in seconds
+            endpoint (str): Endpoint name for metrics
+        
+        Returns:
+            dict: Parsed JSON response
+        """
+        if not self.breaker.allow_request():
+            raise CircuitOpenError(f"{self.service_name} circuit is open")
+        
+        try:
+            response, latency = await self._timed_get(url, self.breaker.timeout())
+        except asyncio.CancelledError:
+            # Cancelled with its event loop; says nothing about the upstream's health
+            self.breaker.release()
+            raise
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        self._record_health(response.status_code, latency, endpoint)
+        response.raise_for_status()
+        data = response.json()
+        self._cache_store(cache_key, ttl, data)
+        return data
+    
+    async def _cache_lookup(self, url: str, endpoint: str) -> tuple:
+        """
+        Look up a cached response without blocking the event loop
+        
+        Args:
+            url (str): URL to request
+            endpoint (str): Endpoint name used to pick the cache TTL
+        
+        Returns:
+            tuple: (cache_key, ttl, cached, fresh) as from BaseAPIService._cache_lookup
+        """
+        if not self.cache.blocking_io:
+            return super()._cache_lookup(url, endpoint)
+        return await asyncio.get_running_loop().run_in_executor(
+            _cache_read_pool, super()._cache_lookup, url, endpoint)
+    
+    def _cache_store(self, cache_key: str, ttl: float, data: dict):
+        """
+        Store a successful response in the cache without blocking the event loop
+        
+        Writes to a shared cache happen behind the response, on a copy so
+        callers can change the returned data.
+        
+        Args:
+            cache_key (str): Key from _cache_lookup, or None to skip caching
+            ttl (float): Endpoint TTL in seconds
+            data (dict): Parsed JSON response
+        """
+        if not self.cache.blocking_io:
+            super()._cache_store(cache_key, ttl, data)
+        elif cache_key:
+            _cache_write_pool.submit(super()._cache_store, cache_key, ttl, copy.deepcopy(data))
+    
+    def _revalidate(self, url: str, cache_key: str, ttl: float, endpoint: str):
+        """
+        Refresh a stale cache entry in a background task on the I/O loop
+        
+        The caller may be on a short-lived loop (a profiled request's) that is
+        closed as soon as its view returns, so the task never runs there.
+        
+        Args:
+            url (str): URL to request
+            cache_key (str): Key of the stale entry
+            ttl (float): Endpoint TTL in seconds
+            endpoint (str): Endpoint name for metrics
+        """
+        CACHE_REVALIDATIONS.inc(self.service_name)
+        future = asyncio.run_coroutine_threadsafe(self._refresh(url, cache_key, ttl, endpoint), get_io_loop())
+        _revalidation_tasks.add(future)
+        future.add_done_callback(_revalidation_tasks.discard)
+    
+    async def _refresh(self, url: str, cache_key: str, ttl: float, endpoint: str):
+        """Fetch a stale entry again unless an earlier refresh already replaced it"""
+        if self.cache.blocking_io:
+            current = await asyncio.get_running_loop().run_in_executor(_cache_read_pool, self.cache.get, cache_key)
+        else:
+            current = self.cache.get(cache_key)
+        if current is not None:
+            return
+        try:
+            await self._throttle()
+            await self.flights.do(cache_key, lambda: self._fetch(url, cache_key, ttl, endpoint))
+        except Exception as e:
+            self._log_error(url, endpoint, e)
+    
+    async def _throttle(self):
+        """
+        Wait for this instance's rate limiter, if it has one
+        
+        Called before joining a flight, so only this instance's callers wait;
+        the shared fetch itself never carries the throttle.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+    
+    async def _timed_get(self, url: str, timeout: float) -> tuple:
+        """
+        GET a URL within the upstream's concurrency limit and time it
+        
+        Args:
+            url (str): URL to request
+            timeout (float): Timeout in seconds for each attempt
+        
+        Returns:
+            tuple: (response, latency in seconds excluding the wait for a slot)
+        """
+        async with get_async_upstream_limit(self.service_name):
+            start = time.monotonic()
+            response = await self._get_with_retries(url, timeout)
+            return response, time.monotonic() - start
+    
+    async def _get_with_retries(self, url: str, timeout: float):
+        """
+        GET a URL, retrying throttled and 5xx responses with backoff
+        
+        Args:
+            url (str): URL to request
+            timeout (float): Timeout in seconds for each attempt
+        
+        Returns:
+            httpx.Response: Final response
+        """
+        client = get_async_client()
+        for attempt in range(Config.HTTP_MAX_RETRIES + 1):
+            response = await client.get(url, timeout=timeout)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == Config.HTTP_MAX_RETRIES:
+                return response
+            await asyncio.sleep(Config.HTTP_RETRY_BACKOFF * (2 ** attempt))
+        return response
+
+
+async def cancel_pending_fetches():
+    """
+    Cancel the shared fetches still running on the current event loop
+    
+    Call this before closing a short-lived loop's HTTP client. The fetches then
+    end as cancellations, which the circuit breakers ignore, and not as
+    connection errors counted against the upstream.
+    """
+    await AsyncBaseAPIService.flights.cancel_pending()
@@ -0,0 +1,169 @@
+"""
+Cache Warmer
+Pre-fetches mood genre pages at startup and keeps the most requested ones fresh
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from .io_loop import get_io_loop
+from config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRateLimiter:
+    """Spaces calls out to at most `rate` per second on one event loop"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0
+        self._next_slot = 0.0
+    
+    async def acquire(self):
+        """Wait for the next free slot"""
+        if not self.interval:
+            return
+        now = time.monotonic()
+        wait = self._next_slot - now
+        # Slots are claimed before sleeping, so concurrent callers queue up in order
+        self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class PageTraffic:
+    """Request counts per (mood, page) that decay every time the top pages are read"""
+    
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+    
+    def record(self, mood: str, page: int):
+        """
+        Count a request for a mood page
+        
+        Args:
+            mood (str): Detected mood
+            page (int): Page number
+        """
+        with self._lock:
+            key = (mood, page)
+            self._counts[key] = self._counts.get(key, 0) + 1
+    
+    def top(self, limit: int) -> list:
+        """
+        Get the most requested pages and halve all counts
+        
+        Halving makes recent traffic outweigh what was popular hours ago.
+        
+        Args:
+            limit (int): Maximum number of pages
+        
+        Returns:
+            list: (mood, page) tuples, most requested first
+        """
+        with self._lock:
+            ranked = sorted(self._counts.items(), key=lambda item: -item[1])[:limit]
+            self._counts = {key: count // 2 for key, count in self._counts.items() if count > 1}
+        return [key for key, _ in ranked]
+
+
+# Fed by user-facing mood searches only
+page_traffic = PageTraffic()
+
+
+class CacheWarmer:
+    """Background task on the I/O loop that keeps mood pages in the response cache"""
+    
+    def __init__(self, movie_service, traffic: PageTraffic = page_traffic):
+        # A dedicated movie service (built without traffic recording) whose upstream calls share one rate limit
+        self.movie_service = movie_service
+        self.traffic = traffic
+        limiter = AsyncRateLimiter(Config.CACHE_WARM_RATE)
+        for service in (movie_service.tmdb_service, movie_service.omdb_service, movie_service.youtube_service):
+            service.rate_limiter = limiter
+        self._future = None
+    
+    def start(self):
+        """Start warming on the I/O loop; later calls do nothing"""
+        if self._future is None:
+            self._future = asyncio.run_coroutine_threadsafe(self.run(), get_io_loop())
+    
+    def stop(self):
+        """Stop warming"""
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+    
+    def startup_targets(self) -> list:
+        """
+        Get every genre page worth warming at startup
+        
+        Moods that share a TMDb genre and OMDb fallback produce the same page,
+        so one mood stands in for each group.
+        
+        Returns:
+            list: (mood, page) tuples, first pages of every genre first
+        """
+        detector = self.movie_service.mood_detector
+        moods = {}
+        for mood in Config.TMDB_GENRE_IDS:
+            moods.setdefault((detector.get_genre_id(mood), detector.get_fallback_genre(mood)), mood)
+        pages = min(Config.CACHE_WARM_PAGES, Config.MAX_PAGES)
+        return [(mood, page) for page in range(1, pages + 1) for mood in moods.values()]
+    
+    async def run(self):
+        """Warm all genre pages, then refresh the most requested pages periodically"""
+        services = self.movie_service.get_available_services()
+        if not services["tmdb"] and not services["omdb"]:
+            return
+        
+        targets = self.startup_targets()
+        started = time.monotonic()
+        await self.warm(targets)
+        logger.info("Cache warmed", extra={"pages": len(targets), "seconds": round(time.monotonic() - started, 1)})
+        
+        while True:
+            await asyncio.sleep(Config.CACHE_REFRESH_INTERVAL)
+            await self.warm(self.traffic.top(Config.CACHE_REFRESH_TOP_PAGES))
+    
+    async def warm(self, targets: list):
+        """
+        Load pages through the normal search path
+        
+        Fresh entries are cache hits, stale ones are served and refreshed in
+        the background, and missing ones are fetched; all upstream calls wait
+        for the rate limiter.
+        
+        Args:
+            targets (list): (mood, page) tuples
+        """
+        for mood, page in targets:
+            try:
+                await self.movie_service.search_by_mood(mood, page, mood=mood)
+            except Exception as e:
+                logger.warning("Cache warming failed", extra={"mood": mood, "page": page, "error": str(e)})
+
+
+_warmer = None
+_warmer_lock = threading.Lock()
+
+
+def start_cache_warmer(movie_service) -> CacheWarmer:
+    """
+    Start the process-wide cache warmer once
+    
+    Args:
+        movie_service (AsyncMovieService): Service built without traffic recording
+    
+    Returns:
+        CacheWarmer: Running warmer
+    """
+    global _warmer
+    with _warmer_lock:
+        if _warmer is None:
+            _warmer = CacheWarmer(movie_service)
+            _warmer.start()
+        return _warmer
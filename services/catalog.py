@@ -0,0 +1,282 @@
+"""
+Catalog Snapshot
+Memory-mapped, genre-indexed file of ready-to-render movies for mood searches
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse, parse_qs
+from .youtube_service import build_watch_url
+from config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+# File layout, all little-endian:
+#   header   magic, built_at, genre count
+#   genres   one (genre_id, total_results, first ref, ref count) row per genre, sorted by genre_id
+#   refs     one (offset, length) row per movie slot, in display order per genre
+#   records  compact JSON movies; a movie listed under several genres is stored once
+MAGIC = b"MDRCAT01"
+HEADER = struct.Struct("<8sdI")
+GENRE = struct.Struct("<IIII")
+REF = struct.Struct("<II")
+
+
+def write_catalog(path: str, genres: dict):
+    """
+    Write a catalog snapshot atomically
+    
+    Args:
+        path (str): Snapshot file
+        genres (dict): genre_id -> (total_results, movies in display order)
+    """
+    records = bytearray()
+    offsets = {}
+    genre_rows = []
+    refs = []
+    
+    for genre_id in sorted(genres):
+        total_results, movies = genres[genre_id]
+        genre_rows.append((genre_id, total_results, len(refs), len(movies)))
+        for movie in movies:
+            record = json.dumps(movie, separators=(",", ":"), sort_keys=True).encode("utf-8")
+            if record not in offsets:
+                offsets[record] = len(records)
+                records += record
+            refs.append((offsets[record], len(record)))
+    
+    records_start = HEADER.size + GENRE.size * len(genre_rows) + REF.size * len(refs)
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Readers keep mapping the old file until they notice the new one
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".catalog-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(HEADER.pack(MAGIC, time.time(), len(genre_rows)))
+            for row in genre_rows:
+                file.write(GENRE.pack(*row))
+            for offset, length in refs:
+                file.write(REF.pack(records_start + offset, length))
+            file.write(records)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class _MappedCatalog:
+    """One opened snapshot file; replaced as a whole when the file changes"""
+    
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            self.stat = os.fstat(file.fileno())
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, self.built_at, genre_count = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a catalog snapshot")
+        # The genre table is tiny; everything else stays in the mapping
+        self.genres = {}
+        for index in range(genre_count):
+            genre_id, total_results, first, count = GENRE.unpack_from(self.data, HEADER.size + index * GENRE.size)
+            self.genres[genre_id] = (total_results, first, count)
+        self.refs_start = HEADER.size + GENRE.size * genre_count
+    
+    def read_movies(self, genre_id: int, start: int, stop: int) -> list:
+        """
+        Decode the movies in one slice of a genre
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            start (int): First position, inclusive
+            stop (int): Last position, exclusive
+        
+        Returns:
+            list: Movie dicts
+        """
+        _, first, count = self.genres[genre_id]
+        movies = []
+        for position in range(first + start, first + min(stop, count)):
+            offset, length = REF.unpack_from(self.data, self.refs_start + position * REF.size)
+            movies.append(json.loads(self.data[offset:offset + length]))
+        return movies
+
+
+class CatalogSnapshot:
+    """Read side of the catalog snapshot, reloaded when the file is rebuilt"""
+    
+    # Seconds between checks for a rebuilt file
+    RELOAD_INTERVAL = 5
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._mapped = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+    
+    def get_page(self, genre_id: int, page: int, page_size: int) -> tuple:
+        """
+        Get one page of movies for a genre
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            page (int): Page number, starting at 1
+            page_size (int): Movies per page
+        
+        Returns:
+            tuple: (movies_list, total_results) or None when the snapshot does not cover the page;
+                total_results is TMDb's count at build time, so page counts match live results
+        """
+        mapped = self._current()
+        if mapped is None or genre_id not in mapped.genres:
+            return None
+        
+        total_results, _, count = mapped.genres[genre_id]
+        start = (page - 1) * page_size
+        # A page cut short by the snapshot's size (not by the genre's) must come from the live API
+        if page < 1 or start >= count or (start + page_size > count and count < total_results):
+            return None
+        
+        movies = mapped.read_movies(genre_id, start, start + page_size)
+        for movie in movies:
+            if movie.get("trailer_key"):
+                movie["trailer"] = build_watch_url(movie["trailer_key"])
+        return movies, total_results
+    
+    def info(self) -> dict:
+        """
+        Describe the loaded snapshot
+        
+        Returns:
+            dict: built_at and movies per genre, or None if no snapshot is loaded
+        """
+        mapped = self._current()
+        if mapped is None:
+            return None
+        return {
+            "built_at": mapped.built_at,
+            "genres": {genre_id: count for genre_id, (_, _, count) in mapped.genres.items()},
+        }
+    
+    def _current(self):
+        """
+        Get the mapped snapshot, reopening it if the file was replaced
+        
+        Returns:
+            _MappedCatalog: Current snapshot or None if there is no readable file
+        """
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.RELOAD_INTERVAL:
+            return self._mapped
+        
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.RELOAD_INTERVAL:
+                return self._mapped
+            try:
+                stat = os.stat(self.path)
+                mapped = self._mapped
+                if mapped is None or (stat.st_ino, stat.st_mtime_ns) != (mapped.stat.st_ino, mapped.stat.st_mtime_ns):
+                    # The old mapping is not closed; requests still reading it keep it alive
+                    self._mapped = _MappedCatalog(self.path)
+            except FileNotFoundError:
+                self._mapped = None
+            except (OSError, ValueError, struct.error) as e:
+                logger.warning("Catalog snapshot unreadable", extra={"path": self.path, "error": str(e)})
+                self._mapped = None
+            self._checked_at = now
+            return self._mapped
+
+
+def build_catalog(movie_service, path: str, per_genre: int, youtube_trailers: bool = False, progress=None) -> dict:
+    """
+    Fetch the most popular movies of every mood genre and write a snapshot
+    
+    Details come from TMDb; OMDb fills in a missing plot or poster. Trailers
+    are the ones TMDb lists, or a YouTube search if youtube_trailers is set.
+    
+    Args:
+        movie_service (MovieService): Synchronous movie service
+        path (str): Snapshot file
+        per_genre (int): Movies to keep per genre
+        youtube_trailers (bool): Search YouTube for movies TMDb lists no trailer for
+        progress (callable): Called with (genre_id, movie count) after each genre
+    
+    Returns:
+        dict: genre_id -> number of movies written
+    """
+    tmdb_service = movie_service.tmdb_service
+    genres = {}
+    for genre_id in sorted(set(Config.TMDB_GENRE_IDS.values())):
+        results = []
+        total_results = 0
+        upstream_page = 1
+        while len(results) < per_genre and upstream_page <= Config.TMDB_MAX_PAGES:
+            discover = tmdb_service.discover_movies(genre_id, upstream_page)
+            if not discover.results:
+                break
+            results.extend(discover.results)
+            total_results = discover.total_results
+            if upstream_page >= discover.total_pages:
+                break
+            upstream_page += 1
+        
+        movies = list(movie_service.executor.map(
+            lambda result: _catalog_entry(movie_service, result, youtube_trailers), results[:per_genre]))
+        movies = [movie for movie in movies if movie]
+        if movies:
+            genres[genre_id] = (total_results, movies)
+        if progress:
+            progress(genre_id, len(movies))
+    
+    write_catalog(path, genres)
+    return {genre_id: len(movies) for genre_id, (_, movies) in genres.items()}
+
+
+def _catalog_entry(movie_service, result: dict, youtube_trailers: bool) -> dict:
+    """
+    Build the snapshot entry for one discover result
+    
+    Args:
+        movie_service (MovieService): Synchronous movie service
+        result (dict): Raw TMDb discover result
+        youtube_trailers (bool): Search YouTube if TMDb lists no trailer
+    
+    Returns:
+        dict: Formatted movie with trailer_key but without the derived trailer URL
+    """
+    movie = movie_service.tmdb_service.format_movie_data(result)
+    if not movie:
+        return None
+    
+    if movie.get("imdbID") and (not movie.get("Plot") or movie.get("Poster") == "N/A") \
+            and movie_service.omdb_service.is_available():
+        details = movie_service.omdb_service.get_movie_details(movie["imdbID"])
+        if details.get("Response") != "False":
+            if not movie.get("Plot") and details.get("Plot") not in (None, "", "N/A"):
+                movie["Plot"] = details["Plot"]
+            if movie.get("Poster") == "N/A" and details.get("Poster"):
+                movie["Poster"] = details["Poster"]
+    
+    if not movie.get("trailer_key") and youtube_trailers and movie_service.youtube_service.is_available():
+        trailer = movie_service.youtube_service.get_trailer_url(movie.get("Title", ""), movie.get("Year"))
+        if trailer:
+            video_id = parse_qs(urlparse(trailer).query).get("v")
+            if video_id:
+                movie["trailer_key"] = video_id[0]
+    
+    movie.pop("trailer", None)
+    # A card without TMDb details is still worth listing; the flag only matters for live pages
+    movie.pop("missing", None)
+    return movie
+
+
+# Shared by every movie service in the process
+catalog = CatalogSnapshot(Config.CATALOG_PATH) if Config.CATALOG_ENABLED else None
@@ -0,0 +1,207 @@
+"""
+Circuit Breaker
+Per-upstream health tracking, circuit breaking and adaptive timeouts
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is skipped because its upstream circuit is open"""
+
+
+class LatencyTracker:
+    """Sliding window of recent successful request latencies"""
+    
+    def __init__(self, window: int):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+    
+    def record(self, seconds: float):
+        """
+        Record a request latency
+        
+        Args:
+            seconds (float): Observed latency in seconds
+        """
+        with self._lock:
+            self._samples.append(seconds)
+    
+    def percentile(self, percent: float) -> float:
+        """
+        Get a latency percentile over the window
+        
+        Args:
+            percent (float): Percentile between 0 and 100
+        
+        Returns:
+            float: Latency in seconds or None if there are no samples
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percent / 100))
+        return samples[index]
+    
+    def __len__(self):
+        return len(self._samples)
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for one upstream"""
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, name: str, failure_threshold: int, recovery_timeout: float, half_open_probes: int = 1):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.latency = LatencyTracker(Config.LATENCY_WINDOW)
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def state(self) -> str:
+        """
+        Get the current state, moving an expired open circuit to half-open
+        
+        Returns:
+            str: "closed", "open" or "half_open"
+        """
+        with self._lock:
+            return self._current_state()
+    
+    def allow_request(self) -> bool:
+        """
+        Check if a request may be sent upstream
+        
+        While half-open only a limited number of probe requests get through.
+        
+        Returns:
+            bool: True if the request may proceed
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return True
+            return False
+    
+    def record_success(self, latency: float):
+        """
+        Record a healthy response and close the circuit
+        
+        Args:
+            latency (float): Request latency in seconds
+        """
+        self.latency.record(latency)
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Circuit closed", extra={"service": self.name})
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes_in_flight = 0
+    
+    def record_failure(self):
+        """Record a failed request, opening the circuit past the threshold"""
+        with self._lock:
+            self._failures += 1
+            # A failed probe re-opens at once; otherwise wait for the threshold
+            if self._current_state() == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning("Circuit opened", extra={"service": self.name, "failures": self._failures})
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probes_in_flight = 0
+    
+    def release(self):
+        """Give back a half-open probe slot whose request ended without a verdict"""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes_in_flight:
+                self._probes_in_flight -= 1
+    
+    def timeout(self) -> float:
+        """
+        Get the request timeout derived from observed latency
+        
+        Returns:
+            float: Timeout in seconds, between TIMEOUT_MIN and REQUEST_TIMEOUT
+        """
+        if not Config.ADAPTIVE_TIMEOUTS or len(self.latency) < Config.LATENCY_MIN_SAMPLES:
+            return Config.REQUEST_TIMEOUT
+        observed = self.latency.percentile(Config.TIMEOUT_PERCENTILE)
+        return max(Config.TIMEOUT_MIN, min(observed * Config.TIMEOUT_MULTIPLIER, Config.REQUEST_TIMEOUT))
+    
+    def stats(self) -> dict:
+        """
+        Get breaker health statistics
+        
+        Returns:
+            dict: State, failure count, latency percentiles and current timeout
+        """
+        return {
+            "state": self.state,
+            "failures": self._failures,
+            "samples": len(self.latency),
+            "p50": self.latency.percentile(50),
+            "p99": self.latency.percentile(99),
+            "timeout": self.timeout(),
+        }
+    
+    def _current_state(self) -> str:
+        """Get the state; caller must hold the lock"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = self.HALF_OPEN
+            self._probes_in_flight = 0
+        return self._state
+
+
+# One breaker per upstream, shared by the sync and async services
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(service_name: str) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for an upstream
+    
+    Args:
+        service_name (str): Upstream name (e.g. "tmdb")
+    
+    Returns:
+        CircuitBreaker: Breaker for the upstream
+    """
+    with _breakers_lock:
+        breaker = _breakers.get(service_name)
+        if breaker is None:
+            breaker = CircuitBreaker(service_name, Config.CIRCUIT_FAILURE_THRESHOLD,
+                                     Config.CIRCUIT_RECOVERY_TIMEOUT, Config.CIRCUIT_HALF_OPEN_PROBES)
+            _breakers[service_name] = breaker
+        return breaker
+
+
+def all_breakers() -> dict:
+    """
+    Get every breaker created so far
+    
+    Returns:
+        dict: Upstream name -> CircuitBreaker
+    """
+    with _breakers_lock:
+        return dict(_breakers)
@@ -0,0 +1,39 @@
+"""
+Request Deadline
+End-to-end latency budget passed down to every upstream call
+"""
+
+import time
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a call is skipped because the request budget is spent"""
+
+
+class Deadline:
+    """Point in time by which a request must be answered"""
+    
+    def __init__(self, budget: float):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+    
+    def remaining(self) -> float:
+        """
+        Get the time left in the budget
+        
+        Returns:
+            float: Seconds left, never negative
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def expired(self) -> bool:
+        """
+        Check if the budget is spent
+        
+        Returns:
+            bool: True once the deadline has passed
+        """
+        return time.monotonic() >= self.expires_at
+    
+    def __repr__(self):
+        return f"Deadline(remaining={self.remaining():.3f}s)"
@@ -0,0 +1,119 @@
+"""
+HTTP Session Pool
+Shares keep-alive connection pools per upstream host
+"""
+
+import asyncio
+import threading
+import weakref
+from urllib.parse import urlparse
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import Config
+
+
+# Status codes worth retrying for idempotent GETs
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# httpx.AsyncClient is bound to the event loop it was first used on
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _build_session() -> requests.Session:
+    """
+    Build a pooled session with bounded retries
+    
+    Returns:
+        requests.Session: Configured session
+    """
+    retries = Retry(
+        total=Config.HTTP_MAX_RETRIES,
+        connect=Config.HTTP_MAX_RETRIES,
+        read=Config.HTTP_MAX_RETRIES,
+        status=Config.HTTP_MAX_RETRIES,
+        backoff_factor=Config.HTTP_RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        # Upstream Retry-After values can be minutes long; keep retries bounded
+        respect_retry_after_header=False,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=Config.HTTP_POOL_SIZE,
+        max_retries=retries,
+        # Block instead of opening throwaway connections when the pool is busy
+        pool_block=True,
+    )
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive" if Config.HTTP_KEEP_ALIVE else "close"
+    return session
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Get the shared session for the host of a URL
+    
+    Args:
+        url (str): URL that will be requested
+    
+    Returns:
+        requests.Session: Session pooling connections to that host
+    """
+    parsed = urlparse(url)
+    host = f"{parsed.scheme}://{parsed.netloc}"
+    
+    session = _sessions.get(host)
+    if session is None:
+        with _sessions_lock:
+            session = _sessions.get(host)
+            if session is None:
+                session = _build_session()
+                _sessions[host] = session
+    return session
+
+
+def close_sessions():
+    """Close all pooled sessions and their connections"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client for the running event loop
+    
+    One client pools keep-alive connections to every upstream host.
+    
+    Returns:
+        httpx.AsyncClient: Pooled async client
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        limits = httpx.Limits(
+            max_connections=Config.HTTP_ASYNC_MAX_CONNECTIONS,
+            max_keepalive_connections=Config.HTTP_ASYNC_MAX_CONNECTIONS if Config.HTTP_KEEP_ALIVE else 0,
+        )
+        # Transport retries cover connection errors; status retries happen in the service
+        transport = httpx.AsyncHTTPTransport(retries=Config.HTTP_MAX_RETRIES, limits=limits)
+        client = httpx.AsyncClient(transport=transport, limits=limits)
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client():
+    """Close the async client of the running event loop"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,85 @@
+"""
+I/O Event Loop
+Long-lived background event loop for async upstream calls
+"""
+
+import asyncio
+import threading
+
+
+_io_loop = None
+_io_loop_lock = threading.Lock()
+
+
+def get_io_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the background event loop, starting it on first use
+    
+    Flask runs each async view on its own short-lived loop. Running upstream
+    calls on one long-lived loop lets every request share its connection
+    pool, limiters and in-flight requests.
+    
+    Returns:
+        asyncio.AbstractEventLoop: Running background loop
+    """
+    global _io_loop
+    with _io_loop_lock:
+        if _io_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name="io-loop", daemon=True)
+            thread.start()
+            _io_loop = loop
+        return _io_loop
+
+
+async def run_on_io_loop(coro):
+    """
+    Await a coroutine on the background event loop
+    
+    Args:
+        coro (coroutine): Coroutine to run
+    
+    Returns:
+        object: Result of the coroutine
+    """
+    loop = get_io_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+def run_sync(coro):
+    """
+    Run a coroutine on the background event loop from synchronous code
+    
+    Args:
+        coro (coroutine): Coroutine to run
+    
+    Returns:
+        object: Result of the coroutine
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_io_loop()).result()
+
+
+def iterate_sync(agen):
+    """
+    Iterate an async generator on the background event loop from synchronous code
+    
+    Lets a WSGI streaming response consume events produced on the I/O loop.
+    Closing the iterator (e.g. when the client disconnects) closes the
+    async generator.
+    
+    Args:
+        agen (async generator): Async generator to consume
+    
+    Yields:
+        object: Items of the async generator
+    """
+    try:
+        while True:
+            try:
+                yield run_sync(agen.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        run_sync(agen.aclose())
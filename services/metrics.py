@@ -0,0 +1,260 @@
+"""
+Metrics
+In-process counters and latency histograms exposed in Prometheus text format
+"""
+
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from .response_cache import response_cache
+from .page_cache import page_cache
+from .circuit_breaker import CircuitBreaker, all_breakers
+
+
+# Upper bounds in seconds; tuned for upstream calls between ~10 ms and the 5 s timeout
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(label_names: tuple, label_values: tuple, extra: str = "") -> str:
+    """Render a Prometheus label set such as {service="tmdb"}"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    """Monotonic counter with labels"""
+    
+    kind = "counter"
+    
+    def __init__(self, name: str, help_text: str, label_names: tuple = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, *label_values, amount: float = 1):
+        """
+        Increase the counter
+        
+        Args:
+            *label_values: Values for the counter's labels, in order
+            amount (float): Increment
+        """
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+    
+    def value(self, *label_values) -> float:
+        """
+        Get the current value for a label set
+        
+        Returns:
+            float: Counter value
+        """
+        with self._lock:
+            return self._values.get(label_values, 0)
+    
+    def collect(self) -> list:
+        """
+        Render the counter's samples
+        
+        Returns:
+            list: Exposition lines
+        """
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {value}" for labels, value in items]
+
+
+class Histogram:
+    """Cumulative-bucket histogram with labels"""
+    
+    kind = "histogram"
+    
+    def __init__(self, name: str, help_text: str, label_names: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., count, sum]
+        self._series = {}
+        self._lock = threading.Lock()
+    
+    def observe(self, value: float, *label_values):
+        """
+        Record an observation
+        
+        Args:
+            value (float): Observed value, in seconds for latencies
+            *label_values: Values for the histogram's labels, in order
+        """
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+    
+    def collect(self) -> list:
+        """
+        Render the histogram's samples
+        
+        Returns:
+            list: Exposition lines
+        """
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._series.items())
+        lines = []
+        for labels, series in items:
+            for bound, count in zip(self.buckets + ("+Inf",), series[:-2] + [series[-2]]):
+                bucket_labels = _format_labels(self.label_names, labels, 'le="%s"' % bound)
+                lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {series[-2]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {series[-1]}")
+        return lines
+
+
+class Gauge:
+    """Metric whose samples are read from a callback at scrape time"""
+    
+    def __init__(self, name: str, help_text: str, label_names: tuple, read, kind: str = "gauge"):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        # read() returns {label values tuple: value}
+        self.read = read
+        # "counter" for totals kept elsewhere, such as the response cache's hit count
+        self.kind = kind
+    
+    def collect(self) -> list:
+        """
+        Render the gauge's samples
+        
+        Returns:
+            list: Exposition lines
+        """
+        return [f"{self.name}{_format_labels(self.label_names, labels)} {value}"
+                for labels, value in sorted(self.read().items())]
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together"""
+    
+    def __init__(self):
+        self._metrics = []
+    
+    def register(self, metric):
+        """
+        Add a metric to the registry
+        
+        Args:
+            metric: Counter, Histogram or Gauge
+        
+        Returns:
+            The registered metric
+        """
+        self._metrics.append(metric)
+        return metric
+    
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format
+        
+        Returns:
+            str: Exposition text
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.help_text}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+UPSTREAM_LATENCY = registry.register(Histogram(
+    "moodora_upstream_request_seconds", "Latency of upstream API requests that reached the network",
+    ("service", "endpoint", "status")))
+UPSTREAM_ERRORS = registry.register(Counter(
+    "moodora_upstream_errors_total", "Upstream API requests that returned no data",
+    ("service", "endpoint", "reason")))
+CACHE_REVALIDATIONS = registry.register(Counter(
+    "moodora_cache_revalidations_total", "Stale responses served while being refreshed in the background",
+    ("service",)))
+STAGE_LATENCY = registry.register(Histogram(
+    "moodora_stage_seconds", "Time spent in each stage of building a results page", ("stage",)))
+
+
+def _cache_samples(field: str):
+    return lambda: {("response",): response_cache.stats()[field], ("page",): page_cache.stats()[field]}
+
+
+def _circuit_samples() -> dict:
+    # 0 = closed, 1 = half-open, 2 = open
+    levels = {CircuitBreaker.CLOSED: 0, CircuitBreaker.HALF_OPEN: 1, CircuitBreaker.OPEN: 2}
+    return {(name,): levels[breaker.state] for name, breaker in all_breakers().items()}
+
+
+# Every cache metric has a "cache" label: "response" (upstream API responses) or "page" (rendered pages)
+registry.register(Gauge("moodora_cache_hits_total", "Cache hits", ("cache",), _cache_samples("hits"), "counter"))
+registry.register(Gauge("moodora_cache_misses_total", "Cache misses", ("cache",), _cache_samples("misses"), "counter"))
+registry.register(Gauge("moodora_cache_evictions_total", "Cache evictions", ("cache",),
+                        _cache_samples("evictions"), "counter"))
+registry.register(Gauge("moodora_cache_hit_ratio", "Cache hits per lookup since start", ("cache",),
+                        _cache_samples("hit_ratio")))
+registry.register(Gauge("moodora_cache_entries", "Entries held in the cache", ("cache",), _cache_samples("entries")))
+registry.register(Gauge("moodora_cache_bytes", "Bytes held in the cache", ("cache",), _cache_samples("bytes")))
+registry.register(Gauge("moodora_circuit_state", "Upstream circuit state: 0 closed, 1 half-open, 2 open",
+                        ("service",), _circuit_samples))
+
+
+# Stage timings of the current request, collected only while a profiler asks for them
+_request_stages = contextvars.ContextVar("request_stages", default=None)
+
+
+@contextmanager
+def time_stage(stage: str):
+    """
+    Time a stage of building a results page
+    
+    Args:
+        stage (str): Stage name such as "discover"
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_LATENCY.observe(elapsed, stage)
+        stages = _request_stages.get()
+        if stages is not None:
+            stages[stage] = stages.get(stage, 0.0) + elapsed
+
+
+@contextmanager
+def collect_stages():
+    """
+    Collect the stage timings of the code run inside the block
+    
+    Tasks and threads started inside the block report into the same dict.
+    
+    Yields:
+        dict: Stage name -> total seconds, filled in as stages finish
+    """
+    stages = {}
+    token = _request_stages.set(stages)
+    try:
+        yield stages
+    finally:
+        _request_stages.reset(token)
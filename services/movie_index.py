@@ -0,0 +1,175 @@
+"""
+Movie Index
+Persistent cross-source movie records keyed by IMDb and TMDb IDs
+"""
+
+import json
+import logging
+import sqlite3
+import time
+from .sqlite_store import SQLiteStore
+from config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+# Fields a result card needs; a record with all of them fresh replaces a details call
+CARD_FIELDS = ("Title", "Year", "Plot", "Poster")
+
+# Response markers and derived values that are never stored
+SKIPPED_FIELDS = {"Response", "Error", "trailer", "missing"}
+
+
+def is_empty(value) -> bool:
+    """
+    Check if a field value carries no information
+    
+    Args:
+        value: Field value from either provider
+    
+    Returns:
+        bool: True for None, empty values and OMDb's "N/A"
+    """
+    return value is None or value == "" or value == "N/A" or value == []
+
+
+class MovieIndex(SQLiteStore):
+    """On-disk movie records merged from TMDb and OMDb with per-field freshness"""
+    
+    # fields maps each field name to [value, fetched_at], so every field ages on its own
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS movies (
+            id INTEGER PRIMARY KEY,
+            imdb_id TEXT UNIQUE,
+            tmdb_id INTEGER UNIQUE,
+            fields TEXT NOT NULL
+        );
+    """
+    
+    def __init__(self, path: str, ttl: int):
+        super().__init__(path)
+        # Each field expires ttl seconds after the provider last sent it
+        self.ttl = ttl
+    
+    def lookup(self, imdb_id: str = None, tmdb_id=None, required: tuple = CARD_FIELDS) -> dict:
+        """
+        Get the fresh fields of a movie
+        
+        Args:
+            imdb_id (str): IMDb ID of the movie
+            tmdb_id (int): TMDb ID of the movie
+            required (tuple): Fields that must all be fresh
+        
+        Returns:
+            dict: Fresh fields plus the known IDs, or None if unknown or a required field is stale
+        """
+        try:
+            row = self._find(self.connection, imdb_id, tmdb_id)
+        except sqlite3.Error as e:
+            logger.warning("Movie index read failed", extra={"error": str(e)})
+            return None
+        if row is None:
+            return None
+        
+        _, row_imdb_id, row_tmdb_id, fields = row
+        now = time.time()
+        movie = {field: value for field, (value, fetched_at) in json.loads(fields).items()
+                 if fetched_at + self.ttl > now}
+        if not all(field in movie for field in required):
+            return None
+        
+        if row_imdb_id:
+            movie["imdbID"] = row_imdb_id
+        if row_tmdb_id:
+            movie["tmdb_id"] = row_tmdb_id
+        return movie
+    
+    def store(self, record: dict):
+        """
+        Merge a movie record from either provider into the index
+        
+        Non-empty values replace what is stored and restart their field's
+        freshness. Empty values only fill fields nothing else has provided.
+        
+        Args:
+            record (dict): Formatted TMDb movie or OMDb details, with imdbID and/or tmdb_id
+        """
+        imdb_id = record.get("imdbID") or None
+        tmdb_id = int(record["tmdb_id"]) if record.get("tmdb_id") else None
+        if imdb_id is None and tmdb_id is None:
+            return
+        
+        now = time.time()
+        connection = self.connection
+        try:
+            # IMMEDIATE takes the write lock before reading, so concurrent merges never lose fields
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._merge(connection, imdb_id, tmdb_id, record, now)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning("Movie index write failed", extra={"error": str(e)})
+    
+    def _merge(self, connection: sqlite3.Connection, imdb_id: str, tmdb_id: int, record: dict, now: float):
+        """Merge one record; caller must hold a write transaction"""
+        rows = connection.execute(
+            "SELECT id, imdb_id, tmdb_id, fields FROM movies WHERE imdb_id = ? OR tmdb_id = ?",
+            (imdb_id, tmdb_id)).fetchall()
+        
+        # A movie first seen under one ID and then the other can have two rows; fold them into one
+        fields = {}
+        for _, row_imdb_id, row_tmdb_id, row_fields in rows:
+            imdb_id = imdb_id or row_imdb_id
+            tmdb_id = tmdb_id or row_tmdb_id
+            for field, entry in json.loads(row_fields).items():
+                if field not in fields or entry[1] > fields[field][1]:
+                    fields[field] = entry
+        
+        for field, value in record.items():
+            if field in SKIPPED_FIELDS or field in ("imdbID", "tmdb_id"):
+                continue
+            if is_empty(value) and field in fields and not is_empty(fields[field][0]):
+                continue
+            fields[field] = [value, now]
+        
+        payload = json.dumps(fields, separators=(",", ":"))
+        for row in rows[1:]:
+            connection.execute("DELETE FROM movies WHERE id = ?", (row[0],))
+        if rows:
+            connection.execute("UPDATE movies SET imdb_id = ?, tmdb_id = ?, fields = ? WHERE id = ?",
+                               (imdb_id, tmdb_id, payload, rows[0][0]))
+        else:
+            connection.execute("INSERT INTO movies (imdb_id, tmdb_id, fields) VALUES (?, ?, ?)",
+                               (imdb_id, tmdb_id, payload))
+    
+    @staticmethod
+    def _find(connection: sqlite3.Connection, imdb_id: str, tmdb_id) -> tuple:
+        if imdb_id:
+            row = connection.execute(
+                "SELECT id, imdb_id, tmdb_id, fields FROM movies WHERE imdb_id = ?", (imdb_id,)).fetchone()
+            if row is not None:
+                return row
+        if tmdb_id:
+            try:
+                tmdb_id = int(tmdb_id)
+            except (TypeError, ValueError):
+                return None
+            return connection.execute(
+                "SELECT id, imdb_id, tmdb_id, fields FROM movies WHERE tmdb_id = ?", (tmdb_id,)).fetchone()
+        return None
+
+
+def create_movie_index():
+    """
+    Open the configured movie index
+    
+    Returns:
+        MovieIndex: Index or None when MOVIE_INDEX_ENABLED is off
+    """
+    if not Config.MOVIE_INDEX_ENABLED:
+        return None
+    return MovieIndex(Config.MOVIE_INDEX_PATH, Config.MOVIE_INDEX_TTL)
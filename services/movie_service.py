@@ -3,13 +3,72 @@ Movie Service
 Orchestrates movie searches across different APIs
 """
 
-from .omdb_service import OMDbService
-from .tmdb_service import TMDbService
-from .youtube_service import YouTubeService
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from .omdb_service import OMDbService, AsyncOMDbService
+from .tmdb_service import TMDbService, AsyncTMDbService
+from .youtube_service import YouTubeService, AsyncYouTubeService
+from .pagination import VirtualPaginator
+from .deadline import Deadline
+from .metrics import time_stage
+from .cache_warmer import page_traffic
+from .catalog import catalog
 from mood_detector import MoodDetector
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+def flag_missing(movie: dict, deadline: Deadline, failed: list = None) -> dict:
+    """
+    Mark fields left empty because a lookup failed or the request budget ran out
+    
+    Flagged cards are shown as incomplete and keep their page out of the page cache.
+    
+    Args:
+        movie (dict): Movie data
+        deadline (Deadline): Request budget, if any
+        failed (list): Fields whose lookup returned nothing, whatever the reason
+    
+    Returns:
+        dict: The movie, with a "missing" list of field names when flagged
+    """
+    missing = list(movie.get("missing") or []) + list(failed or [])
+    if deadline is not None and deadline.expired():
+        # Lazy trailers are missing on purpose and have their own button; without a key none are searched
+        fields = ["Plot"] if Config.LAZY_TRAILERS or not Config.YOUTUBE_API_KEY else ["Plot", "trailer"]
+        missing += [field for field in fields if not movie.get(field)]
+    if missing:
+        movie["missing"] = list(dict.fromkeys(missing))
+    return movie
+
+
+def read_catalog_page(mood_detector: MoodDetector, paginator: VirtualPaginator, mood: str, page: int) -> tuple:
+    """
+    Get a mood page from the catalog snapshot
+    
+    Args:
+        mood_detector (MoodDetector): Maps the mood to its TMDb genre
+        paginator (VirtualPaginator): Computes the page count
+        mood (str): Detected mood
+        page (int): Page number for pagination
+    
+    Returns:
+        tuple: (movies_list, total_pages) or None if the snapshot does not cover the page
+    """
+    if catalog is None or not mood_detector.is_valid_mood(mood):
+        return None
+    
+    with time_stage("catalog"):
+        snapshot_page = catalog.get_page(mood_detector.get_genre_id(mood), page, Config.MAX_MOVIES_PER_PAGE)
+    if snapshot_page is None:
+        return None
+    movies, total_results = snapshot_page
+    return movies, paginator.total_pages(total_results)
+
+
 class MovieService:
     """Main service for movie operations"""
     
@@ -18,13 +77,24 @@ class MovieService:
         self.tmdb_service = TMDbService()
         self.youtube_service = YouTubeService()
         self.mood_detector = MoodDetector()
+        self.paginator = VirtualPaginator(Config.MAX_MOVIES_PER_PAGE, Config.TMDB_PAGE_SIZE,
+                                          Config.MAX_PAGES, Config.TMDB_MAX_PAGES)
+        # Bounded pool shared by all enrichment fan-outs; per-upstream limits
+        # are enforced inside each service's safe_request
+        self.executor = ThreadPoolExecutor(max_workers=Config.ENRICHMENT_WORKERS,
+                                           thread_name_prefix="enrichment")
+        # Whole genre pages of a batch search; kept apart from the enrichment pool their
+        # own fan-outs use, so pages waiting on enrichment can never starve it
+        self.group_executor = ThreadPoolExecutor(max_workers=max(1, len(Config.TMDB_GENRE_IDS)),
+                                                 thread_name_prefix="batch-group")
     
-    def search_by_name(self, movie_name: str) -> list:
+    def search_by_name(self, movie_name: str, deadline=None) -> list:
         """
         Search movies by name using OMDb
         
         Args:
             movie_name (str): Movie name to search
+            deadline (Deadline): Request budget, if any
             
         Returns:
             list: List of movie results
@@ -32,18 +102,20 @@ class MovieService:
         if not movie_name or not movie_name.strip():
             return []
         
-        movies = self.omdb_service.search_movies_by_name(movie_name.strip())
+        with time_stage("search"):
+            movies = self.omdb_service.search_movies_by_name(movie_name.strip(), deadline)
         # Limit results to configured maximum before enrichment
         movies = movies[:Config.MAX_MOVIES_PER_PAGE]
-        return self._add_trailers(movies)
+        return self._add_trailers(movies, deadline)
     
-    def search_by_mood(self, description: str, page: int = 1) -> tuple:
+    def search_by_mood(self, description: str, page: int = 1, deadline=None) -> tuple:
         """
         Search movies by mood using TMDb with OMDb fallback
         
         Args:
             description (str): Mood description
             page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
             
         Returns:
             tuple: (movies_list, total_pages)
@@ -51,8 +123,72 @@ class MovieService:
         if not description or not description.strip():
             return [], 1
         
-        mood = self.mood_detector.detect_mood(description.strip())
-        print(f"DEBUG: Input: '{description}' -> Detected mood: '{mood}'")
+        with time_stage("mood_detection"):
+            mood = self.mood_detector.detect_mood(description.strip())
+        logger.debug("Detected mood", extra={"description": description, "mood": mood})
+        
+        return self._search_mood_page(mood, page, deadline)
+    
+    def search_by_mood_batch(self, descriptions: list, page: int = 1) -> list:
+        """
+        Search movies for many mood descriptions at once
+        
+        Descriptions are grouped by the genre their mood maps to, and each
+        distinct genre page is fetched from upstream only once, all groups
+        concurrently.
+        
+        Args:
+            descriptions (list): Mood descriptions
+            page (int): Page number for pagination
+        
+        Returns:
+            list: One dict per input with description, mood, movies and total_pages
+        """
+        with time_stage("mood_detection"):
+            moods = self.mood_detector.detect_moods([(description or "").strip() for description in descriptions])
+        
+        # Moods sharing a TMDb genre and OMDb fallback keyword return the same page
+        groups = {}
+        for mood in moods:
+            if mood is not None:
+                key = (self.mood_detector.get_genre_id(mood), self.mood_detector.get_fallback_genre(mood))
+                groups.setdefault(key, mood)
+        
+        futures = {key: self.group_executor.submit(self._search_mood_page, mood, page)
+                   for key, mood in groups.items()}
+        pages = {key: future.result() for key, future in futures.items()}
+        
+        results = []
+        for description, mood in zip(descriptions, moods):
+            movies, total_pages = [], 1
+            if mood is not None:
+                key = (self.mood_detector.get_genre_id(mood), self.mood_detector.get_fallback_genre(mood))
+                movies, total_pages = pages[key]
+            results.append({
+                "description": description,
+                "mood": mood,
+                "movies": movies,
+                "total_pages": total_pages
+            })
+        return results
+    
+    def _search_mood_page(self, mood: str, page: int = 1, deadline=None) -> tuple:
+        """
+        Get one page of movies for a detected mood using TMDb with OMDb fallback
+        
+        Args:
+            mood (str): Detected mood
+            page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            tuple: (movies_list, total_pages)
+        """
+        # The snapshot answers without upstream calls; live APIs cover what it lacks
+        snapshot_page = read_catalog_page(self.mood_detector, self.paginator, mood, page)
+        if snapshot_page is not None:
+            movies, total_pages = snapshot_page
+            return self._add_trailers(movies, deadline), total_pages
         
         movies = []
         total_pages = 1
@@ -60,66 +196,464 @@ class MovieService:
         # Try TMDb first for better genre filtering
         if self.tmdb_service.is_available() and self.mood_detector.is_valid_mood(mood):
             genre_id = self.mood_detector.get_genre_id(mood)
-            print(f"DEBUG: Using TMDb genre ID {genre_id} for mood '{mood}'")
+            logger.debug("Using TMDb genre", extra={"genre_id": genre_id, "mood": mood})
             
-            tmdb_movies = self.tmdb_service.search_movies_by_genre(genre_id, page)
+            # App pages are slices of TMDb's larger pages; repeated upstream
+            # fetches for neighbouring app pages are served by the response cache
+            with time_stage("discover"):
+                tmdb_movies, total_results = self.paginator.get_page(
+                    page, lambda upstream_page: self.tmdb_service.discover_movies(genre_id, upstream_page, deadline))
             if tmdb_movies:
-                movies = []
-                for tmdb_movie in tmdb_movies[:Config.MAX_MOVIES_PER_PAGE]:
-                    formatted_movie = self.tmdb_service.format_movie_data(tmdb_movie)
-                    if formatted_movie:
-                        movies.append(formatted_movie)
+                with time_stage("details"):
+                    formatted_movies = list(self.executor.map(
+                        lambda movie: self.tmdb_service.format_movie_data(movie, deadline), tmdb_movies))
+                movies = [movie for movie in formatted_movies if movie]
                 
                 # Add trailers to TMDb movies
-                movies = self._add_trailers(movies)
-                total_pages = self.tmdb_service.get_total_pages(genre_id, page)
+                movies = self._add_trailers(movies, deadline)
+                total_pages = self.paginator.total_pages(total_results)
         
         # Fallback to OMDb if TMDb fails or no API key
         if not movies and self.omdb_service.is_available():
             genre_keyword = self.mood_detector.get_fallback_genre(mood)
-            movies = self.omdb_service.search_movies_by_genre(genre_keyword)
+            with time_stage("search"):
+                movies = self.omdb_service.search_movies_by_genre(genre_keyword, deadline)
             # Limit results to configured maximum before enrichment
             movies = movies[:Config.MAX_MOVIES_PER_PAGE]
-            movies = self._add_trailers(movies)
+            movies = self._add_trailers(movies, deadline)
         
         return movies, total_pages
     
-    def _add_trailers(self, movies: list) -> list:
+    def _add_trailers(self, movies: list, deadline=None) -> list:
         """
-        Add YouTube trailers to movie list
+        Add details and YouTube trailers to movie list
+        
+        OMDb details are added even without a YouTube key; only the trailer
+        searches need one.
         
         Args:
             movies (list): List of movies
+            deadline (Deadline): Request budget, if any
             
         Returns:
-            list: Movies with trailers added
+            list: Movies with details and trailers added
         """
         if not movies:
             return movies
         
-        if not self.youtube_service.is_available():
-            return movies
-        
         # Ensure we only enrich up to the configured maximum
         movies = movies[:Config.MAX_MOVIES_PER_PAGE]
-        detailed_movies = []
-        for movie in movies:
-            if movie.get("tmdb_id"):
-                # TMDb data - add trailer directly
+        # Enrich all movies concurrently; map() keeps the original order
+        with time_stage("trailers"):
+            enriched_movies = list(self.executor.map(lambda movie: self._enrich_movie(movie, deadline), movies))
+        return [movie for movie in enriched_movies if movie]
+    
+    def _enrich_movie(self, movie: dict, deadline=None) -> dict:
+        """
+        Add details and a trailer to a single movie
+        
+        Args:
+            movie (dict): Movie from TMDb or an OMDb search result
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Enriched movie or None if the movie has no ID
+        """
+        if movie.get("tmdb_id"):
+            # TMDb data - trailer usually comes with the details; search YouTube only as a fallback
+            # unless lazy trailers defer the search to the /trailer endpoint
+            failed = []
+            if not movie.get("trailer") and self._search_trailers():
                 title = movie.get("Title", "")
-                trailer_url = self.youtube_service.get_trailer_url(title)
-                movie["trailer"] = trailer_url
-                detailed_movies.append(movie)
-            elif movie.get("imdbID"):
-                # OMDb data - get details and add trailer
-                details = self.omdb_service.get_movie_details(movie.get("imdbID"))
+                movie["trailer"], search_failed = self.youtube_service.lookup_trailer(
+                    title, movie.get("Year"), deadline)
+                if search_failed:
+                    failed.append("trailer")
+            return flag_missing(movie, deadline, failed)
+        
+        if movie.get("imdbID"):
+            # OMDb data - get details and add trailer; keep the search hit if details are unavailable
+            details = self.omdb_service.get_movie_details(movie.get("imdbID"), deadline)
+            failed = []
+            if not details or details.get("Response") == "False":
+                # Search hits carry no plot
+                details, failed = movie, ["Plot"]
+            if self._search_trailers():
+                title = details.get("Title", "")
+                details["trailer"], search_failed = self.youtube_service.lookup_trailer(
+                    title, details.get("Year"), deadline)
+                if search_failed:
+                    failed.append("trailer")
+            return flag_missing(details, deadline, failed)
+        
+        return None
+    
+    def _search_trailers(self) -> bool:
+        """Check if trailers are searched for while the page is built"""
+        # Lazy trailers defer the search to the /trailer endpoint
+        return not Config.LAZY_TRAILERS and self.youtube_service.is_available()
+    
+    def get_available_services(self) -> dict:
+        """
+        Get status of available services
+        
+        Returns:
+            dict: Service availability status
+        """
+        return {
+            "omdb": self.omdb_service.is_available(),
+            "tmdb": self.tmdb_service.is_available(),
+            "youtube": self.youtube_service.is_available()
+        }
+
+
+class AsyncMovieService:
+    """Movie service whose upstream calls run as coroutines on one event loop"""
+    
+    def __init__(self):
+        self.omdb_service = AsyncOMDbService()
+        self.tmdb_service = AsyncTMDbService()
+        self.youtube_service = AsyncYouTubeService()
+        self.mood_detector = MoodDetector()
+        self.paginator = VirtualPaginator(Config.MAX_MOVIES_PER_PAGE, Config.TMDB_PAGE_SIZE,
+                                          Config.MAX_PAGES, Config.TMDB_MAX_PAGES)
+    
+    async def search_by_name(self, movie_name: str, deadline=None) -> list:
+        """
+        Search movies by name using OMDb
+        
+        Args:
+            movie_name (str): Movie name to search
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            list: List of movie results
+        """
+        if not movie_name or not movie_name.strip():
+            return []
+        
+        with time_stage("search"):
+            movies = await self.omdb_service.search_movies_by_name(movie_name.strip(), deadline)
+        movies = movies[:Config.MAX_MOVIES_PER_PAGE]
+        return await self._add_trailers(movies, deadline)
+    
+    async def detect_mood(self, description: str) -> str:
+        """
+        Detect the mood of a description
+        
+        Args:
+            description (str): Mood description
+        
+        Returns:
+            str: Detected mood
+        """
+        # Sentiment scoring is CPU work; keep it off the event loop
+        with time_stage("mood_detection"):
+            mood = await asyncio.to_thread(self.mood_detector.detect_mood, description.strip())
+        logger.debug("Detected mood", extra={"description": description, "mood": mood})
+        return mood
+    
+    async def search_by_mood(self, description: str, page: int = 1, deadline=None, mood: str = None) -> tuple:
+        """
+        Search movies by mood using TMDb with OMDb fallback
+        
+        Args:
+            description (str): Mood description
+            page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
+            mood (str): Mood already detected from the description, if any
+        
+        Returns:
+            tuple: (movies_list, total_pages)
+        """
+        if not description or not description.strip():
+            return [], 1
+        
+        if mood is None:
+            mood = await self.detect_mood(description)
+        return await self._search_mood_page(mood, page, deadline)
+    
+    async def _search_mood_page(self, mood: str, page: int = 1, deadline=None) -> tuple:
+        """
+        Get one page of movies for a detected mood using TMDb with OMDb fallback
+        
+        Args:
+            mood (str): Detected mood
+            page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            tuple: (movies_list, total_pages)
+        """
+        snapshot_page = read_catalog_page(self.mood_detector, self.paginator, mood, page)
+        if snapshot_page is not None:
+            movies, total_pages = snapshot_page
+            return await self._add_trailers(movies, deadline), total_pages
+        
+        movies = []
+        total_pages = 1
+        
+        if self.tmdb_service.is_available() and self.mood_detector.is_valid_mood(mood):
+            genre_id = self.mood_detector.get_genre_id(mood)
+            logger.debug("Using TMDb genre", extra={"genre_id": genre_id, "mood": mood})
+            
+            with time_stage("discover"):
+                tmdb_movies, total_results = await self.paginator.get_page_async(
+                    page, lambda upstream_page: self.tmdb_service.discover_movies(genre_id, upstream_page, deadline))
+            if tmdb_movies:
+                # gather() keeps the original order
+                with time_stage("details"):
+                    formatted_movies = await asyncio.gather(
+                        *(self.tmdb_service.format_movie_data(movie, deadline) for movie in tmdb_movies))
+                movies = [movie for movie in formatted_movies if movie]
+                
+                movies = await self._add_trailers(movies, deadline)
+                total_pages = self.paginator.total_pages(total_results)
+        
+        # Fallback to OMDb if TMDb fails or no API key
+        if not movies and self.omdb_service.is_available():
+            genre_keyword = self.mood_detector.get_fallback_genre(mood)
+            with time_stage("search"):
+                movies = await self.omdb_service.search_movies_by_genre(genre_keyword, deadline)
+            movies = movies[:Config.MAX_MOVIES_PER_PAGE]
+            movies = await self._add_trailers(movies, deadline)
+        
+        return movies, total_pages
+    
+    async def stream_by_name(self, movie_name: str):
+        """
+        Stream search-by-name results as they become ready
+        
+        Args:
+            movie_name (str): Movie name to search
+        
+        Yields:
+            dict: Stream events (see _stream_movies)
+        """
+        movies = []
+        if movie_name and movie_name.strip():
+            movies = await self.omdb_service.search_movies_by_name(movie_name.strip())
+            movies = movies[:Config.MAX_MOVIES_PER_PAGE]
+        
+        yield {"type": "meta", "total_pages": 1, "count": len(movies)}
+        async for event in self._stream_movies(movies):
+            yield event
+    
+    async def stream_by_mood(self, description: str, page: int = 1):
+        """
+        Stream search-by-mood results as they become ready
+        
+        Cards are sent straight from the discover (or OMDb search) response;
+        details and trailers follow as update events.
+        
+        Args:
+            description (str): Mood description
+            page (int): Page number for pagination
+        
+        Yields:
+            dict: Stream events (see _stream_movies)
+        """
+        mood = None
+        if description and description.strip():
+            mood = await self.detect_mood(description)
+            page_traffic.record(mood, page)
+        
+        movies = []
+        total_pages = 1
+        snapshot_page = read_catalog_page(self.mood_detector, self.paginator, mood, page) if mood else None
+        if snapshot_page is not None:
+            movies, total_pages = snapshot_page
+            yield {"type": "meta", "mood": mood, "total_pages": total_pages, "count": len(movies)}
+            async for event in self._stream_movies(movies, complete=True):
+                yield event
+            return
+        
+        if mood and self.tmdb_service.is_available() and self.mood_detector.is_valid_mood(mood):
+            genre_id = self.mood_detector.get_genre_id(mood)
+            tmdb_movies, total_results = await self.paginator.get_page_async(
+                page, lambda upstream_page: self.tmdb_service.discover_movies(genre_id, upstream_page))
+            movies = [self.tmdb_service.format_discover_result(movie) for movie in tmdb_movies]
+            movies = [movie for movie in movies if movie]
+            if movies:
+                total_pages = self.paginator.total_pages(total_results)
+        
+        # Fallback to OMDb if TMDb fails or no API key
+        if mood and not movies and self.omdb_service.is_available():
+            genre_keyword = self.mood_detector.get_fallback_genre(mood)
+            movies = await self.omdb_service.search_movies_by_genre(genre_keyword)
+            movies = movies[:Config.MAX_MOVIES_PER_PAGE]
+        
+        yield {"type": "meta", "mood": mood, "total_pages": total_pages, "count": len(movies)}
+        async for event in self._stream_movies(movies):
+            yield event
+    
+    async def _stream_movies(self, movies: list, complete: bool = False):
+        """
+        Stream preliminary cards, then details and trailers in completion order
+        
+        Events are {"type": "movie", "index", "movie"} for each card,
+        {"type": "update", "index", "movie"} when details arrive and
+        {"type": "trailer", "index", "trailer"} when a trailer lookup finishes.
+        A final {"type": "done"} ends the stream.
+        
+        Args:
+            movies (list): Preliminary movie cards in display order
+            complete (bool): Cards already carry full details, so only trailers are looked up
+        
+        Yields:
+            dict: Stream events
+        """
+        for index, movie in enumerate(movies):
+            yield {"type": "movie", "index": index, "movie": movie}
+        
+        queue = asyncio.Queue()
+        
+        async def enrich(index, movie):
+            try:
+                details = None if complete else await self._fetch_details(movie)
                 if details:
-                    title = details.get("Title", "")
-                    trailer_url = self.youtube_service.get_trailer_url(title)
-                    details["trailer"] = trailer_url
-                    detailed_movies.append(details)
+                    movie = details
+                    queue.put_nowait({"type": "update", "index": index, "movie": details})
+                if not movie.get("trailer") and not Config.LAZY_TRAILERS and self.youtube_service.is_available():
+                    trailer = await self.youtube_service.get_trailer_url(movie.get("Title", ""), movie.get("Year"))
+                    queue.put_nowait({"type": "trailer", "index": index, "trailer": trailer})
+            finally:
+                # None marks one movie as finished
+                queue.put_nowait(None)
+        
+        tasks = [asyncio.ensure_future(enrich(index, movie)) for index, movie in enumerate(movies)]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                event = await queue.get()
+                if event is None:
+                    remaining -= 1
+                else:
+                    yield event
+        finally:
+            # Client went away; stop work nobody will see
+            for task in tasks:
+                task.cancel()
+        
+        yield {"type": "done"}
+    
+    async def _fetch_details(self, movie: dict) -> dict:
+        """
+        Fetch full details for a preliminary movie card
+        
+        Args:
+            movie (dict): Card from TMDb discover or an OMDb search result
         
-        return detailed_movies
+        Returns:
+            dict: Formatted details or empty dict if unavailable
+        """
+        if movie.get("tmdb_id"):
+            return await self.tmdb_service.get_movie(movie["tmdb_id"])
+        if movie.get("imdbID"):
+            details = await self.omdb_service.get_movie_details(movie["imdbID"])
+            return details if details.get("Response") != "False" else {}
+        return {}
+    
+    async def resolve_trailer(self, tmdb_id: str = None, imdb_id: str = None,
+                              title: str = None, year: str = None) -> tuple:
+        """
+        Resolve the trailer for a single movie on demand
+        
+        TMDb-listed trailers are used first; otherwise YouTube is searched by
+        title. Details and searches go through the response cache and the
+        trailer index, so repeated lookups cost no upstream calls.
+        
+        Args:
+            tmdb_id (str): TMDb ID of the movie
+            imdb_id (str): IMDb ID of the movie
+            title (str): Movie title, used when no ID is given or details are missing
+            year (str): Release year, if known
+        
+        Returns:
+            tuple: (trailer_url, failed); failed is True when no trailer was found
+                because a details call or the YouTube search failed
+        """
+        details_failed = False
+        if tmdb_id and self.tmdb_service.is_available():
+            movie = await self.tmdb_service.get_movie(tmdb_id)
+            if movie.get("trailer"):
+                return movie["trailer"], False
+            details_failed = not movie
+            title = movie.get("Title") or title
+            year = movie.get("Year") or year
+        elif imdb_id and self.omdb_service.is_available():
+            details = await self.omdb_service.get_movie_details(imdb_id)
+            # An OMDb "not found" answer is a real response; only an empty dict is a failure
+            details_failed = not details
+            title = details.get("Title") or title
+            year = details.get("Year") or year
+        
+        if not title or not self.youtube_service.is_available():
+            return None, details_failed
+        trailer_url, search_failed = await self.youtube_service.lookup_trailer(title, year)
+        if trailer_url:
+            return trailer_url, False
+        return None, details_failed or search_failed
+    
+    async def _add_trailers(self, movies: list, deadline=None) -> list:
+        """
+        Add details and YouTube trailers to movie list
+        
+        Args:
+            movies (list): List of movies
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            list: Movies with details and trailers added
+        """
+        if not movies:
+            return movies
+        
+        movies = movies[:Config.MAX_MOVIES_PER_PAGE]
+        with time_stage("trailers"):
+            enriched_movies = await asyncio.gather(*(self._enrich_movie(movie, deadline) for movie in movies))
+        return [movie for movie in enriched_movies if movie]
+    
+    async def _enrich_movie(self, movie: dict, deadline=None) -> dict:
+        """
+        Add details and a trailer to a single movie
+        
+        Args:
+            movie (dict): Movie from TMDb or an OMDb search result
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Enriched movie or None if the movie has no ID
+        """
+        if movie.get("tmdb_id"):
+            failed = []
+            if not movie.get("trailer") and self._search_trailers():
+                title = movie.get("Title", "")
+                movie["trailer"], search_failed = await self.youtube_service.lookup_trailer(
+                    title, movie.get("Year"), deadline)
+                if search_failed:
+                    failed.append("trailer")
+            return flag_missing(movie, deadline, failed)
+        
+        if movie.get("imdbID"):
+            details = await self.omdb_service.get_movie_details(movie.get("imdbID"), deadline)
+            failed = []
+            if not details or details.get("Response") == "False":
+                details, failed = movie, ["Plot"]
+            if self._search_trailers():
+                title = details.get("Title", "")
+                details["trailer"], search_failed = await self.youtube_service.lookup_trailer(
+                    title, details.get("Year"), deadline)
+                if search_failed:
+                    failed.append("trailer")
+            return flag_missing(details, deadline, failed)
+        
+        return None
+    
+    def _search_trailers(self) -> bool:
+        """Check if trailers are searched for while the page is built"""
+        # Lazy trailers defer the search to the /trailer endpoint
+        return not Config.LAZY_TRAILERS and self.youtube_service.is_available()
     
     def get_available_services(self) -> dict:
         """
@@ -3,67 +3,145 @@ OMDb API Service
 Handles movie searches and details from OMDb API
 """
 
-from .base_service import BaseAPIService
+import asyncio
+from .base_service import BaseAPIService, AsyncBaseAPIService
+from .youtube_service import build_watch_url
+from .movie_index import create_movie_index
 from config import Config
 
 
 class OMDbService(BaseAPIService):
     """Service for OMDb API operations"""
     
+    service_name = "omdb"
+    
     def __init__(self):
         super().__init__()
         self.api_key = Config.OMDB_API_KEY
-        self.base_url = "https://www.omdbapi.com/"
+        self.base_url = Config.OMDB_BASE_URL
+        self.movie_index = create_movie_index()
     
-    def search_movies_by_name(self, movie_name: str) -> list:
+    def search_movies_by_name(self, movie_name: str, deadline=None) -> list:
         """
         Search movies by name using OMDb API
         
         Args:
             movie_name (str): Movie name to search
+            deadline (Deadline): Request budget, if any
             
         Returns:
             list: List of movie search results
         """
-        if not self.validate_api_key(self.api_key, "OMDb"):
+        url = self._search_url(movie_name)
+        if not url:
             return []
         
-        url = f"{self.base_url}?apikey={self.api_key}&s={movie_name}"
-        data = self.safe_request(url)
+        data = self.safe_request(url, "omdb_search", deadline)
         return data.get("Search", [])
     
-    def search_movies_by_genre(self, genre_keyword: str) -> list:
+    def search_movies_by_genre(self, genre_keyword: str, deadline=None) -> list:
         """
         Search movies by genre keyword using OMDb API
         
         Args:
             genre_keyword (str): Genre keyword to search
+            deadline (Deadline): Request budget, if any
             
         Returns:
             list: List of movie search results
         """
-        if not self.validate_api_key(self.api_key, "OMDb"):
+        url = self._search_url(genre_keyword)
+        if not url:
             return []
         
-        url = f"{self.base_url}?apikey={self.api_key}&s={genre_keyword}"
-        data = self.safe_request(url)
+        data = self.safe_request(url, "omdb_search", deadline)
         return data.get("Search", [])
     
-    def get_movie_details(self, imdb_id: str) -> dict:
+    def get_movie_details(self, imdb_id: str, deadline=None) -> dict:
         """
         Get detailed movie information by IMDb ID
         
+        Movies already in the movie index, from OMDb or TMDb, are answered
+        without a network call.
+        
         Args:
             imdb_id (str): IMDb ID of the movie
+            deadline (Deadline): Request budget, if any
             
         Returns:
             dict: Movie details
         """
-        if not self.validate_api_key(self.api_key, "OMDb"):
+        details = self._lookup_index(imdb_id)
+        if details is not None:
+            return details
+        
+        url = self._details_url(imdb_id)
+        if not url:
             return {}
         
-        url = f"{self.base_url}?apikey={self.api_key}&i={imdb_id}&plot=short"
-        return self.safe_request(url)
+        details = self.safe_request(url, "omdb_details", deadline)
+        self._store_index(details)
+        return details
+    
+    def _lookup_index(self, imdb_id: str) -> dict:
+        """
+        Look up movie details in the movie index
+        
+        Args:
+            imdb_id (str): IMDb ID of the movie
+        
+        Returns:
+            dict: Details shaped like an OMDb response or None unless the card fields are fresh
+        """
+        if not self.movie_index or not imdb_id:
+            return None
+        
+        details = self.movie_index.lookup(imdb_id=imdb_id)
+        if details is None:
+            return None
+        
+        details["Response"] = "True"
+        if details.get("trailer_key"):
+            details["trailer"] = build_watch_url(details["trailer_key"])
+        return details
+    
+    def _store_index(self, details: dict):
+        """
+        Store an OMDb details response in the movie index
+        
+        Args:
+            details (dict): OMDb details response
+        """
+        if self.movie_index and details.get("Response") == "True":
+            self.movie_index.store(details)
+    
+    def _search_url(self, query: str) -> str:
+        """
+        Build an OMDb search URL
+        
+        Args:
+            query (str): Search text
+        
+        Returns:
+            str: Request URL or None if the API key is missing
+        """
+        if not self.validate_api_key(self.api_key, "OMDb"):
+            return None
+        return f"{self.base_url}?apikey={self.api_key}&s={query}"
+    
+    def _details_url(self, imdb_id: str) -> str:
+        """
+        Build an OMDb details URL
+        
+        Args:
+            imdb_id (str): IMDb ID of the movie
+        
+        Returns:
+            str: Request URL or None if the API key is missing
+        """
+        if not self.validate_api_key(self.api_key, "OMDb"):
+            return None
+        return f"{self.base_url}?apikey={self.api_key}&i={imdb_id}&plot=short"
     
     def is_available(self) -> bool:
         """
@@ -73,3 +151,72 @@ class OMDbService(BaseAPIService):
             bool: True if service is available
         """
         return bool(self.api_key)
+
+
+class AsyncOMDbService(OMDbService, AsyncBaseAPIService):
+    """Non-blocking OMDb service for asyncio callers"""
+    
+    async def search_movies_by_name(self, movie_name: str, deadline=None) -> list:
+        """
+        Search movies by name using OMDb API
+        
+        Args:
+            movie_name (str): Movie name to search
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            list: List of movie search results
+        """
+        url = self._search_url(movie_name)
+        if not url:
+            return []
+        
+        data = await self.safe_request(url, "omdb_search", deadline)
+        return data.get("Search", [])
+    
+    async def search_movies_by_genre(self, genre_keyword: str, deadline=None) -> list:
+        """
+        Search movies by genre keyword using OMDb API
+        
+        Args:
+            genre_keyword (str): Genre keyword to search
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            list: List of movie search results
+        """
+        return await self.search_movies_by_name(genre_keyword, deadline)
+    
+    async def get_movie_details(self, imdb_id: str, deadline=None) -> dict:
+        """
+        Get detailed movie information by IMDb ID
+        
+        Args:
+            imdb_id (str): IMDb ID of the movie
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Movie details
+        """
+        details = await self._lookup_index(imdb_id)
+        if details is not None:
+            return details
+        
+        url = self._details_url(imdb_id)
+        if not url:
+            return {}
+        
+        details = await self.safe_request(url, "omdb_details", deadline)
+        await self._store_index(details)
+        return details
+    
+    async def _lookup_index(self, imdb_id: str) -> dict:
+        """Look up movie details in the movie index on a worker thread"""
+        if not self.movie_index or not imdb_id:
+            return None
+        return await asyncio.to_thread(super()._lookup_index, imdb_id)
+    
+    async def _store_index(self, details: dict):
+        """Store an OMDb details response in the movie index on a worker thread"""
+        if self.movie_index and details.get("Response") == "True":
+            await asyncio.to_thread(super()._store_index, details)
@@ -0,0 +1,83 @@
+"""
+Page Cache
+Rendered result pages keyed by normalized search parameters
+"""
+
+import hashlib
+import time
+from .response_cache import ResponseCache
+from config import Config
+
+
+class PageCache:
+    """TTL + LRU cache of rendered HTML with the validators needed for 304 responses"""
+    
+    def __init__(self, max_bytes: int, ttl: float):
+        self.ttl = ttl
+        self.store = ResponseCache(max_bytes)
+    
+    @staticmethod
+    def make_key(choice: str, query: str, page: int = 1) -> str:
+        """
+        Build a cache key for a search
+        
+        Mood searches pass the detected mood, not the description, so every
+        description of the same mood shares one entry.
+        
+        Args:
+            choice (str): "name" or "mood"
+            query (str): Movie name or detected mood
+            page (int): Page number
+        
+        Returns:
+            str: Cache key
+        """
+        normalized = " ".join(query.lower().split())
+        return f"{choice}:{normalized}:{page}"
+    
+    def get(self, key: str) -> dict:
+        """
+        Get a cached page
+        
+        Args:
+            key (str): Key from make_key
+        
+        Returns:
+            dict: {"html", "etag", "last_modified"} or None on miss
+        """
+        if self.ttl <= 0:
+            return None
+        return self.store.get(key)
+    
+    def set(self, key: str, html: str) -> dict:
+        """
+        Cache a rendered page
+        
+        Args:
+            key (str): Key from make_key
+            html (str): Rendered page
+        
+        Returns:
+            dict: The cached entry, with its ETag and Last-Modified time
+        """
+        entry = {
+            "html": html,
+            "etag": hashlib.sha1(html.encode("utf-8")).hexdigest(),
+            # HTTP dates have one-second precision
+            "last_modified": int(time.time()),
+        }
+        self.store.set(key, entry, self.ttl)
+        return entry
+    
+    def stats(self) -> dict:
+        """
+        Get cache statistics
+        
+        Returns:
+            dict: Hit/miss counters and memory usage
+        """
+        return self.store.stats()
+
+
+# Shared by every request handler in the process
+page_cache = PageCache(Config.PAGE_CACHE_MAX_BYTES, Config.PAGE_CACHE_TTL if Config.PAGE_CACHE_ENABLED else 0)
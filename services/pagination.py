@@ -0,0 +1,105 @@
+"""
+Virtual Pagination
+Maps app pages onto slices of fixed-size upstream pages
+"""
+
+import asyncio
+
+
+class VirtualPaginator:
+    """Serves small app pages out of larger upstream pages"""
+    
+    def __init__(self, page_size: int, upstream_page_size: int, max_pages: int, max_upstream_pages: int = None):
+        self.page_size = page_size
+        self.upstream_page_size = upstream_page_size
+        self.max_pages = max_pages
+        self.max_upstream_pages = max_upstream_pages
+    
+    def upstream_span(self, page: int) -> list:
+        """
+        Get the upstream slices that make up an app page
+        
+        Args:
+            page (int): App page number (1-based)
+        
+        Returns:
+            list: (upstream_page, start, end) tuples in display order
+        """
+        first_item = (max(page, 1) - 1) * self.page_size
+        last_item = first_item + self.page_size
+        
+        span = []
+        position = first_item
+        while position < last_item:
+            upstream_page = position // self.upstream_page_size + 1
+            start = position % self.upstream_page_size
+            end = min(self.upstream_page_size, start + last_item - position)
+            span.append((upstream_page, start, end))
+            position += end - start
+        return span
+    
+    def get_page(self, page: int, fetch_page) -> tuple:
+        """
+        Collect the items of an app page from upstream pages
+        
+        Args:
+            page (int): App page number (1-based)
+            fetch_page (callable): Returns a DiscoverPage for an upstream page number
+        
+        Returns:
+            tuple: (items, total_results)
+        """
+        items = []
+        total_results = 0
+        for upstream_page, start, end in self.upstream_span(page):
+            if self.max_upstream_pages and upstream_page > self.max_upstream_pages:
+                break
+            result = fetch_page(upstream_page)
+            total_results = max(total_results, result.total_results)
+            items.extend(result.results[start:end])
+            if len(result.results) < end:
+                # Short upstream page means there is nothing after it
+                break
+        return items, total_results
+    
+    async def get_page_async(self, page: int, fetch_page) -> tuple:
+        """
+        Collect the items of an app page from upstream pages without blocking
+        
+        All upstream pages of the span are fetched concurrently.
+        
+        Args:
+            page (int): App page number (1-based)
+            fetch_page (callable): Coroutine function returning a DiscoverPage for an upstream page number
+        
+        Returns:
+            tuple: (items, total_results)
+        """
+        span = [(upstream_page, start, end) for upstream_page, start, end in self.upstream_span(page)
+                if not self.max_upstream_pages or upstream_page <= self.max_upstream_pages]
+        results = await asyncio.gather(*(fetch_page(upstream_page) for upstream_page, _, _ in span))
+        
+        items = []
+        total_results = 0
+        for (upstream_page, start, end), result in zip(span, results):
+            total_results = max(total_results, result.total_results)
+            items.extend(result.results[start:end])
+            if len(result.results) < end:
+                # Short upstream page means there is nothing after it
+                break
+        return items, total_results
+    
+    def total_pages(self, total_results: int) -> int:
+        """
+        Compute the number of app pages for an upstream result count
+        
+        Args:
+            total_results (int): Total results reported upstream
+        
+        Returns:
+            int: App page count, at least 1 and at most max_pages
+        """
+        if self.max_upstream_pages:
+            total_results = min(total_results, self.max_upstream_pages * self.upstream_page_size)
+        pages = -(-total_results // self.page_size)
+        return max(1, min(pages, self.max_pages))
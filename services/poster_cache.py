@@ -0,0 +1,166 @@
+"""
+Poster Cache
+Stores poster images in card-sized variants on disk for the /poster proxy
+"""
+
+import logging
+import os
+import re
+import tempfile
+from urllib.parse import urlparse
+import requests
+from .http_session import get_session
+from .single_flight import SingleFlight
+from config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+# TMDb serves fixed widths; Amazon (OMDb posters) scales to any _SX width
+TMDB_WIDTHS = (92, 154, 185, 342, 500, 780)
+TMDB_POSTER = re.compile(r"^/t/p/[a-z0-9]+/([A-Za-z0-9]+\.(?:jpg|png))$")
+AMAZON_POSTER = re.compile(r"^/images/M/([A-Za-z0-9@_-]+)\._V1_.*\.jpg$")
+POSTER_ID = re.compile(r"^(tmdb|amazon)-([A-Za-z0-9@_-]+(?:\.(?:jpg|png))?)$")
+
+# Posters are tens of kilobytes; anything far larger is not a card image
+MAX_POSTER_BYTES = 2 * 1024 * 1024
+
+
+def make_poster_id(poster_url: str) -> str:
+    """
+    Build a proxy ID for a TMDb or Amazon poster URL
+    
+    The ID names the image on its CDN, so the proxy can only ever fetch posters.
+    
+    Args:
+        poster_url (str): Poster URL from TMDb or OMDb
+    
+    Returns:
+        str: Poster ID or None if the URL is not from a supported CDN
+    """
+    if not poster_url or poster_url == "N/A":
+        return None
+    parsed = urlparse(poster_url)
+    host = parsed.netloc.lower()
+    if host == "image.tmdb.org":
+        match = TMDB_POSTER.match(parsed.path)
+        return f"tmdb-{match.group(1)}" if match else None
+    if host.endswith(".media-amazon.com"):
+        match = AMAZON_POSTER.match(parsed.path)
+        return f"amazon-{match.group(1)}" if match else None
+    return None
+
+
+def variant_url(poster_id: str, width: int) -> str:
+    """
+    Build the CDN URL of one poster width
+    
+    Args:
+        poster_id (str): ID from make_poster_id
+        width (int): Width in pixels; TMDb widths must be one of TMDB_WIDTHS
+    
+    Returns:
+        str: Image URL or None for an invalid ID
+    """
+    match = POSTER_ID.match(poster_id or "")
+    if not match:
+        return None
+    source, name = match.groups()
+    if source == "tmdb":
+        return f"https://image.tmdb.org/t/p/w{width}/{name}"
+    return f"https://m.media-amazon.com/images/M/{name}._V1_SX{width}.jpg"
+
+
+class PosterCache:
+    """Disk cache of poster variants, each fetched from its CDN once"""
+    
+    def __init__(self, directory: str, widths: list):
+        self.directory = directory
+        # Every served width must exist on TMDb too
+        self.widths = sorted(width for width in widths if width in TMDB_WIDTHS) or [342]
+        self.flights = SingleFlight()
+    
+    def pick_width(self, requested: int) -> int:
+        """
+        Snap a requested width to the smallest configured width that covers it
+        
+        Args:
+            requested (int): Requested width in pixels
+        
+        Returns:
+            int: Configured width
+        """
+        for width in self.widths:
+            if width >= requested:
+                return width
+        return self.widths[-1]
+    
+    def get(self, poster_id: str, width: int) -> str:
+        """
+        Get the file of a poster variant, fetching it on first use
+        
+        Args:
+            poster_id (str): ID from make_poster_id
+            width (int): A configured width
+        
+        Returns:
+            str: Path of the cached image or None if it could not be fetched
+        """
+        url = variant_url(poster_id, width)
+        if url is None:
+            return None
+        
+        path = self._path(poster_id, width)
+        if os.path.exists(path):
+            return path
+        
+        # Cards on one page often share a poster; fetch it once
+        result, _ = self.flights.do(path, lambda: self._fetch(url, path))
+        return result
+    
+    def _path(self, poster_id: str, width: int) -> str:
+        stem, extension = os.path.splitext(poster_id)
+        # Spread files over subdirectories so none grows too large
+        return os.path.join(self.directory, stem[-2:].lower(), f"{stem}_w{width}{extension or '.jpg'}")
+    
+    def _fetch(self, url: str, path: str) -> str:
+        """
+        Download one variant and store it atomically
+        
+        Args:
+            url (str): CDN URL
+            path (str): Cache file
+        
+        Returns:
+            str: The cache file or None on failure
+        """
+        if os.path.exists(path):
+            return path
+        try:
+            response = get_session(url).get(url, timeout=Config.REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            logger.warning("Poster fetch failed", extra={"url": url, "error": str(e)})
+            return None
+        
+        content = response.content
+        if response.status_code != 200 or not response.headers.get("Content-Type", "").startswith("image/") \
+                or len(content) > MAX_POSTER_BYTES:
+            logger.warning("Poster fetch rejected", extra={"url": url, "status": response.status_code})
+            return None
+        
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".poster-")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return path
+
+
+# Shared by every request handler in the process
+poster_cache = PosterCache(Config.POSTER_CACHE_DIR, Config.POSTER_WIDTHS)
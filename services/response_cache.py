@@ -0,0 +1,212 @@
+"""
+Response Cache
+Shared in-memory TTL + LRU cache for upstream API responses
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qsl, urlencode
+from .shared_cache import SharedResponseCache
+from config import Config
+
+
+# Query parameters that carry credentials and must never be part of a cache key
+SECRET_PARAMS = {"apikey", "api_key", "key"}
+
+# OMDb errors caused by our account rather than the title; never cache them
+TRANSIENT_ERRORS = ("limit", "api key")
+
+
+def make_cache_key(url: str) -> str:
+    """
+    Build a normalized cache key from a request URL
+    
+    Args:
+        url (str): Request URL
+    
+    Returns:
+        str: URL with API keys removed and query parameters sorted
+    """
+    parsed = urlparse(url)
+    params = sorted((k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+                    if k.lower() not in SECRET_PARAMS)
+    return f"{parsed.scheme.lower()}://{parsed.netloc.lower()}{parsed.path}?{urlencode(params)}"
+
+
+def is_empty_response(data: dict) -> bool:
+    """
+    Check if a successful response carries no results
+    
+    Args:
+        data (dict): Parsed JSON response
+    
+    Returns:
+        bool: True for "not found" style responses
+    """
+    if data.get("Response") == "False":
+        return True
+    if "items" in data and not data["items"]:
+        return True
+    if "results" in data and not data["results"]:
+        return True
+    return False
+
+
+def is_cacheable_response(data: dict) -> bool:
+    """
+    Check if a response can be stored in the cache
+    
+    Args:
+        data (dict): Parsed JSON response
+    
+    Returns:
+        bool: False for errors caused by quota or credentials
+    """
+    error = str(data.get("Error", "")).lower()
+    return not any(marker in error for marker in TRANSIENT_ERRORS)
+
+
+class ResponseCache:
+    """Thread-safe response cache bounded by memory with LRU eviction"""
+    
+    # Lookups and stores only touch memory, so event loops may call them directly
+    blocking_io = False
+    
+    def __init__(self, max_bytes: int, stale_ttl: float = 0):
+        self.max_bytes = max_bytes
+        # Seconds an entry is kept past its TTL so it can be served while it is refreshed
+        self.stale_ttl = stale_ttl
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (serialized payload, fresh_until, expires_at); order is least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> dict:
+        """
+        Get a cached response
+        
+        Args:
+            key (str): Cache key
+        
+        Returns:
+            dict: Fresh copy of the cached response or None on miss
+        """
+        return self.lookup(key, allow_stale=False)[0]
+    
+    def lookup(self, key: str, allow_stale: bool = True) -> tuple:
+        """
+        Get a cached response, optionally one past its TTL but within the stale window
+        
+        Args:
+            key (str): Cache key
+            allow_stale (bool): Return stale entries too
+        
+        Returns:
+            tuple: (response or None on miss, fresh); fresh is False for a stale response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            
+            payload, fresh_until, expires_at = entry
+            now = time.monotonic()
+            if expires_at <= now:
+                self._remove(key)
+                self.misses += 1
+                return None, False
+            fresh = fresh_until > now
+            if not fresh and not allow_stale:
+                self.misses += 1
+                return None, False
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+        
+        # Callers mutate results, so every hit gets its own copy
+        return json.loads(payload), fresh
+    
+    def set(self, key: str, value: dict, ttl: float):
+        """
+        Store a response
+        
+        Args:
+            key (str): Cache key
+            value (dict): Response to cache
+            ttl (float): Time to live in seconds
+        """
+        if ttl <= 0:
+            return
+        
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            now = time.monotonic()
+            self._entries[key] = (payload, now + ttl, now + ttl + self.stale_ttl)
+            self.current_bytes += size
+            
+            while self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+    
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def stats(self) -> dict:
+        """
+        Get cache statistics
+        
+        Returns:
+            dict: Hit/miss counters and memory usage
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+            }
+    
+    def _remove(self, key: str):
+        """Remove an entry; caller must hold the lock"""
+        payload = self._entries.pop(key)[0]
+        self.current_bytes -= len(payload)
+
+
+def create_response_cache():
+    """
+    Create the configured response cache backend
+    
+    Returns:
+        ResponseCache or SharedResponseCache: "memory" is per process; "sqlite" is shared by all workers on a host
+    """
+    backend = Config.CACHE_BACKEND.lower()
+    if backend == "sqlite":
+        return SharedResponseCache(Config.SHARED_CACHE_PATH, Config.CACHE_MAX_BYTES, Config.CACHE_STALE_TTL)
+    if backend != "memory":
+        raise ValueError(f"Unknown cache backend: {backend!r}")
+    return ResponseCache(Config.CACHE_MAX_BYTES, Config.CACHE_STALE_TTL)
+
+
+# Shared by every service so identical calls are answered once per process (or host, with "sqlite")
+response_cache = create_response_cache()
@@ -0,0 +1,209 @@
+"""
+Shared Response Cache
+SQLite-backed TTL + LRU response cache shared by every worker process on a host
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from .sqlite_store import SQLiteStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class SharedResponseCache(SQLiteStore):
+    """Drop-in replacement for ResponseCache that stores entries in one SQLite file"""
+    
+    # Totals are kept by triggers in the writer's transaction, so they stay exact
+    # with many processes writing; eviction never has to SUM() the table
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            fresh_until REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS responses_by_access ON responses (accessed_at);
+        CREATE INDEX IF NOT EXISTS responses_by_expiry ON responses (expires_at);
+        
+        CREATE TABLE IF NOT EXISTS totals (
+            id INTEGER PRIMARY KEY CHECK (id = 0),
+            entries INTEGER NOT NULL,
+            bytes INTEGER NOT NULL
+        );
+        INSERT OR IGNORE INTO totals (id, entries, bytes) VALUES (0, 0, 0);
+        
+        CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses BEGIN
+            UPDATE totals SET entries = entries + 1, bytes = bytes + NEW.size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses BEGIN
+            UPDATE totals SET bytes = bytes - OLD.size + NEW.size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses BEGIN
+            UPDATE totals SET entries = entries - 1, bytes = bytes - OLD.size;
+        END;
+    """
+    
+    # Recency is refreshed at most this often per entry, so hot reads rarely write
+    ACCESS_RESOLUTION = 60
+    EVICTION_BATCH = 32
+    # Lookups and stores can wait on the file lock, so event loops must not call them directly
+    blocking_io = True
+    
+    def __init__(self, path: str, max_bytes: int, stale_ttl: float = 0):
+        # Reads are served from the OS page cache, which every worker shares
+        super().__init__(path, mmap_size=2 * max_bytes)
+        self.max_bytes = max_bytes
+        # Seconds an entry is kept past its TTL so it can be served while it is refreshed
+        self.stale_ttl = stale_ttl
+        # Hit and miss counters are per process; sizes are read from the shared file
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> dict:
+        """
+        Get a cached response
+        
+        Args:
+            key (str): Cache key
+        
+        Returns:
+            dict: Fresh copy of the cached response or None on miss
+        """
+        return self.lookup(key, allow_stale=False)[0]
+    
+    def lookup(self, key: str, allow_stale: bool = True) -> tuple:
+        """
+        Get a cached response, optionally one past its TTL but within the stale window
+        
+        Args:
+            key (str): Cache key
+            allow_stale (bool): Return stale entries too
+        
+        Returns:
+            tuple: (response or None on miss, fresh); fresh is False for a stale response
+        """
+        now = time.time()
+        try:
+            row = self.connection.execute(
+                "SELECT payload, fresh_until, expires_at, accessed_at FROM responses WHERE key = ?",
+                (key,)).fetchone()
+            if row is not None and row[2] > now and now - row[3] > self.ACCESS_RESOLUTION:
+                self.connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            # A busy or broken cache must never fail a request
+            logger.warning("Shared cache read failed", extra={"error": str(e)})
+            row = None
+        
+        fresh = row is not None and row[1] > now
+        with self._lock:
+            if row is None or row[2] <= now or not (fresh or allow_stale):
+                self.misses += 1
+                return None, False
+            self.hits += 1
+        return json.loads(row[0]), fresh
+    
+    def set(self, key: str, value: dict, ttl: float):
+        """
+        Store a response, evicting least recently used entries past max_bytes
+        
+        Args:
+            key (str): Cache key
+            value (dict): Response to cache
+            ttl (float): Time to live in seconds
+        """
+        if ttl <= 0:
+            return
+        
+        payload = json.dumps(value, separators=(",", ":"))
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        
+        now = time.time()
+        connection = self.connection
+        try:
+            # IMMEDIATE takes the write lock up front, so concurrent writers queue instead of deadlocking
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT INTO responses (key, payload, size, fresh_until, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (key) DO UPDATE SET payload = excluded.payload, size = excluded.size, "
+                    "fresh_until = excluded.fresh_until, expires_at = excluded.expires_at, "
+                    "accessed_at = excluded.accessed_at",
+                    (key, payload, size, now + ttl, now + ttl + self.stale_ttl, now),
+                )
+                evicted = self._evict(connection, now)
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning("Shared cache write failed", extra={"error": str(e)})
+            return
+        
+        if evicted:
+            with self._lock:
+                self.evictions += evicted
+    
+    def _evict(self, connection: sqlite3.Connection, now: float) -> int:
+        """
+        Bring the cache back under max_bytes; caller must hold a write transaction
+        
+        Expired entries go first, then the least recently used ones.
+        
+        Returns:
+            int: Number of live entries evicted
+        """
+        if self._total_bytes(connection) <= self.max_bytes:
+            return 0
+        connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        
+        evicted = 0
+        while self._total_bytes(connection) > self.max_bytes:
+            cursor = connection.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)", (self.EVICTION_BATCH,))
+            if not cursor.rowcount:
+                break
+            evicted += cursor.rowcount
+        return evicted
+    
+    @staticmethod
+    def _total_bytes(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT bytes FROM totals").fetchone()[0]
+    
+    def clear(self):
+        """Remove all entries"""
+        self.connection.execute("DELETE FROM responses")
+    
+    def stats(self) -> dict:
+        """
+        Get cache statistics
+        
+        Returns:
+            dict: Hit/miss counters of this process and usage of the shared file
+        """
+        try:
+            entries, current_bytes = self.connection.execute("SELECT entries, bytes FROM totals").fetchone()
+        except sqlite3.Error:
+            entries, current_bytes = 0, 0
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": current_bytes,
+                "max_bytes": self.max_bytes,
+            }
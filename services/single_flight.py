@@ -0,0 +1,122 @@
+"""
+Single Flight
+Coalesces identical concurrent upstream calls into one in-flight fetch
+"""
+
+import asyncio
+import threading
+import weakref
+
+
+class _Call:
+    """In-flight call shared by a leader and its waiters"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Thread-based single-flight group"""
+    
+    def __init__(self, executor=None):
+        self._calls = {}
+        self._lock = threading.Lock()
+        # Runs the fetch when the leader's own wait is bounded; without one the leader runs it inline
+        self.executor = executor
+    
+    def do(self, key: str, fn, timeout: float = None) -> tuple:
+        """
+        Run fn once for all concurrent callers with the same key
+        
+        The first caller starts fn; callers arriving while it is in flight
+        wait for it and get the same result, or the same exception raised.
+        With a timeout and an executor, fn runs on the executor so the first
+        caller's wait is bounded too, and a caller that gives up never stops
+        the fetch for the others.
+        
+        Args:
+            key (str): Normalized request key
+            fn (callable): Function performing the fetch
+            timeout (float): Longest this caller waits for the result, in seconds
+        
+        Returns:
+            tuple: (result, shared); shared is True for waiters
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+        
+        if leader:
+            if timeout is None or self.executor is None:
+                self._run(key, call, fn)
+            else:
+                self.executor.submit(self._run, key, call, fn)
+        
+        if not call.done.wait(timeout):
+            raise TimeoutError("Timed out waiting for an in-flight request")
+        if call.error is not None:
+            raise call.error
+        return call.result, not leader
+    
+    def _run(self, key: str, call: _Call, fn):
+        """Run the fetch and publish its outcome to every caller"""
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            # Later callers start a new flight (or hit the response cache)
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """Asyncio single-flight group with in-flight calls kept per event loop"""
+    
+    def __init__(self):
+        self._calls = weakref.WeakKeyDictionary()
+    
+    async def do(self, key: str, coro_fn, timeout: float = None) -> tuple:
+        """
+        Await coro_fn once for all concurrent callers with the same key
+        
+        The fetch runs as its own task, so a cancelled or timed out caller
+        never cancels it for the others, including the caller that started it.
+        
+        Args:
+            key (str): Normalized request key
+            coro_fn (callable): Coroutine function performing the fetch
+            timeout (float): Longest a caller waits for the result, in seconds
+        
+        Returns:
+            tuple: (result, shared); shared is True for waiters
+        """
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        task = calls.get(key)
+        shared = task is not None
+        if not shared:
+            task = asyncio.ensure_future(coro_fn())
+            calls[key] = task
+            task.add_done_callback(lambda finished: self._finish(calls, key, finished))
+        return await asyncio.wait_for(asyncio.shield(task), timeout), shared
+    
+    async def cancel_pending(self):
+        """Cancel the running loop's in-flight calls and wait until they have stopped"""
+        calls = self._calls.get(asyncio.get_running_loop())
+        tasks = list(calls.values()) if calls else []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    
+    @staticmethod
+    def _finish(calls: dict, key: str, task: asyncio.Task):
+        """Forget a finished call and mark its error as seen, since every caller may have timed out"""
+        calls.pop(key, None)
+        if not task.cancelled():
+            task.exception()
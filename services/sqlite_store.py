@@ -0,0 +1,52 @@
+"""
+SQLite Store
+Base class for small persistent stores shared by threads and processes
+"""
+
+import os
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+    """Base class for SQLite-backed stores with per-thread connections"""
+    
+    # Subclasses provide their CREATE statements
+    SCHEMA = ""
+    
+    def __init__(self, path: str, mmap_size: int = 0):
+        self.path = path
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        
+        # Create the schema once up front so readers never race table creation
+        self.connection.executescript(self.SCHEMA)
+    
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Get the connection for the current thread
+        
+        Returns:
+            sqlite3.Connection: Connection in autocommit mode
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            # WAL lets many readers work alongside a single writer across processes
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            if self.mmap_size:
+                connection.execute(f"PRAGMA mmap_size={int(self.mmap_size)}")
+            self._local.connection = connection
+        return connection
+    
+    def close(self):
+        """Close the connection for the current thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
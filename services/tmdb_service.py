@@ -3,109 +3,317 @@ TMDb API Service
 Handles movie searches and details from TMDb API
 """
 
-from .base_service import BaseAPIService
+import asyncio
+import logging
+from .base_service import BaseAPIService, AsyncBaseAPIService
+from .youtube_service import build_watch_url
+from .movie_index import CARD_FIELDS, create_movie_index
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+class DiscoverPage:
+    """Single page of TMDb discover results with its pagination totals"""
+    
+    def __init__(self, results: list = None, page: int = 1, total_pages: int = 1, total_results: int = 0):
+        self.results = results or []
+        self.page = page
+        self.total_pages = total_pages
+        self.total_results = total_results
+
+
 class TMDbService(BaseAPIService):
     """Service for TMDb API operations"""
     
+    service_name = "tmdb"
+    
     def __init__(self):
         super().__init__()
         self.api_key = Config.TMDB_API_KEY
-        self.base_url = "https://api.themoviedb.org/3"
+        self.base_url = Config.TMDB_BASE_URL
         self.image_base_url = "https://image.tmdb.org/t/p/w500"
+        self.movie_index = create_movie_index()
+    
+    def discover_movies(self, genre_id: int, page: int = 1, deadline=None) -> DiscoverPage:
+        """
+        Discover movies by genre ID with a single TMDb request
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            DiscoverPage: Results together with total pages and results
+        """
+        url = self._discover_url(genre_id, page)
+        if not url:
+            return DiscoverPage(page=page)
+        
+        data = self.safe_request(url, "tmdb_discover", deadline)
+        return self._build_discover_page(data, page)
     
-    def search_movies_by_genre(self, genre_id: int, page: int = 1) -> list:
+    def search_movies_by_genre(self, genre_id: int, page: int = 1, deadline=None) -> list:
         """
         Search movies by genre ID using TMDb API
         
         Args:
             genre_id (int): TMDb genre ID
             page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
             
         Returns:
             list: List of movie search results
         """
-        if not self.validate_api_key(self.api_key, "TMDb"):
-            return []
-        
-        # Check if API key is placeholder value
-        if not self.api_key or self.api_key == "your_tmdb_api_key":
-            print("Warning: TMDb API key is not configured. Please set TMDB_API_KEY in your .env file.")
-            return []
-        
-        url = f"{self.base_url}/discover/movie?api_key={self.api_key}&with_genres={genre_id}&sort_by=popularity.desc&page={page}"
-        data = self.safe_request(url)
-        return data.get("results", [])
+        return self.discover_movies(genre_id, page, deadline).results
     
-    def get_movie_details(self, tmdb_id: int) -> dict:
+    def get_movie_details(self, tmdb_id: int, deadline=None) -> dict:
         """
-        Get detailed movie information by TMDb ID
+        Get detailed movie information, videos and external IDs by TMDb ID
         
         Args:
             tmdb_id (int): TMDb ID of the movie
+            deadline (Deadline): Request budget, if any
             
         Returns:
             dict: Movie details
         """
-        if not self.validate_api_key(self.api_key, "TMDb"):
+        url = self._details_url(tmdb_id)
+        if not url:
             return {}
         
-        # Check if API key is placeholder value
-        if not self.api_key or self.api_key == "your_tmdb_api_key":
-            print("Warning: TMDb API key is not configured. Please set TMDB_API_KEY in your .env file.")
-            return {}
-        
-        url = f"{self.base_url}/movie/{tmdb_id}?api_key={self.api_key}"
-        return self.safe_request(url)
+        return self.safe_request(url, "tmdb_details", deadline)
     
-    def get_total_pages(self, genre_id: int, page: int = 1) -> int:
+    def get_total_pages(self, genre_id: int, page: int = 1, deadline=None) -> int:
         """
         Get total pages available for a genre search
         
         Args:
             genre_id (int): TMDb genre ID
             page (int): Page number to check
+            deadline (Deadline): Request budget, if any
             
         Returns:
             int: Total pages available
         """
-        if not self.validate_api_key(self.api_key, "TMDb"):
-            return 1
-        
-        # Check if API key is placeholder value
-        if not self.api_key or self.api_key == "your_tmdb_api_key":
-            print("Warning: TMDb API key is not configured. Please set TMDB_API_KEY in your .env file.")
-            return 1
-        
-        url = f"{self.base_url}/discover/movie?api_key={self.api_key}&with_genres={genre_id}&sort_by=popularity.desc&page={page}"
-        data = self.safe_request(url)
-        total_pages = data.get("total_pages", 1)
+        total_pages = self.discover_movies(genre_id, page, deadline).total_pages
         return min(total_pages, Config.MAX_PAGES)  # Limit to max pages
     
-    def format_movie_data(self, tmdb_movie: dict) -> dict:
+    def format_movie_data(self, tmdb_movie: dict, deadline=None) -> dict:
         """
         Format TMDb movie data for template compatibility
         
         Args:
             tmdb_movie (dict): Raw TMDb movie data
+            deadline (Deadline): Request budget, if any
             
         Returns:
-            dict: Formatted movie data
+            dict: Formatted movie data; a card built from the discover data alone lists "details" as missing
+        """
+        # Fall back to the discover data when details are unavailable
+        return self.get_movie(tmdb_movie["id"], deadline) or self.format_fallback_result(tmdb_movie)
+    
+    def get_movie(self, tmdb_id: int, deadline=None) -> dict:
+        """
+        Get a formatted movie by TMDb ID
+        
+        Movies already in the movie index are answered without a network call.
+        
+        Args:
+            tmdb_id (int): TMDb ID of the movie
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Formatted movie data or empty dict if details are unavailable
+        """
+        movie = self._lookup_index(tmdb_id)
+        if movie is not None:
+            return movie
+        
+        movie = self.format_details(self.get_movie_details(tmdb_id, deadline))
+        self._store_index(movie)
+        return movie
+    
+    def format_discover_result(self, tmdb_movie: dict) -> dict:
+        """
+        Format a discover result as a preliminary movie card
+        
+        Discover results carry the title, year, plot and poster, so a card can
+        be shown before the details request completes.
+        
+        Args:
+            tmdb_movie (dict): Raw TMDb discover result
+        
+        Returns:
+            dict: Formatted movie data without imdbID or trailer
+        """
+        return self.format_details(tmdb_movie)
+    
+    def format_fallback_result(self, tmdb_movie: dict) -> dict:
+        """
+        Format a discover result as the final card when its details are unavailable
+        
+        Args:
+            tmdb_movie (dict): Raw TMDb discover result
+        
+        Returns:
+            dict: Formatted movie data flagged as missing its details
+        """
+        movie = self.format_discover_result(tmdb_movie)
+        if movie:
+            movie["missing"] = ["details"]
+        return movie
+    
+    def format_details(self, details: dict) -> dict:
+        """
+        Format a TMDb details response for template compatibility
+        
+        Args:
+            details (dict): TMDb movie details with appended videos and external IDs
+        
+        Returns:
+            dict: Formatted movie data or empty dict if details are missing
         """
-        details = self.get_movie_details(tmdb_movie["id"])
         if not details:
             return {}
         
-        return {
+        external_ids = details.get("external_ids") or {}
+        movie = {
             "Title": details.get("title", ""),
             "Year": details.get("release_date", "")[:4] if details.get("release_date") else "",
             "Plot": details.get("overview", ""),
             "Poster": f"{self.image_base_url}{details.get('poster_path', '')}" if details.get("poster_path") else "N/A",
-            "imdbID": details.get("imdb_id", ""),
+            "imdbID": details.get("imdb_id") or external_ids.get("imdb_id") or "",
             "tmdb_id": details.get("id", "")
         }
+        
+        trailer_key = self.get_trailer_key(details)
+        if trailer_key:
+            movie["trailer_key"] = trailer_key
+            movie["trailer"] = build_watch_url(trailer_key)
+        return movie
+    
+    def get_trailer_key(self, details: dict) -> str:
+        """
+        Pick the best YouTube trailer from appended TMDb videos
+        
+        Args:
+            details (dict): TMDb movie details with appended videos
+        
+        Returns:
+            str: YouTube video key or None if TMDb has no trailer
+        """
+        videos = (details.get("videos") or {}).get("results", [])
+        trailers = [video for video in videos
+                    if video.get("site") == "YouTube" and video.get("type") == "Trailer" and video.get("key")]
+        if not trailers:
+            return None
+        
+        # Prefer official trailers; keep TMDb's ordering otherwise
+        official = [video for video in trailers if video.get("official")]
+        return (official or trailers)[0]["key"]
+    
+    def _lookup_index(self, tmdb_id: int) -> dict:
+        """
+        Look up a formatted movie in the movie index
+        
+        Args:
+            tmdb_id (int): TMDb ID of the movie
+        
+        Returns:
+            dict: Formatted movie data or None unless its card fields and trailer are fresh
+        """
+        if not self.movie_index:
+            return None
+        
+        record = self.movie_index.lookup(tmdb_id=tmdb_id, required=CARD_FIELDS + ("trailer_key",))
+        if record is None:
+            return None
+        
+        movie = {field: record.get(field, "") for field in CARD_FIELDS + ("imdbID", "tmdb_id")}
+        if record["trailer_key"]:
+            movie["trailer_key"] = record["trailer_key"]
+            movie["trailer"] = build_watch_url(record["trailer_key"])
+        return movie
+    
+    def _store_index(self, movie: dict):
+        """
+        Store a formatted movie in the movie index
+        
+        Args:
+            movie (dict): Formatted movie data from format_details
+        """
+        if not self.movie_index or not movie:
+            return
+        
+        # An empty trailer key records that TMDb lists no trailer
+        self.movie_index.store(dict(movie, trailer_key=movie.get("trailer_key", "")))
+    
+    def _is_configured(self) -> bool:
+        """
+        Check that a real TMDb API key is set
+        
+        Returns:
+            bool: True if requests can be made
+        """
+        if not self.validate_api_key(self.api_key, "TMDb"):
+            return False
+        
+        # Check if API key is placeholder value
+        if not self.api_key or self.api_key == "your_tmdb_api_key":
+            logger.warning("TMDb API key is not configured. Please set TMDB_API_KEY in your .env file.")
+            return False
+        return True
+    
+    def _discover_url(self, genre_id: int, page: int) -> str:
+        """
+        Build a TMDb discover URL
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            page (int): Upstream page number
+        
+        Returns:
+            str: Request URL or None if TMDb is not configured
+        """
+        if not self._is_configured():
+            return None
+        return f"{self.base_url}/discover/movie?api_key={self.api_key}&with_genres={genre_id}&sort_by=popularity.desc&page={page}"
+    
+    def _details_url(self, tmdb_id: int) -> str:
+        """
+        Build a TMDb details URL
+        
+        Args:
+            tmdb_id (int): TMDb ID of the movie
+        
+        Returns:
+            str: Request URL or None if TMDb is not configured
+        """
+        if not self._is_configured():
+            return None
+        # Videos and external IDs ride along so trailers need no extra lookup
+        return f"{self.base_url}/movie/{tmdb_id}?api_key={self.api_key}&append_to_response=videos,external_ids"
+    
+    def _build_discover_page(self, data: dict, page: int) -> DiscoverPage:
+        """
+        Wrap a discover response in a DiscoverPage
+        
+        Args:
+            data (dict): Discover response
+            page (int): Requested page number
+        
+        Returns:
+            DiscoverPage: Parsed page
+        """
+        return DiscoverPage(
+            results=data.get("results", []),
+            page=data.get("page", page),
+            total_pages=data.get("total_pages", 1),
+            total_results=data.get("total_results", 0),
+        )
     
     def is_available(self) -> bool:
         """
@@ -115,3 +323,115 @@ class TMDbService(BaseAPIService):
             bool: True if service is available
         """
         return bool(self.api_key)
+
+
+class AsyncTMDbService(TMDbService, AsyncBaseAPIService):
+    """Non-blocking TMDb service for asyncio callers"""
+    
+    async def discover_movies(self, genre_id: int, page: int = 1, deadline=None) -> DiscoverPage:
+        """
+        Discover movies by genre ID with a single TMDb request
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            DiscoverPage: Results together with total pages and results
+        """
+        url = self._discover_url(genre_id, page)
+        if not url:
+            return DiscoverPage(page=page)
+        
+        data = await self.safe_request(url, "tmdb_discover", deadline)
+        return self._build_discover_page(data, page)
+    
+    async def search_movies_by_genre(self, genre_id: int, page: int = 1, deadline=None) -> list:
+        """
+        Search movies by genre ID using TMDb API
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            page (int): Page number for pagination
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            list: List of movie search results
+        """
+        return (await self.discover_movies(genre_id, page, deadline)).results
+    
+    async def get_movie_details(self, tmdb_id: int, deadline=None) -> dict:
+        """
+        Get detailed movie information, videos and external IDs by TMDb ID
+        
+        Args:
+            tmdb_id (int): TMDb ID of the movie
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Movie details
+        """
+        url = self._details_url(tmdb_id)
+        if not url:
+            return {}
+        
+        return await self.safe_request(url, "tmdb_details", deadline)
+    
+    async def get_total_pages(self, genre_id: int, page: int = 1, deadline=None) -> int:
+        """
+        Get total pages available for a genre search
+        
+        Args:
+            genre_id (int): TMDb genre ID
+            page (int): Page number to check
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            int: Total pages available
+        """
+        total_pages = (await self.discover_movies(genre_id, page, deadline)).total_pages
+        return min(total_pages, Config.MAX_PAGES)
+    
+    async def format_movie_data(self, tmdb_movie: dict, deadline=None) -> dict:
+        """
+        Format TMDb movie data for template compatibility
+        
+        Args:
+            tmdb_movie (dict): Raw TMDb movie data
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Formatted movie data; a card built from the discover data alone lists "details" as missing
+        """
+        return await self.get_movie(tmdb_movie["id"], deadline) or self.format_fallback_result(tmdb_movie)
+    
+    async def get_movie(self, tmdb_id: int, deadline=None) -> dict:
+        """
+        Get a formatted movie by TMDb ID
+        
+        Args:
+            tmdb_id (int): TMDb ID of the movie
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            dict: Formatted movie data or empty dict if details are unavailable
+        """
+        movie = await self._lookup_index(tmdb_id)
+        if movie is not None:
+            return movie
+        
+        movie = self.format_details(await self.get_movie_details(tmdb_id, deadline))
+        await self._store_index(movie)
+        return movie
+    
+    async def _lookup_index(self, tmdb_id: int) -> dict:
+        """Look up a formatted movie in the movie index on a worker thread"""
+        if not self.movie_index:
+            return None
+        return await asyncio.to_thread(super()._lookup_index, tmdb_id)
+    
+    async def _store_index(self, movie: dict):
+        """Store a formatted movie in the movie index on a worker thread"""
+        if self.movie_index and movie:
+            await asyncio.to_thread(super()._store_index, movie)
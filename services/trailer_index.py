@@ -0,0 +1,150 @@
+"""
+Trailer Index
+Persistent title -> YouTube trailer index with negative caching
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import time
+import unicodedata
+from .sqlite_store import SQLiteStore
+
+
+logger = logging.getLogger(__name__)
+
+
+class TrailerIndex(SQLiteStore):
+    """On-disk trailer index keyed by normalized title and year"""
+    
+    # WITHOUT ROWID keeps each entry to its key, an 11-char video ID and an expiry
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS trailers (
+            key TEXT PRIMARY KEY,
+            video_id TEXT,
+            expires_at INTEGER
+        ) WITHOUT ROWID;
+    """
+    
+    def __init__(self, path: str, negative_ttl: int):
+        super().__init__(path)
+        self.negative_ttl = negative_ttl
+    
+    @staticmethod
+    def make_key(title: str, year: str = None) -> str:
+        """
+        Build the index key for a movie
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+        
+        Returns:
+            str: Normalized "title|year" key
+        """
+        text = unicodedata.normalize("NFKD", title or "")
+        text = text.encode("ascii", "ignore").decode("ascii").lower()
+        text = re.sub(r"[^a-z0-9]+", " ", text).strip()
+        year = (year or "")[:4]
+        return f"{text}|{year}"
+    
+    def lookup(self, title: str, year: str = None) -> tuple:
+        """
+        Look up a trailer
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+        
+        Returns:
+            tuple: (found, video_id); video_id is None for a cached "no trailer"
+        """
+        try:
+            row = self.connection.execute(
+                "SELECT video_id, expires_at FROM trailers WHERE key = ?",
+                (self.make_key(title, year),),
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Trailer index read failed", extra={"error": str(e)})
+            return False, None
+        if row is None:
+            return False, None
+        
+        video_id, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return False, None
+        return True, video_id
+    
+    def store(self, title: str, year: str, video_id: str):
+        """
+        Store a trailer lookup result
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+            video_id (str): YouTube video ID or None when no trailer exists
+        """
+        # Found trailers never expire; misses are retried after negative_ttl
+        expires_at = None if video_id else int(time.time() + self.negative_ttl)
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO trailers (key, video_id, expires_at) VALUES (?, ?, ?)",
+                (self.make_key(title, year), video_id, expires_at),
+            )
+        except sqlite3.Error as e:
+            logger.warning("Trailer index write failed", extra={"error": str(e)})
+    
+    def export_entries(self, path: str) -> int:
+        """
+        Export the index as JSON lines
+        
+        Args:
+            path (str): Output file path
+        
+        Returns:
+            int: Number of exported entries
+        """
+        count = 0
+        with open(path, "w", encoding="utf-8") as output:
+            for key, video_id, expires_at in self.connection.execute(
+                    "SELECT key, video_id, expires_at FROM trailers ORDER BY key"):
+                output.write(json.dumps({"key": key, "video_id": video_id, "expires_at": expires_at}) + "\n")
+                count += 1
+        return count
+    
+    def import_entries(self, path: str) -> int:
+        """
+        Import JSON lines produced by export_entries or hand-written seeds
+        
+        Seed lines may use {"title", "year", "video_id"} instead of "key".
+        
+        Args:
+            path (str): Input file path
+        
+        Returns:
+            int: Number of imported entries
+        """
+        rows = []
+        with open(path, encoding="utf-8") as source:
+            for line in source:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                key = entry.get("key") or self.make_key(entry.get("title", ""), entry.get("year"))
+                video_id = entry.get("video_id")
+                expires_at = entry.get("expires_at")
+                if not video_id and expires_at is None:
+                    expires_at = int(time.time() + self.negative_ttl)
+                rows.append((key, video_id, expires_at))
+        
+        connection = self.connection
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(
+                "INSERT OR REPLACE INTO trailers (key, video_id, expires_at) VALUES (?, ?, ?)", rows)
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        return len(rows)
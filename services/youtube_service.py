@@ -3,35 +3,116 @@ YouTube API Service
 Handles trailer searches using YouTube API
 """
 
+import asyncio
+import logging
 from urllib.parse import urlencode
-from .base_service import BaseAPIService
+from .base_service import BaseAPIService, AsyncBaseAPIService
+from .trailer_index import TrailerIndex
 from config import Config
 
 
+logger = logging.getLogger(__name__)
+
+
+def build_watch_url(video_id: str) -> str:
+    """
+    Build a YouTube watch URL for a video ID
+    
+    Args:
+        video_id (str): YouTube video ID
+    
+    Returns:
+        str: YouTube watch URL
+    """
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
 class YouTubeService(BaseAPIService):
     """Service for YouTube API operations"""
     
+    service_name = "youtube"
+    
     def __init__(self):
         super().__init__()
         self.api_key = Config.YOUTUBE_API_KEY
-        self.base_url = "https://www.googleapis.com/youtube/v3/search"
+        self.base_url = Config.YOUTUBE_BASE_URL
+        self.trailer_index = None
+        if Config.TRAILER_INDEX_ENABLED:
+            self.trailer_index = TrailerIndex(Config.TRAILER_INDEX_PATH, Config.TRAILER_INDEX_NEGATIVE_TTL)
     
-    def get_trailer_url(self, title: str) -> str:
+    def get_trailer_url(self, title: str, year: str = None, deadline=None) -> str:
         """
         Get YouTube trailer URL for a movie title
         
         Args:
             title (str): Movie title
+            year (str): Release year, if known
+            deadline (Deadline): Request budget, if any
             
         Returns:
             str: YouTube trailer URL or None if not found
         """
+        return self.lookup_trailer(title, year, deadline)[0]
+    
+    def lookup_trailer(self, title: str, year: str = None, deadline=None) -> tuple:
+        """
+        Look up a movie's trailer, telling a failed search from a movie without one
+        
+        Known titles are answered from the trailer index without a network call.
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            tuple: (trailer_url, failed); failed is True when the search request itself failed
+        """
+        found, trailer_url = self._lookup_index(title, year)
+        if found:
+            return trailer_url, False
+        
+        url = self._search_url(title)
+        if not url:
+            return None, False
+        
+        data = self.safe_request(url, "youtube_search", deadline)
+        self._store_index(title, year, data)
+        return self._parse_search(data), self._search_failed(data)
+    
+    def _lookup_index(self, title: str, year: str = None) -> tuple:
+        """
+        Look up a trailer in the trailer index
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+        
+        Returns:
+            tuple: (found, trailer_url); trailer_url is None for a known miss
+        """
+        if not title or not self.trailer_index:
+            return False, None
+        
+        found, video_id = self.trailer_index.lookup(title, year)
+        return found, build_watch_url(video_id) if video_id else None
+    
+    def _search_url(self, title: str) -> str:
+        """
+        Build a YouTube trailer search URL
+        
+        Args:
+            title (str): Movie title
+        
+        Returns:
+            str: Request URL or None if the search cannot be made
+        """
         if not title or not self.validate_api_key(self.api_key, "YouTube"):
             return None
         
         # Check if API key is placeholder value
         if not self.api_key or self.api_key == "your_youtube_api_key":
-            print("Warning: YouTube API key is not configured. Please set YOUTUBE_API_KEY in your .env file.")
+            logger.warning("YouTube API key is not configured. Please set YOUTUBE_API_KEY in your .env file.")
             return None
         
         query = f"{title} trailer"
@@ -43,14 +124,43 @@ class YouTubeService(BaseAPIService):
             "maxResults": 1,
         }
         
-        url = f"{self.base_url}?{urlencode(params)}"
-        data = self.safe_request(url)
+        return f"{self.base_url}?{urlencode(params)}"
+    
+    def _parse_search(self, data: dict) -> str:
+        """
+        Extract the trailer URL from a search response
         
-        if data.get("items"):
-            video_id = data["items"][0]["id"]["videoId"]
-            return f"https://www.youtube.com/watch?v={video_id}"
+        Args:
+            data (dict): YouTube search response
         
-        return None
+        Returns:
+            str: YouTube trailer URL or None if not found
+        """
+        video_id = self._video_id(data)
+        return build_watch_url(video_id) if video_id else None
+    
+    def _store_index(self, title: str, year: str, data: dict):
+        """
+        Record a search response in the trailer index
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+            data (dict): YouTube search response
+        """
+        # Only index real answers; an empty dict means the request itself failed
+        if self.trailer_index and not self._search_failed(data):
+            self.trailer_index.store(title, year, self._video_id(data))
+    
+    @staticmethod
+    def _search_failed(data: dict) -> bool:
+        """Check if a search response is safe_request's empty dict for a failed request"""
+        return "items" not in data
+    
+    @staticmethod
+    def _video_id(data: dict) -> str:
+        items = data.get("items")
+        return items[0]["id"]["videoId"] if items else None
     
     def is_available(self) -> bool:
         """
@@ -60,3 +170,56 @@ class YouTubeService(BaseAPIService):
             bool: True if service is available
         """
         return bool(self.api_key)
+
+
+class AsyncYouTubeService(YouTubeService, AsyncBaseAPIService):
+    """Non-blocking YouTube service for asyncio callers"""
+    
+    async def get_trailer_url(self, title: str, year: str = None, deadline=None) -> str:
+        """
+        Get YouTube trailer URL for a movie title
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            str: YouTube trailer URL or None if not found
+        """
+        return (await self.lookup_trailer(title, year, deadline))[0]
+    
+    async def lookup_trailer(self, title: str, year: str = None, deadline=None) -> tuple:
+        """
+        Look up a movie's trailer, telling a failed search from a movie without one
+        
+        Args:
+            title (str): Movie title
+            year (str): Release year, if known
+            deadline (Deadline): Request budget, if any
+        
+        Returns:
+            tuple: (trailer_url, failed); failed is True when the search request itself failed
+        """
+        found, trailer_url = await self._lookup_index(title, year)
+        if found:
+            return trailer_url, False
+        
+        url = self._search_url(title)
+        if not url:
+            return None, False
+        
+        data = await self.safe_request(url, "youtube_search", deadline)
+        await self._store_index(title, year, data)
+        return self._parse_search(data), self._search_failed(data)
+    
+    async def _lookup_index(self, title: str, year: str = None) -> tuple:
+        """Look up a trailer in the trailer index on a worker thread"""
+        if not title or not self.trailer_index:
+            return False, None
+        return await asyncio.to_thread(super()._lookup_index, title, year)
+    
+    async def _store_index(self, title: str, year: str, data: dict):
+        """Record a search response in the trailer index on a worker thread"""
+        if self.trailer_index and not self._search_failed(data):
+            await asyncio.to_thread(super()._store_index, title, year, data)
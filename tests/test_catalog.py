@@ -0,0 +1,84 @@
+"""
+Catalog Snapshot tests
+"""
+
+import os
+import pytest
+from services.catalog import CatalogSnapshot, write_catalog
+from services.youtube_service import build_watch_url
+
+
+def movie(number: int, **fields) -> dict:
+    return {"Title": f"Movie {number}", "Year": "1995", "imdbID": f"tt{number:07d}", **fields}
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "catalog.bin")
+
+
+def open_snapshot(path: str) -> CatalogSnapshot:
+    snapshot = CatalogSnapshot(path)
+    # Check the file on every read so a rewrite is seen at once
+    snapshot.RELOAD_INTERVAL = 0
+    return snapshot
+
+
+def test_round_trip(path):
+    action = [movie(number) for number in range(5)]
+    drama = [movie(number) for number in range(3, 8)]
+    write_catalog(path, {28: (5, action), 18: (5, drama)})
+    snapshot = open_snapshot(path)
+    
+    assert snapshot.get_page(28, 1, 3) == (action[:3], 5)
+    assert snapshot.get_page(28, 2, 3) == (action[3:], 5)
+    assert snapshot.get_page(18, 1, 5) == (drama, 5)
+    assert snapshot.info()["genres"] == {18: 5, 28: 5}
+
+
+def test_movies_in_several_genres_are_stored_once(path):
+    movies = [movie(number) for number in range(20)]
+    write_catalog(path, {28: (20, movies)})
+    single_size = os.path.getsize(path)
+    
+    write_catalog(path, {28: (20, movies), 18: (20, movies)})
+    # The second genre adds its table rows but no records
+    assert os.path.getsize(path) < single_size * 1.5
+    assert open_snapshot(path).get_page(18, 1, 20) == (movies, 20)
+
+
+def test_trailer_url_is_rebuilt_from_the_key(path):
+    write_catalog(path, {28: (1, [movie(1, trailer_key="abc123")])})
+    
+    movies, _ = open_snapshot(path).get_page(28, 1, 10)
+    assert movies[0]["trailer"] == build_watch_url("abc123")
+
+
+def test_pages_the_snapshot_cannot_fill_are_misses(path):
+    write_catalog(path, {28: (100, [movie(number) for number in range(5)])})
+    snapshot = open_snapshot(path)
+    
+    # Cut short by the snapshot, not by the genre, so the live API must serve it
+    assert snapshot.get_page(28, 2, 3) is None
+    assert snapshot.get_page(28, 3, 3) is None
+    assert snapshot.get_page(28, 0, 3) is None
+    assert snapshot.get_page(12, 1, 3) is None
+
+
+def test_rewritten_file_is_reloaded(path):
+    write_catalog(path, {28: (1, [movie(1)])})
+    snapshot = open_snapshot(path)
+    assert snapshot.get_page(28, 1, 10) == ([movie(1)], 1)
+    
+    write_catalog(path, {28: (1, [movie(2)])})
+    assert snapshot.get_page(28, 1, 10) == ([movie(2)], 1)
+
+
+def test_missing_or_foreign_file_is_a_miss(path):
+    snapshot = open_snapshot(path)
+    assert snapshot.get_page(28, 1, 10) is None
+    
+    with open(path, "wb") as file:
+        file.write(b"not a catalog snapshot at all")
+    assert snapshot.get_page(28, 1, 10) is None
+    assert snapshot.info() is None
@@ -0,0 +1,142 @@
+"""
+Circuit Breaker tests
+"""
+
+import time
+import pytest
+from config import Config
+from services.circuit_breaker import CircuitBreaker
+
+
+RECOVERY = 0.05
+
+
+def make_breaker(probes: int = 1) -> CircuitBreaker:
+    return CircuitBreaker("test", failure_threshold=3, recovery_timeout=RECOVERY, half_open_probes=probes)
+
+
+def open_breaker(breaker: CircuitBreaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+
+def test_opens_at_the_threshold():
+    breaker = make_breaker()
+    for _ in range(breaker.failure_threshold - 1):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+    
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_the_failure_count():
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success(0.1)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_after_recovery_timeout():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    time.sleep(RECOVERY * 2)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_half_open_admits_only_the_probe_limit():
+    breaker = make_breaker(probes=2)
+    open_breaker(breaker)
+    time.sleep(RECOVERY * 2)
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_successful_probe_closes_the_circuit():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    time.sleep(RECOVERY * 2)
+    assert breaker.allow_request()
+    breaker.record_success(0.1)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_the_circuit():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    time.sleep(RECOVERY * 2)
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_release_frees_a_probe_slot():
+    breaker = make_breaker()
+    open_breaker(breaker)
+    time.sleep(RECOVERY * 2)
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    
+    breaker.release()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+
+
+def test_release_is_a_no_op_when_closed():
+    breaker = make_breaker()
+    breaker.release()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+@pytest.fixture
+def adaptive(monkeypatch):
+    monkeypatch.setattr(Config, "ADAPTIVE_TIMEOUTS", True)
+    monkeypatch.setattr(Config, "LATENCY_MIN_SAMPLES", 5)
+    monkeypatch.setattr(Config, "TIMEOUT_PERCENTILE", 99)
+    monkeypatch.setattr(Config, "TIMEOUT_MULTIPLIER", 2)
+    monkeypatch.setattr(Config, "TIMEOUT_MIN", 0.5)
+    monkeypatch.setattr(Config, "REQUEST_TIMEOUT", 5)
+
+
+def record_latencies(breaker: CircuitBreaker, latency: float, count: int = 5):
+    for _ in range(count):
+        breaker.record_success(latency)
+
+
+def test_timeout_defaults_until_enough_samples(adaptive):
+    breaker = make_breaker()
+    record_latencies(breaker, 0.1, count=4)
+    assert breaker.timeout() == Config.REQUEST_TIMEOUT
+
+
+def test_timeout_follows_observed_latency(adaptive):
+    breaker = make_breaker()
+    record_latencies(breaker, 1.0)
+    assert breaker.timeout() == pytest.approx(2.0)
+
+
+def test_timeout_has_a_floor(adaptive):
+    breaker = make_breaker()
+    record_latencies(breaker, 0.01)
+    assert breaker.timeout() == Config.TIMEOUT_MIN
+
+
+def test_timeout_is_capped_at_the_request_timeout(adaptive):
+    breaker = make_breaker()
+    record_latencies(breaker, 4.0)
+    assert breaker.timeout() == Config.REQUEST_TIMEOUT
+
+
+def test_timeout_ignores_latency_when_adaptive_timeouts_are_off(adaptive, monkeypatch):
+    monkeypatch.setattr(Config, "ADAPTIVE_TIMEOUTS", False)
+    breaker = make_breaker()
+    record_latencies(breaker, 0.01)
+    assert breaker.timeout() == Config.REQUEST_TIMEOUT
@@ -0,0 +1,57 @@
+"""
+Movie Index tests
+"""
+
+import time
+import pytest
+from services.movie_index import MovieIndex
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = MovieIndex(str(tmp_path / "movies.db"), ttl=3600)
+    yield index
+    index.close()
+
+
+def rows(index: MovieIndex) -> list:
+    return index.connection.execute("SELECT imdb_id, tmdb_id FROM movies").fetchall()
+
+
+def test_records_with_both_ids_fold_two_rows_into_one(index):
+    index.store({"imdbID": "tt0113277", "Title": "Heat", "Plot": "A heist.", "Poster": "N/A"})
+    index.store({"tmdb_id": 949, "Title": "Heat", "Year": "1995", "Poster": "https://image.example/heat.jpg"})
+    assert len(rows(index)) == 2
+    
+    index.store({"imdbID": "tt0113277", "tmdb_id": 949, "Title": "Heat"})
+    
+    assert rows(index) == [("tt0113277", 949)]
+    movie = index.lookup(imdb_id="tt0113277")
+    assert movie == index.lookup(tmdb_id=949)
+    assert movie == {"Title": "Heat", "Year": "1995", "Plot": "A heist.",
+                     "Poster": "https://image.example/heat.jpg", "imdbID": "tt0113277", "tmdb_id": 949}
+
+
+def test_fold_keeps_the_newest_value_of_each_field(index):
+    index.store({"tmdb_id": 949, "Plot": "Older plot."})
+    time.sleep(0.01)
+    index.store({"imdbID": "tt0113277", "Plot": "Newer plot."})
+    
+    index.store({"imdbID": "tt0113277", "tmdb_id": 949})
+    
+    assert index.lookup(tmdb_id=949, required=("Plot",))["Plot"] == "Newer plot."
+
+
+def test_empty_value_does_not_replace_a_known_one(index):
+    index.store({"imdbID": "tt0113277", "Poster": "https://image.example/heat.jpg"})
+    index.store({"imdbID": "tt0113277", "Poster": "N/A"})
+    
+    assert index.lookup(imdb_id="tt0113277", required=("Poster",))["Poster"] == "https://image.example/heat.jpg"
+
+
+def test_lookup_misses_when_a_required_field_is_stale(tmp_path):
+    index = MovieIndex(str(tmp_path / "movies.db"), ttl=0)
+    index.store({"imdbID": "tt0113277", "Title": "Heat", "Year": "1995", "Plot": "A heist.", "Poster": "N/A"})
+    
+    assert index.lookup(imdb_id="tt0113277") is None
+    index.close()
@@ -0,0 +1,76 @@
+"""
+Virtual Pagination tests
+"""
+
+import asyncio
+from services.pagination import VirtualPaginator
+from services.tmdb_service import DiscoverPage
+
+
+def make_paginator(max_upstream_pages: int = None) -> VirtualPaginator:
+    return VirtualPaginator(page_size=8, upstream_page_size=20, max_pages=50, max_upstream_pages=max_upstream_pages)
+
+
+def upstream(total: int):
+    """Build a fetch_page over an upstream catalog of total items numbered from 0"""
+    def fetch_page(upstream_page):
+        first = (upstream_page - 1) * 20
+        return DiscoverPage(list(range(first, min(first + 20, total))), upstream_page, -(-total // 20), total)
+    return fetch_page
+
+
+def test_span_inside_one_upstream_page():
+    assert make_paginator().upstream_span(1) == [(1, 0, 8)]
+    assert make_paginator().upstream_span(2) == [(1, 8, 16)]
+
+
+def test_span_across_upstream_pages():
+    assert make_paginator().upstream_span(3) == [(1, 16, 20), (2, 0, 4)]
+
+
+def test_span_treats_pages_below_one_as_the_first():
+    assert make_paginator().upstream_span(0) == make_paginator().upstream_span(1)
+
+
+def test_total_pages_rounds_up():
+    assert make_paginator().total_pages(17) == 3
+
+
+def test_total_pages_is_at_least_one():
+    assert make_paginator().total_pages(0) == 1
+
+
+def test_total_pages_is_capped_at_max_pages():
+    assert make_paginator().total_pages(10000) == 50
+
+
+def test_total_pages_is_capped_by_max_upstream_pages():
+    # Two upstream pages hold 40 results, which is 5 app pages
+    assert make_paginator(max_upstream_pages=2).total_pages(10000) == 5
+
+
+def test_get_page_joins_slices():
+    items, total_results = make_paginator().get_page(3, upstream(100))
+    assert items == list(range(16, 24))
+    assert total_results == 100
+
+
+def test_get_page_stops_at_a_short_upstream_page():
+    items, _ = make_paginator().get_page(3, upstream(18))
+    assert items == [16, 17]
+
+
+def test_get_page_skips_pages_past_max_upstream_pages():
+    items, _ = make_paginator(max_upstream_pages=1).get_page(3, upstream(100))
+    assert items == [16, 17, 18, 19]
+
+
+def test_get_page_async_matches_get_page():
+    fetch_page = upstream(100)
+    
+    async def fetch_page_async(upstream_page):
+        return fetch_page(upstream_page)
+    
+    for page in range(1, 6):
+        assert asyncio.run(make_paginator().get_page_async(page, fetch_page_async)) == \
+            make_paginator().get_page(page, fetch_page)
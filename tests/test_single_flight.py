@@ -0,0 +1,183 @@
+"""
+Single Flight tests
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from config import Config
+from services.base_service import BaseAPIService, AsyncBaseAPIService
+from services.single_flight import SingleFlight, AsyncSingleFlight
+
+
+CALLERS = 5
+
+
+def run_callers(target, count: int = CALLERS) -> list:
+    """Run target on count threads and return what each one returned or raised"""
+    outcomes = [None] * count
+    
+    def call(index):
+        try:
+            outcomes[index] = target()
+        except Exception as e:
+            outcomes[index] = e
+    
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return outcomes
+
+
+def test_one_fetch_for_concurrent_callers():
+    flights = SingleFlight()
+    calls = []
+    release = threading.Event()
+    
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"ok": True}
+    
+    threading.Timer(0.2, release.set).start()
+    outcomes = run_callers(lambda: flights.do("key", fetch))
+    
+    assert len(calls) == 1
+    assert all(result == {"ok": True} for result, _ in outcomes)
+    assert sorted(shared for _, shared in outcomes) == [False] + [True] * (CALLERS - 1)
+
+
+def test_error_reaches_every_waiter():
+    flights = SingleFlight()
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        raise ValueError("upstream failed")
+    
+    outcomes = run_callers(lambda: flights.do("key", fetch))
+    
+    assert len(calls) == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_timed_out_caller_does_not_stop_the_fetch():
+    executor = ThreadPoolExecutor(max_workers=1)
+    flights = SingleFlight(executor)
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        time.sleep(0.3)
+        return "done"
+    
+    with pytest.raises(TimeoutError):
+        flights.do("key", fetch, timeout=0.05)
+    # A caller arriving later joins the fetch the timed out caller started
+    assert flights.do("key", fetch, timeout=2) == ("done", True)
+    assert len(calls) == 1
+    executor.shutdown()
+
+
+def test_async_one_fetch_for_concurrent_callers():
+    flights = AsyncSingleFlight()
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+    
+    async def main():
+        return await asyncio.gather(*(flights.do("key", fetch) for _ in range(CALLERS)))
+    
+    outcomes = asyncio.run(main())
+    
+    assert len(calls) == 1
+    assert all(result == {"ok": True} for result, _ in outcomes)
+    assert sorted(shared for _, shared in outcomes) == [False] + [True] * (CALLERS - 1)
+
+
+def test_async_error_reaches_every_waiter():
+    flights = AsyncSingleFlight()
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        raise ValueError("upstream failed")
+    
+    async def main():
+        return await asyncio.gather(*(flights.do("key", fetch) for _ in range(CALLERS)),
+                                    return_exceptions=True)
+    
+    outcomes = asyncio.run(main())
+    
+    assert len(calls) == 1
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+
+
+def test_async_timed_out_caller_does_not_cancel_the_fetch():
+    flights = AsyncSingleFlight()
+    calls = []
+    
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return "done"
+    
+    async def main():
+        with pytest.raises(asyncio.TimeoutError):
+            await flights.do("key", fetch, timeout=0.05)
+        return await flights.do("key", fetch, timeout=2)
+    
+    assert asyncio.run(main()) == ("done", True)
+    assert len(calls) == 1
+
+
+class FakeService(BaseAPIService):
+    service_name = "fake"
+    
+    def _fetch(self, url, cache_key, ttl, endpoint=None):
+        time.sleep(0.2)
+        return {"results": [{"title": "Heat"}]}
+
+
+class AsyncFakeService(AsyncBaseAPIService):
+    service_name = "fake"
+    
+    async def _fetch(self, url, cache_key, ttl, endpoint=None):
+        await asyncio.sleep(0.1)
+        return {"results": [{"title": "Heat"}]}
+
+
+def assert_isolated(results: list):
+    """Check every caller got an equal result that none of the others can mutate"""
+    assert all(result == {"results": [{"title": "Heat"}]} for result in results)
+    assert len({id(result) for result in results}) == len(results)
+    assert len({id(result["results"][0]) for result in results}) == len(results)
+
+
+def test_shared_result_is_copied_per_caller(monkeypatch):
+    monkeypatch.setattr(Config, "CACHE_ENABLED", False)
+    monkeypatch.setattr(FakeService, "flights", SingleFlight())
+    service = FakeService()
+    
+    assert_isolated(run_callers(lambda: service.safe_request("https://example.com/movie")))
+
+
+def test_async_shared_result_is_copied_per_caller(monkeypatch):
+    monkeypatch.setattr(Config, "CACHE_ENABLED", False)
+    monkeypatch.setattr(AsyncFakeService, "flights", AsyncSingleFlight())
+    service = AsyncFakeService()
+    
+    async def main():
+        return await asyncio.gather(*(service.safe_request("https://example.com/movie")
+                                      for _ in range(CALLERS)))
+    
+    assert_isolated(asyncio.run(main()))